@@ -14,17 +14,13 @@ Usage:
 
 from pathlib import Path
 
-from src.config import load_config
-from src.utils import VRAMManager
-from src.voice import VoiceProfileManager, XTTSVoiceCloner
+from _log import Banner
+
+from src.service import get_service
 
 
 def main():
     """Clone a voice from reference audio."""
-    print("=" * 70)
-    print("Example 01: Voice Cloning with XTTS-v2")
-    print("=" * 70)
-
     # Configuration
     reference_audio = Path("examples/reference_audio.wav")  # Replace with your audio
     voice_name = "Example Voice"
@@ -43,18 +39,12 @@ def main():
 
     # Load configuration
     print("\n[1/4] Loading configuration...")
-    config = load_config()
+    service = get_service(storage_path=storage_path)
     print("Configuration loaded successfully")
 
     # Initialize components
     print("\n[2/4] Initializing voice cloning system...")
-    vram_manager = VRAMManager()
-    profile_manager = VoiceProfileManager(storage_path)
-    cloner = XTTSVoiceCloner(
-        config=config.get("voice", {}).get("xtts", {}),
-        vram_manager=vram_manager,
-        profile_manager=profile_manager,
-    )
+    cloner = service.cloner
     print("Voice cloning system initialized")
 
     # Clone voice
@@ -66,8 +56,8 @@ def main():
 
     try:
         result = cloner.clone_voice(
-            audio_path=reference_audio,
-            voice_name=voice_name,
+            reference_audio=reference_audio,
+            profile_name=voice_name,
             language=language,
         )
 
@@ -99,8 +89,7 @@ def main():
         print("  - Available VRAM (4GB+ required)")
         print("  - Audio file format and quality")
 
-    print("=" * 70)
-
 
 if __name__ == "__main__":
-    main()
+    with Banner("Example 01: Voice Cloning with XTTS-v2"):
+        main()
@@ -9,20 +9,41 @@ Requirements:
 
 Usage:
     python examples/02_text_to_speech.py
+    python examples/02_text_to_speech.py --input-file lines.txt
+
+Input file format (one utterance per line, pipe-separated):
+    intro.wav|Hello and welcome.
+    outro.wav|Thanks for watching!
 """
 
+import argparse
 from pathlib import Path
 
-from src.config import load_config
-from src.utils import VRAMManager
-from src.voice import VoiceProfileManager, CoquiTTSSynthesizer
+from _log import Banner
+
+from src.service import get_service
+
+
+def read_input_file(input_file: Path, output_dir: Path) -> list[tuple[str, Path]]:
+    """Parse 'filename|text' lines into (text, output_path) pairs."""
+    items = []
+    for line in input_file.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        filename, _, text = line.partition("|")
+        items.append((text.strip(), output_dir / filename.strip()))
+    return items
 
 
 def main():
     """Synthesize speech from text."""
-    print("=" * 70)
-    print("Example 02: Text-to-Speech Synthesis")
-    print("=" * 70)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--input-file",
+        type=Path,
+        help="Synthesize every 'filename|text' line in this file in one batch",
+    )
+    args = parser.parse_args()
 
     # Configuration
     text = "Hello! This is an example of text-to-speech synthesis using a cloned voice."
@@ -35,17 +56,13 @@ def main():
 
     # Load configuration
     print("\n[1/5] Loading configuration...")
-    config = load_config()
+    service = get_service(storage_path=storage_path)
     print("Configuration loaded successfully")
 
     # Initialize components
     print("\n[2/5] Initializing text-to-speech system...")
-    vram_manager = VRAMManager()
-    profile_manager = VoiceProfileManager(storage_path)
-    synthesizer = CoquiTTSSynthesizer(
-        config=config.get("voice", {}).get("tts", {}),
-        vram_manager=vram_manager,
-    )
+    profile_manager = service.voice_profile_manager
+    synthesizer = service.synthesizer
     print("Text-to-speech system initialized")
 
     # Load voice profile
@@ -58,10 +75,10 @@ def main():
             voice_profile = profile_manager.load_profile(voice_profile_name)
         except FileNotFoundError:
             # If not found, try finding by name
-            profiles = profile_manager.list_profiles()
-            matching = [p for p in profiles if p.name == voice_profile_name]
+            voice_profile = profile_manager.find_by_name(voice_profile_name)
 
-            if not matching:
+            if voice_profile is None:
+                profiles = profile_manager.list_profiles()
                 print(f"\nError: Voice profile not found: {voice_profile_name}")
                 print("\nAvailable profiles:")
                 if profiles:
@@ -71,11 +88,26 @@ def main():
                     print("  No profiles found. Run 01_voice_cloning.py first.")
                 return
 
-            voice_profile = matching[0]
-
         print(f"  Profile loaded: {voice_profile.name} ({voice_profile.profile_id})")
         print(f"  Language: {voice_profile.language}")
 
+        if args.input_file:
+            items = read_input_file(args.input_file, output_path.parent)
+
+            print(f"\n[4/5] Synthesizing {len(items)} line(s) from {args.input_file}...")
+            print("\nThis may take 20-40 seconds on first run (model download)...")
+
+            results = synthesizer.synthesize_batch(items, voice_profile)
+
+            print("\n[5/5] Speech synthesis complete!")
+            print("=" * 70)
+            for (line_text, _), result in zip(items, results, strict=True):
+                if result.success:
+                    print(f"  OK   {result.audio_path} ({result.duration_seconds:.2f}s)")
+                else:
+                    print(f"  FAIL {line_text[:40]!r}: {result.error}")
+            return
+
         # Synthesize speech
         print("\n[4/5] Synthesizing speech...")
         print(f"  Text: {text}")
@@ -115,8 +147,7 @@ def main():
         print("  - GPU/CUDA availability")
         print("  - Available VRAM (3GB+ required)")
 
-    print("=" * 70)
-
 
 if __name__ == "__main__":
-    main()
+    with Banner("Example 02: Text-to-Speech Synthesis"):
+        main()
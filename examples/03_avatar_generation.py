@@ -13,17 +13,13 @@ Usage:
 
 from pathlib import Path
 
-from src.config import load_config
-from src.utils import VRAMManager
-from src.avatar import AvatarProfileManager, SDXLAvatarGenerator, MediaPipeFaceDetector
+from _log import Banner
+
+from src.service import get_service
 
 
 def main():
     """Generate an avatar image from a text prompt."""
-    print("=" * 70)
-    print("Example 03: Avatar Generation with SDXL")
-    print("=" * 70)
-
     # Configuration
     prompt = "professional person, portrait, neutral expression, looking at camera, high quality"
     negative_prompt = "cartoon, anime, drawing, low quality, blurry, deformed"
@@ -37,18 +33,12 @@ def main():
 
     # Load configuration
     print("\n[1/5] Loading configuration...")
-    config = load_config()
+    service = get_service(storage_path=storage_path)
     print("Configuration loaded successfully")
 
     # Initialize components
     print("\n[2/5] Initializing avatar generation system...")
-    vram_manager = VRAMManager()
-    profile_manager = AvatarProfileManager(storage_path)
-    generator = SDXLAvatarGenerator(
-        config=config.get("avatar", {}).get("sdxl", {}),
-        vram_manager=vram_manager,
-        profile_manager=profile_manager,
-    )
+    generator = service.generator
     print("Avatar generation system initialized")
 
     # Generate avatar
@@ -86,10 +76,10 @@ def main():
                 print(f"  Confidence: {confidence:.2f}")
                 print(f"  Face region: {result.profile.face_region['width']}x{result.profile.face_region['height']}")
 
-                # Check if suitable for lip-sync
-                detector = MediaPipeFaceDetector()
-                detection_result = detector.detect(result.profile.base_image_path)
-                is_valid, message = detector.validate_for_lipsync(detection_result)
+                # Check if suitable for lip-sync (reuses the generator's detection)
+                is_valid, message = service.face_detector.validate_for_lipsync(
+                    result.face_detection
+                )
 
                 print(f"\n  Lip-sync validation:")
                 if is_valid:
@@ -123,8 +113,7 @@ def main():
         print("  - Available VRAM (7GB+ required for SDXL)")
         print("  - Disk space for model downloads (~7GB)")
 
-    print("=" * 70)
-
 
 if __name__ == "__main__":
-    main()
+    with Banner("Example 03: Avatar Generation with SDXL"):
+        main()
@@ -13,19 +13,18 @@ Usage:
     python examples/04_lipsync_video.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.config import load_config
-from src.utils import VRAMManager
-from src.video import MuseTalkLipSync, FFmpegEncoder, LipSyncConfig
+from _log import Banner
+
+from src.service import get_service
+from src.utils import human_size
+from src.video import LipSyncConfig
 
 
 def main():
     """Generate a lip-synced video."""
-    print("=" * 70)
-    print("Example 04: Lip-Sync Video Generation with MuseTalk")
-    print("=" * 70)
-
     # Configuration
     avatar_image = Path("output/generated_avatar.png")  # Replace with your image
     audio_file = Path("output/synthesized_speech.wav")  # Replace with your audio
@@ -48,18 +47,25 @@ def main():
 
     # Load configuration
     print("\n[1/4] Loading configuration...")
-    config = load_config()
+    service = get_service()
     print("Configuration loaded successfully")
 
-    # Initialize components
+    # Initialize components while the avatar face is checked in the background
     print("\n[2/4] Initializing lip-sync system...")
-    vram_manager = VRAMManager()
-    lipsync_engine = MuseTalkLipSync(
-        config=config.get("video", {}).get("musetalk", {}),
-        vram_manager=vram_manager,
-    )
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        face_future = pool.submit(service.face_detector.detect, avatar_image)
+        lipsync_engine = service.lipsync
+        face_info = face_future.result()
     print("Lip-sync system initialized")
 
+    # Fail before the model load if the face won't lip-sync
+    is_valid, message = service.face_detector.validate_for_lipsync(face_info)
+    if not is_valid:
+        print(f"\nError: Avatar not suitable for lip-sync: {message}")
+        print("\nPlease use a frontal image with a clearly visible face")
+        return
+    print(f"Avatar validated: {message}")
+
     # Create lip-sync config
     lipsync_config = LipSyncConfig(quality=quality)
 
@@ -94,9 +100,7 @@ def main():
             print(f"  Processing time: {result.processing_time_seconds:.2f}s")
             print(f"  Speed: {result.duration_seconds / result.processing_time_seconds:.2f}x realtime")
 
-            # Get file size
-            file_size_mb = result.video_path.stat().st_size / 1024 / 1024
-            print(f"  File size: {file_size_mb:.2f} MB")
+            print(f"  File size: {human_size(result.file_size_bytes)}")
 
             print(f"\nVideo saved to: {result.video_path}")
 
@@ -129,8 +133,7 @@ def main():
         print("  - Image contains visible face")
         print("  - Audio file is valid")
 
-    print("=" * 70)
-
 
 if __name__ == "__main__":
-    main()
+    with Banner("Example 04: Lip-Sync Video Generation with MuseTalk"):
+        main()
@@ -14,18 +14,15 @@ Usage:
 
 from pathlib import Path
 
-from src.config import load_config
-from src.orchestration import PipelineConfig, PipelineCoordinator
-from src.utils import VRAMManager
-from src.voice import VoiceProfileManager
+from _log import Banner
+
+from src.orchestration import PipelineConfig
+from src.service import get_service
+from src.utils import human_size
 
 
 def main():
     """Execute the full avatar video pipeline."""
-    print("=" * 70)
-    print("Example 05: Full Pipeline Execution")
-    print("=" * 70)
-
     # Configuration
     text = "Hello! This is a demonstration of the complete avatar video pipeline. It combines voice cloning, text-to-speech synthesis, and lip-sync video generation."
     voice_profile_name = "Example Voice"  # Replace with your voice profile
@@ -50,18 +47,13 @@ def main():
 
     # Load configuration
     print("\n[1/7] Loading configuration...")
-    config = load_config()
+    service = get_service(storage_path=storage_path)
     print("Configuration loaded successfully")
 
     # Initialize components
     print("\n[2/7] Initializing pipeline...")
-    vram_manager = VRAMManager()
-    voice_profile_manager = VoiceProfileManager(storage_path)
-    coordinator = PipelineCoordinator(
-        config=config,
-        vram_manager=vram_manager,
-        storage_path=storage_path,
-    )
+    voice_profile_manager = service.voice_profile_manager
+    coordinator = service.coordinator
     print("Pipeline initialized")
 
     # Load voice profile
@@ -73,10 +65,10 @@ def main():
             voice_profile_id = voice_profile.profile_id
         except FileNotFoundError:
             # Try finding by name
-            profiles = voice_profile_manager.list_profiles()
-            matching = [p for p in profiles if p.name == voice_profile_name]
+            voice_profile = voice_profile_manager.find_by_name(voice_profile_name)
 
-            if not matching:
+            if voice_profile is None:
+                profiles = voice_profile_manager.list_profiles()
                 print(f"\nError: Voice profile not found: {voice_profile_name}")
                 print("\nAvailable profiles:")
                 if profiles:
@@ -86,8 +78,8 @@ def main():
                     print("  No profiles found. Run 01_voice_cloning.py first.")
                 return
 
-            voice_profile_id = matching[0].profile_id
-            print(f"  Using profile: {matching[0].name} ({voice_profile_id})")
+            voice_profile_id = voice_profile.profile_id
+            print(f"  Using profile: {voice_profile.name} ({voice_profile_id})")
 
     except Exception as e:
         print(f"\nError loading voice profile: {e}")
@@ -143,10 +135,9 @@ def main():
                 print("\n[6/7] Intermediate files cleaned up")
 
             # File info
-            file_size_mb = result.output_path.stat().st_size / 1024 / 1024
             print(f"\n[7/7] Final output:")
             print(f"  Path: {result.output_path}")
-            print(f"  Size: {file_size_mb:.2f} MB")
+            print(f"  Size: {human_size(result.file_size_bytes)}")
 
             print("\nYou can now:")
             print(f"  - Play the video file")
@@ -182,8 +173,7 @@ def main():
         print("  - Available VRAM (8GB+ required)")
         print("  - FFmpeg is installed")
 
-    print("=" * 70)
-
 
 if __name__ == "__main__":
-    main()
+    with Banner("Example 05: Full Pipeline Execution"):
+        main()
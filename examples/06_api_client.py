@@ -5,7 +5,7 @@ Demonstrates how to interact with the Avatar Pipeline REST API.
 
 Requirements:
     - API server running (start with: avatar server start)
-    - requests library (pip install requests)
+    - httpx library (pip install httpx; httpx[http2] for HTTP/2)
 
 Usage:
     # Terminal 1: Start server
@@ -15,32 +15,63 @@ Usage:
     python examples/06_api_client.py
 """
 
+import asyncio
+import json
 import time
-from pathlib import Path
+from collections.abc import AsyncIterator
 from typing import Optional
 
 try:
-    import requests
+    import httpx
 except ImportError:
-    print("Error: requests library not found")
-    print("Install with: pip install requests")
+    print("Error: httpx library not found")
+    print("Install with: pip install httpx")
     exit(1)
 
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
 
-class AvatarPipelineClient:
-    """Simple client for Avatar Pipeline REST API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+class AsyncAvatarPipelineClient:
+    """
+    Async client for Avatar Pipeline REST API.
+
+    All requests share one connection pool, so several calls (e.g. waiting
+    on multiple jobs) can be in flight at once over kept-alive connections.
+    Use as an async context manager or await aclose() when done.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", http2: bool = False):
         """
         Initialize API client.
 
         Args:
             base_url: Base URL of the API server
+            http2: Negotiate HTTP/2 (needs httpx[http2] and a TLS proxy
+                that speaks it; uvicorn itself serves HTTP/1.1)
         """
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
-
-    def health_check(self) -> bool:
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            # Retry failed connection attempts, never requests that reached the server
+            transport=httpx.AsyncHTTPTransport(http2=http2, retries=3),
+        )
+        # Last ETag and body per URL, for conditional polling
+        self._etags: dict[str, tuple[str, dict]] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncAvatarPipelineClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def health_check(self) -> bool:
         """
         Check if API server is running.
 
@@ -48,12 +79,12 @@ class AvatarPipelineClient:
             True if server is healthy, False otherwise
         """
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = await self.client.get(f"{self.base_url}/health", timeout=5)
             return response.status_code == 200
-        except requests.RequestException:
+        except httpx.HTTPError:
             return False
 
-    def submit_pipeline_job(
+    async def submit_pipeline_job(
         self,
         text: str,
         voice_profile_id: str,
@@ -86,18 +117,18 @@ class AvatarPipelineClient:
         }
 
         try:
-            response = requests.post(
+            response = await self.client.post(
                 f"{self.api_base}/jobs/pipeline",
                 json=payload,
                 timeout=10,
             )
             response.raise_for_status()
             return response.json()["job_id"]
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Error submitting job: {e}")
             return None
 
-    def get_job_status(self, job_id: str) -> Optional[dict]:
+    async def get_job_status(self, job_id: str) -> Optional[dict]:
         """
         Get status of a job.
 
@@ -108,52 +139,215 @@ class AvatarPipelineClient:
             Job status dict if successful, None otherwise
         """
         try:
-            response = requests.get(f"{self.api_base}/jobs/{job_id}", timeout=5)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return await self._get_json(f"{self.api_base}/jobs/{job_id}")
+        except httpx.HTTPError as e:
             print(f"Error getting job status: {e}")
             return None
 
-    def wait_for_job(
+    async def _get_json(self, url: str) -> dict:
+        """
+        GET a JSON resource, revalidating the last copy with If-None-Match.
+
+        Unchanged resources come back as an empty 304, so repeat polls
+        skip the body transfer and JSON decode.
+        """
+        cached = self._etags.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        response = await self.client.get(url, headers=headers, timeout=5)
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[url] = (etag, data)
+        return data
+
+    async def get_job_statuses(self, job_ids: list[str]) -> dict[str, dict]:
+        """
+        Get status of several jobs in one request.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Mapping of job ID to status dict (unknown IDs are omitted)
+        """
+        try:
+            response = await self.client.post(
+                f"{self.api_base}/jobs/batch",
+                json={"job_ids": job_ids},
+                timeout=10,
+            )
+            response.raise_for_status()
+            return {job["job_id"]: job for job in response.json()}
+        except httpx.HTTPError as e:
+            print(f"Error getting job statuses: {e}")
+            return {}
+
+    async def wait_for_jobs(
+        self, job_ids: list[str], poll_interval: float = 2.0, timeout: float = 600.0
+    ) -> dict[str, dict]:
+        """
+        Wait for several jobs to finish, polling them in one request.
+
+        Args:
+            job_ids: Job IDs
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Latest status of each job found (check "status" for unfinished
+            jobs if the timeout was hit)
+        """
+        deadline = time.monotonic() + timeout
+        statuses: dict[str, dict] = {}
+
+        while time.monotonic() < deadline:
+            statuses = await self.get_job_statuses(job_ids)
+
+            if all(s["status"] in TERMINAL_STATUSES for s in statuses.values()):
+                return statuses
+
+            await asyncio.sleep(poll_interval)
+
+        print("Timeout waiting for jobs to complete")
+        return statuses
+
+    async def watch_job(self, job_id: str) -> AsyncIterator[dict]:
+        """
+        Yield job status updates as the server pushes them.
+
+        Uses the Server-Sent Events stream, which ends once the job
+        finishes.
+
+        Args:
+            job_id: Job ID
+
+        Yields:
+            Job status dicts, one per status or progress change
+
+        Raises:
+            httpx.HTTPError: If the stream cannot be opened or breaks
+        """
+        async with self.client.stream(
+            "GET",
+            f"{self.api_base}/jobs/{job_id}/events",
+            headers={"Accept": "text/event-stream"},
+            # Server sends a heartbeat every 15s on idle streams
+            timeout=httpx.Timeout(10, read=45),
+        ) as response:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    yield json.loads(line[len("data: "):])
+
+    async def wait_for_job(
         self, job_id: str, poll_interval: float = 2.0, timeout: float = 600.0
     ) -> Optional[dict]:
         """
         Wait for job to complete.
 
+        Follows the server's event stream so each state change arrives as
+        it happens. Falls back to long-polling, then periodic polling, on
+        servers without those endpoints.
+
         Args:
             job_id: Job ID
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds between status checks (fallback only)
             timeout: Maximum seconds to wait
 
         Returns:
             Final job status if completed, None if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+
+        try:
+            return await asyncio.wait_for(self._follow_events(job_id), timeout)
+        except asyncio.TimeoutError:
+            print("Timeout waiting for job to complete")
+            return None
+        except httpx.HTTPError:
+            return await self._long_poll_for_job(
+                job_id, poll_interval, deadline - time.monotonic()
+            )
+
+    async def _follow_events(self, job_id: str) -> Optional[dict]:
+        """Wait for job completion via its event stream."""
+        async for status in self.watch_job(job_id):
+            if status["status"] in TERMINAL_STATUSES:
+                return status
+
+            _print_progress(status)
+
+        # Stream ended early: the job was deleted
+        return None
+
+    async def _long_poll_for_job(
+        self, job_id: str, poll_interval: float, timeout: float
+    ) -> Optional[dict]:
+        """Wait for job completion via the long-polling endpoint."""
+        deadline = time.monotonic() + timeout
+        etag = None
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            wait_seconds = min(30.0, remaining)
+            headers = {"If-None-Match": etag} if etag else {}
+
+            try:
+                response = await self.client.get(
+                    f"{self.api_base}/jobs/{job_id}/wait",
+                    params={"timeout": wait_seconds},
+                    headers=headers,
+                    timeout=wait_seconds + 5,
+                )
+            except httpx.HTTPError:
+                response = None
+
+            if response is None or response.status_code not in (200, 201, 304):
+                return await self._poll_for_job(job_id, poll_interval, remaining)
+
+            if response.status_code == 304:
+                continue
+
+            status = response.json()
+            etag = response.headers.get("ETag")
+
+            if status["status"] in TERMINAL_STATUSES:
+                return status
 
-        while time.time() - start_time < timeout:
-            status = self.get_job_status(job_id)
+            _print_progress(status)
+
+        print("Timeout waiting for job to complete")
+        return None
+
+    async def _poll_for_job(
+        self, job_id: str, poll_interval: float, timeout: float
+    ) -> Optional[dict]:
+        """Wait for job completion by polling its status periodically."""
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            status = await self.get_job_status(job_id)
 
             if not status:
                 return None
 
             # Check if job is done
-            if status["status"] in ["completed", "failed", "cancelled"]:
+            if status["status"] in TERMINAL_STATUSES:
                 return status
 
-            # Show progress
-            print(
-                f"  Status: {status['status']} | "
-                f"Progress: {status['progress'] * 100:.1f}% | "
-                f"Stage: {status.get('stage', 'N/A')}"
-            )
-
-            time.sleep(poll_interval)
+            _print_progress(status)
+            await asyncio.sleep(poll_interval)
 
         print("Timeout waiting for job to complete")
         return None
 
-    def list_jobs(self, status: Optional[str] = None, limit: int = 10) -> list:
+    async def list_jobs(self, status: Optional[str] = None, limit: int = 10) -> list:
         """
         List jobs.
 
@@ -169,28 +363,96 @@ class AvatarPipelineClient:
             params["status"] = status
 
         try:
-            response = requests.get(
+            response = await self.client.get(
                 f"{self.api_base}/jobs", params=params, timeout=5
             )
             response.raise_for_status()
             return response.json()["jobs"]
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Error listing jobs: {e}")
             return []
 
 
-def main():
-    """Demonstrate API client usage."""
-    print("=" * 70)
-    print("Example 06: REST API Client")
-    print("=" * 70)
+class AvatarPipelineClient:
+    """
+    Synchronous facade over AsyncAvatarPipelineClient.
+
+    Runs the async client on a private event loop, for scripts that don't
+    use asyncio. Use as a context manager or call close() when done.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", http2: bool = False):
+        """
+        Initialize API client.
+
+        Args:
+            base_url: Base URL of the API server
+            http2: Negotiate HTTP/2 (see AsyncAvatarPipelineClient)
+        """
+        self._loop = asyncio.new_event_loop()
+        self._client = AsyncAvatarPipelineClient(base_url, http2=http2)
+
+    def _run(self, coro):
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Close the connection pool and event loop."""
+        self._run(self._client.aclose())
+        self._loop.close()
+
+    def __enter__(self) -> "AvatarPipelineClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def health_check(self) -> bool:
+        """Check if API server is running."""
+        return self._run(self._client.health_check())
+
+    def submit_pipeline_job(self, *args, **kwargs) -> Optional[str]:
+        """Submit a full pipeline job (see AsyncAvatarPipelineClient)."""
+        return self._run(self._client.submit_pipeline_job(*args, **kwargs))
+
+    def get_job_status(self, job_id: str) -> Optional[dict]:
+        """Get status of a job."""
+        return self._run(self._client.get_job_status(job_id))
+
+    def get_job_statuses(self, job_ids: list[str]) -> dict[str, dict]:
+        """Get status of several jobs in one request."""
+        return self._run(self._client.get_job_statuses(job_ids))
+
+    def wait_for_job(
+        self, job_id: str, poll_interval: float = 2.0, timeout: float = 600.0
+    ) -> Optional[dict]:
+        """Wait for job to complete."""
+        return self._run(self._client.wait_for_job(job_id, poll_interval, timeout))
+
+    def wait_for_jobs(
+        self, job_ids: list[str], poll_interval: float = 2.0, timeout: float = 600.0
+    ) -> dict[str, dict]:
+        """Wait for several jobs to finish."""
+        return self._run(self._client.wait_for_jobs(job_ids, poll_interval, timeout))
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 10) -> list:
+        """List jobs."""
+        return self._run(self._client.list_jobs(status, limit))
+
+
+def _print_progress(status: dict) -> None:
+    """Print a one-line job progress update."""
+    print(
+        f"  Status: {status['status']} | "
+        f"Progress: {status['progress'] * 100:.1f}% | "
+        f"Stage: {status.get('stage', 'N/A')}"
+    )
 
-    # Initialize client
-    client = AvatarPipelineClient()
 
+async def run_examples(client: AsyncAvatarPipelineClient) -> None:
+    """Check the server, submit a job, wait for it, and list recent jobs."""
     # Check server health
     print("\n[1/5] Checking API server...")
-    if not client.health_check():
+    if not await client.health_check():
         print("Error: API server not responding")
         print("\nPlease start the server:")
         print("  avatar server start")
@@ -201,7 +463,7 @@ def main():
 
     # Submit a job
     print("\n[2/5] Submitting pipeline job...")
-    job_id = client.submit_pipeline_job(
+    job_id = await client.submit_pipeline_job(
         text="Hello from the API! This is a test of the complete pipeline.",
         voice_profile_id="vp-example",  # Replace with your profile ID
         avatar_image_path="output/generated_avatar.png",  # Replace with your image
@@ -223,7 +485,7 @@ def main():
     print("\n[3/5] Waiting for job to complete...")
     print("(This may take several minutes)\n")
 
-    final_status = client.wait_for_job(job_id, poll_interval=2.0, timeout=600.0)
+    final_status = await client.wait_for_job(job_id, poll_interval=2.0, timeout=600.0)
 
     if not final_status:
         print("\nError: Job did not complete in time")
@@ -254,7 +516,7 @@ def main():
 
     # List recent jobs
     print("\n[5/5] Recent jobs:")
-    jobs = client.list_jobs(limit=5)
+    jobs = await client.list_jobs(limit=5)
 
     if jobs:
         print(f"Found {len(jobs)} job(s):\n")
@@ -267,6 +529,17 @@ def main():
     else:
         print("  No jobs found")
 
+
+async def main():
+    """Demonstrate API client usage."""
+    print("=" * 70)
+    print("Example 06: REST API Client")
+    print("=" * 70)
+
+    # Initialize client (closed automatically when the block exits)
+    async with AsyncAvatarPipelineClient() as client:
+        await run_examples(client)
+
     print("=" * 70)
 
     # Additional examples
@@ -279,4 +552,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
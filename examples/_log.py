@@ -0,0 +1,54 @@
+"""
+Console output helper shared by the example scripts.
+
+Prints the example header and footer, and turns off per-line flushing
+when stdout is not a terminal (CI logs, pipes, sweep scripts) so the
+run's output is written in a few large chunks with one flush at the end.
+"""
+
+import sys
+
+
+class Banner:
+    """
+    Context manager that frames an example run.
+
+    Usage:
+        with Banner("Example 01: Voice Cloning"):
+            main()
+    """
+
+    def __init__(self, title: str, width: int = 70):
+        """
+        Initialize banner.
+
+        Args:
+            title: Header title
+            width: Width of the separator lines
+        """
+        self.title = title
+        self.width = width
+        self._restore = None
+
+    def __enter__(self) -> "Banner":
+        stream = sys.stdout
+
+        # Interactive terminals keep line buffering so progress stays visible
+        if not stream.isatty() and hasattr(stream, "reconfigure"):
+            self._restore = {
+                "line_buffering": stream.line_buffering,
+                "write_through": stream.write_through,
+            }
+            stream.reconfigure(line_buffering=False, write_through=False)
+
+        print("=" * self.width)
+        print(self.title)
+        print("=" * self.width)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        print("=" * self.width)
+        sys.stdout.flush()
+
+        if self._restore is not None:
+            sys.stdout.reconfigure(**self._restore)
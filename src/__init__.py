@@ -9,9 +9,10 @@ __version__ = "0.1.0"
 __author__ = "Avatar Pipeline Contributors"
 __license__ = "MIT"
 
-# Export main modules
-from . import api, avatar, config, orchestration, utils, video, voice
+import importlib
 
+# Subpackages are imported on first attribute access, so `import src` (and
+# CLI startup) doesn't pull in FastAPI, MediaPipe or torch until needed
 __all__ = [
     "config",
     "utils",
@@ -21,3 +22,16 @@ __all__ = [
     "orchestration",
     "api",
 ]
+
+
+def __getattr__(name: str):
+    """Import a subpackage on first access."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,18 @@ Provides FastAPI-based REST API for pipeline execution, job management,
 and component operations.
 """
 
-from .main import app, create_app
-
 __all__ = ["app", "create_app"]
+
+
+def __getattr__(name: str):
+    """
+    Forward create_app and the default app from .main on first access.
+
+    Deferred so importing the package doesn't load FastAPI and every
+    pipeline component.
+    """
+    if name in __all__:
+        from . import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,161 @@
+"""
+Request micro-batching.
+
+Coalesces concurrent requests into one batched model call. The first
+request opens a short window; compatible requests arriving within it are
+run together, so diffusion models process several prompts per forward
+pass instead of one.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Collects concurrent submissions and runs them in batches.
+
+    Items are batched only with items sharing the same key (e.g. the same
+    output resolution). Items with a different key wait for the next batch
+    in arrival order.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list], Awaitable[list]],
+        key: Callable[[Any], Hashable],
+        max_batch: int = 1,
+        window_ms: float = 30,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            run_batch: Coroutine function mapping a list of items to a list
+                of results in the same order
+            key: Function returning the compatibility key of an item
+            max_batch: Most items per batch (1 = no batching, no delay)
+            window_ms: How long the first item waits for others (milliseconds)
+        """
+        self.run_batch = run_batch
+        self.key = key
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._deferred: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background batching task (requires a running loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task, failing any requests still waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._queue.empty():
+            self._deferred.append(self._queue.get_nowait())
+        while self._deferred:
+            _, future = self._deferred.popleft()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Args:
+            item: Request item passed to run_batch
+
+        Returns:
+            The item's result from run_batch
+
+        Raises:
+            Exception: Whatever run_batch raised for the batch
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _next(self) -> tuple:
+        """Get the next queued (item, future), deferred entries first."""
+        if self._deferred:
+            return self._deferred.popleft()
+        return await self._queue.get()
+
+    async def _collect(self) -> list[tuple]:
+        """Wait for one entry, then gather compatible ones until the window ends."""
+        first = await self._next()
+        batch = [first]
+        if self.max_batch == 1:
+            return batch
+
+        batch_key = self.key(first[0])
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window
+        skipped = []
+
+        # Only look at deferred entries once, then new arrivals
+        while self._deferred and len(batch) < self.max_batch:
+            entry = self._deferred.popleft()
+            (batch if self.key(entry[0]) == batch_key else skipped).append(entry)
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            except asyncio.CancelledError:
+                # Stopping: hand everything back so stop() can fail it
+                self._deferred.extendleft(reversed(batch + skipped))
+                raise
+            (batch if self.key(entry[0]) == batch_key else skipped).append(entry)
+
+        # Skipped entries keep their place ahead of anything queued later
+        self._deferred.extendleft(reversed(skipped))
+        return batch
+
+    async def _run(self) -> None:
+        """Batch loop: collect, run, and resolve each caller's future."""
+        while True:
+            batch = await self._collect()
+            # Callers that gave up (client disconnected) don't need a slot
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                results = await self.run_batch([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"Batch returned {len(results)} results for {len(batch)} items"
+                    )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,114 @@
+"""
+FastAPI dependency providers.
+
+Routes receive shared components through Depends() instead of module
+globals. Components are built by the app's lifespan handler and stored on
+app.state, so each app (and each worker process) has its own set.
+"""
+
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+
+from fastapi import Depends, HTTPException, Request
+
+from ..avatar import AvatarProfileManager, MediaPipeFaceDetector
+from ..orchestration import JobQueue
+from ..service import AvatarService
+from ..utils import VRAMManager
+from ..video import FFmpegEncoder
+from ..voice import VoiceProfileManager
+from .batching import MicroBatcher
+
+
+def get_components(request: Request) -> dict:
+    """
+    Get the app's shared components.
+
+    Raises:
+        HTTPException: 503 if the app has not finished starting up
+    """
+    components = request.app.state.components
+    if components is None:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+    return components
+
+
+def get_config(components: dict = Depends(get_components)) -> dict:
+    """Get the loaded pipeline configuration."""
+    return components["config"]
+
+
+def get_gpu_info(components: dict = Depends(get_components)) -> dict:
+    """Get GPU information detected at startup."""
+    return components["gpu_info"]
+
+
+def get_vram_manager(components: dict = Depends(get_components)) -> VRAMManager:
+    """Get the shared VRAM manager."""
+    return components["vram_manager"]
+
+
+def get_outputs_dir(components: dict = Depends(get_components)) -> Path:
+    """Get the directory generated files are written to (created at startup)."""
+    return components["outputs_dir"]
+
+
+def get_job_queue(components: dict = Depends(get_components)) -> JobQueue:
+    """Get the job queue."""
+    return components["job_queue"]
+
+
+def get_voice_profile_manager(
+    components: dict = Depends(get_components),
+) -> VoiceProfileManager:
+    """Get the voice profile manager."""
+    return components["voice_profile_manager"]
+
+
+def get_avatar_profile_manager(
+    components: dict = Depends(get_components),
+) -> AvatarProfileManager:
+    """Get the avatar profile manager."""
+    return components["avatar_profile_manager"]
+
+
+def get_face_detector(
+    components: dict = Depends(get_components),
+) -> MediaPipeFaceDetector:
+    """Get the face detector."""
+    return components["face_detector"]
+
+
+def get_detect_cache(components: dict = Depends(get_components)) -> OrderedDict:
+    """Get the LRU of face detection responses, keyed by image content hash."""
+    return components["detect_cache"]
+
+
+def get_video_encoder(components: dict = Depends(get_components)) -> FFmpegEncoder:
+    """Get the video encoder."""
+    return components["video_encoder"]
+
+
+def get_service(components: dict = Depends(get_components)) -> AvatarService:
+    """Get the service holding the app's reusable model wrappers."""
+    return components["service"]
+
+
+def get_gpu_lock(components: dict = Depends(get_components)) -> asyncio.Semaphore:
+    """
+    Get the semaphore admitting GPU model work.
+
+    Model calls run in worker threads so the event loop stays responsive;
+    holding a slot keeps more than api.max_concurrent_gpu_jobs of them
+    from loading models onto the GPU at once. Waiting requests queue on
+    the event loop. Each model wrapper also serializes its own calls, and
+    models busy with a call are never evicted, so jobs admitted side by
+    side only overlap across different models.
+    """
+    return components["gpu_lock"]
+
+
+def get_avatar_batcher(components: dict = Depends(get_components)) -> MicroBatcher:
+    """Get the batcher coalescing concurrent avatar generation requests."""
+    return components["avatar_batcher"]
@@ -0,0 +1,49 @@
+"""
+Conditional GET support.
+
+Builds JSON responses tagged with a content hash so polling clients can
+revalidate with If-None-Match and receive an empty 304 when nothing changed.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+# Responses change at most a few times per second; let clients reuse them briefly
+CACHE_CONTROL = "private, max-age=1"
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an If-None-Match header value (weak comparison) against an ETag."""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
+
+
+def etag_response(model: BaseModel, if_none_match: Optional[str] = None) -> Response:
+    """
+    Serialize a response model with an ETag, or return 304 if it matches.
+
+    Args:
+        model: Response model to send
+        if_none_match: If-None-Match header from the request
+
+    Returns:
+        JSON response with ETag and Cache-Control headers, or an empty 304
+    """
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,116 @@
+"""
+File transfer helpers for API routes.
+
+Uploads are copied to disk in a worker thread so large files never block
+the event loop or get buffered whole in memory.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+
+# Copy uploads in chunks of this size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Uploads up to this size are staged in RAM (tmpfs) when available
+MEMORY_STAGING_MAX_BYTES = 8 * 1024 * 1024
+
+# RAM-backed filesystem on Linux
+SHM_DIR = Path("/dev/shm")
+
+
+@lru_cache(maxsize=1)
+def _shm_available() -> bool:
+    """Check once whether uploads can be staged in SHM_DIR."""
+    return SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK | os.X_OK)
+
+
+def _staging_dir(size: Optional[int]) -> Optional[str]:
+    """
+    Pick where to stage an upload.
+
+    Small uploads go to tmpfs, which still gives model code a real path
+    but skips the disk write. Large or unknown-size uploads use the
+    default temp directory so they can't exhaust RAM.
+    """
+    if size is not None and size <= MEMORY_STAGING_MAX_BYTES and _shm_available():
+        return str(SHM_DIR)
+    return None
+
+
+def _copy_to_temp(upload: UploadFile, suffix: str) -> Path:
+    """Copy an upload's spooled file into a new temporary file, chunk by chunk."""
+    upload.file.seek(0)
+    staging_dir = _staging_dir(upload.size)
+    with tempfile.NamedTemporaryFile(
+        delete=False, suffix=suffix, dir=staging_dir
+    ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+        try:
+            shutil.copyfileobj(upload.file, tmp_file, UPLOAD_CHUNK_BYTES)
+        except BaseException:
+            # Don't leave a partial copy behind (e.g. disk full)
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return tmp_path
+
+
+async def save_upload(upload: UploadFile) -> Path:
+    """
+    Save an uploaded file to a temporary path.
+
+    Small uploads are staged in RAM-backed /dev/shm where available.
+    The caller is responsible for deleting the file.
+
+    Args:
+        upload: Uploaded file (must have a filename)
+
+    Returns:
+        Path to the temporary copy, keeping the upload's file extension
+    """
+    suffix = Path(upload.filename).suffix
+    return await asyncio.to_thread(_copy_to_temp, upload, suffix)
+
+
+def output_path(outputs_dir: Path, filename: Optional[str], default: str) -> Path:
+    """
+    Resolve where a request's output file goes.
+
+    The outputs directory is created at startup, so only names with
+    subdirectories need a mkdir here.
+
+    Args:
+        outputs_dir: The app's outputs directory
+        filename: Requested output filename (optional)
+        default: Filename to use if none was requested
+
+    Returns:
+        Path of the output file
+    """
+    path = outputs_dir / (filename or default)
+    if path.parent != outputs_dir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+async def missing_paths(*paths: Path) -> list[Path]:
+    """
+    Find which of the given paths don't exist.
+
+    The checks run in one worker thread call, so a slow filesystem (NFS,
+    FUSE mounts) doesn't stall the event loop.
+
+    Args:
+        *paths: Paths to check
+
+    Returns:
+        The paths that don't exist, in the order given
+    """
+    return await asyncio.to_thread(lambda: [p for p in paths if not p.exists()])
@@ -4,118 +4,196 @@ FastAPI application for avatar pipeline.
 Provides REST API for pipeline execution, job management, and component operations.
 """
 
+import asyncio
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from ..avatar import AvatarProfileManager, MediaPipeFaceDetector
 from ..config import detect_gpu, get_hardware_profile, load_config
 from ..orchestration import JobQueue, PipelineCoordinator
-from ..utils import VRAMManager
+from ..service import AvatarService
+from ..utils import VRAMManager, VRAMStatus
 from ..video import FFmpegEncoder
 from ..voice import VoiceProfileManager
+from .deps import get_components
+from .etag import etag_response
 from .models import HealthResponse, StatusResponse
-from .routes import avatar, jobs, voice, video
+from .routes import avatar, jobs, video, voice
 
 logger = logging.getLogger(__name__)
 
 # API version
 VERSION = "0.1.0"
 
-# Global state
-_app_state: Optional[dict] = None
+# Import string for uvicorn (required for multiple workers and reload)
+APP_IMPORT_STRING = "src.api.main:app"
 
+# Environment variables carrying server options into worker processes
+CONFIG_ENV = "AVATAR_CONFIG"
+STORAGE_ENV = "AVATAR_STORAGE"
 
-def create_app(
-    config_path: Optional[Path] = None,
-    storage_path: Path = Path("storage"),
-) -> FastAPI:
+# CORS settings used where api.cors in the config leaves them unset.
+# Explicit methods/headers plus max_age let browsers cache preflights.
+CORS_DEFAULTS = {
+    "allow_origins": ["*"],
+    "allow_credentials": False,
+    "allow_methods": ["GET", "POST", "DELETE"],
+    "allow_headers": ["authorization", "content-type", "if-none-match"],
+    "expose_headers": ["ETag"],
+    "max_age": 86400,
+}
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = 512
+
+# Event streams must reach the client unbuffered; videos are already compressed
+UNCOMPRESSED_PATHS = [r"^/jobs/[^/]+/events$", r"^/video/encode$", r"^/video/outputs/"]
+
+
+@dataclass
+class _TTLCache:
+    """Memoized endpoint response and when it was computed."""
+
+    value: Any = None
+    fetched_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return (
+            self.value is not None
+            and time.monotonic() - self.fetched_at < ttl_seconds
+        )
+
+
+async def _get_cached(
+    cache: _TTLCache, ttl_seconds: float, compute: Callable[[], Any]
+) -> Any:
     """
-    Create and configure FastAPI application.
+    Return a cached value, recomputing it once the TTL has expired.
+
+    Concurrent callers on an expired entry wait for a single recompute.
+    compute runs in a worker thread since GPU and job store queries block.
 
     Args:
-        config_path: Path to config YAML file (optional)
-        storage_path: Base storage directory
+        cache: Cache entry for the endpoint
+        ttl_seconds: Maximum snapshot age (0 disables caching)
+        compute: Builds a fresh value
 
     Returns:
-        Configured FastAPI application
+        Cached or freshly computed value
     """
-    global _app_state
+    if ttl_seconds <= 0:
+        return await asyncio.to_thread(compute)
 
-    # Create app
-    app = FastAPI(
-        title="Avatar Pipeline API",
-        description="REST API for AI avatar video generation with voice cloning and lip-sync",
-        version=VERSION,
-        docs_url="/docs",
-        redoc_url="/redoc",
-    )
+    if cache.is_fresh(ttl_seconds):
+        return cache.value
 
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    async with cache.lock:
+        # Another request may have refreshed it while we waited
+        if cache.is_fresh(ttl_seconds):
+            return cache.value
 
-    # Initialize application state
-    try:
-        logger.info("Initializing Avatar Pipeline API...")
+        value = await asyncio.to_thread(compute)
+        # Stamp after computing so query latency doesn't count toward age
+        cache.value = value
+        cache.fetched_at = time.monotonic()
+        return value
 
-        # Load configuration
-        config = load_config(config_path)
-        logger.info(f"Configuration loaded (profile: {config.get('hardware_profile')})")
 
-        # Initialize VRAM manager
-        gpu_info = detect_gpu()
-        vram_manager = VRAMManager(device_id=gpu_info.get("device_id", 0))
+def _build_model_wrappers(service: AvatarService) -> None:
+    """
+    Construct the service's model wrappers ahead of the first request.
+
+    Wrappers load weights per call, so this is cheap unless a wrapper is
+    configured to warm up, in which case startup is where that belongs.
+    """
+    for name in ("cloner", "synthesizer", "generator", "lipsync"):
+        getattr(service, name)
+
 
-        # Initialize profile managers
-        voice_profile_manager = VoiceProfileManager(storage_path)
-        avatar_profile_manager = AvatarProfileManager(storage_path)
+async def _init_components(config_path: Optional[Path], storage_path: Path) -> dict:
+    """
+    Build the API's shared components.
+
+    Independent initializers (config parsing, GPU probing, storage setup)
+    run concurrently in worker threads.
 
-        # Initialize face detector
-        face_detector = MediaPipeFaceDetector()
+    Args:
+        config_path: Path to config YAML file (optional)
+        storage_path: Base storage directory
 
-        # Initialize video encoder
-        video_encoder = FFmpegEncoder()
+    Returns:
+        Component dict, served to routes through the providers in .deps
+    """
+    try:
+        logger.info("Initializing Avatar Pipeline API...")
 
-        # Initialize job queue
-        job_queue = JobQueue(storage_path)
+        config, gpu_info = await asyncio.gather(
+            asyncio.to_thread(load_config, config_path),
+            asyncio.to_thread(detect_gpu),
+        )
+        logger.info(f"Configuration loaded (profile: {config.get('hardware_profile')})")
+
+        (
+            vram_manager,
+            voice_profile_manager,
+            avatar_profile_manager,
+            face_detector,
+            video_encoder,
+            job_queue,
+        ) = await asyncio.gather(
+            asyncio.to_thread(VRAMManager, device_id=gpu_info.get("device_id", 0)),
+            asyncio.to_thread(VoiceProfileManager, storage_path),
+            asyncio.to_thread(AvatarProfileManager, storage_path),
+            asyncio.to_thread(MediaPipeFaceDetector),
+            asyncio.to_thread(FFmpegEncoder),
+            asyncio.to_thread(JobQueue, storage_path),
+        )
+
+        # Created once here so routes don't mkdir on every request
+        outputs_dir = storage_path / "outputs"
+        await asyncio.to_thread(outputs_dir.mkdir, parents=True, exist_ok=True)
 
-        # Initialize pipeline coordinator
         pipeline_coordinator = PipelineCoordinator(
             config=config,
             vram_manager=vram_manager,
             storage_path=storage_path,
         )
 
-        # Store global state
-        _app_state = {
-            "config": config,
-            "storage_path": storage_path,
-            "vram_manager": vram_manager,
-            "voice_profile_manager": voice_profile_manager,
-            "avatar_profile_manager": avatar_profile_manager,
-            "face_detector": face_detector,
-            "video_encoder": video_encoder,
-            "job_queue": job_queue,
-            "pipeline_coordinator": pipeline_coordinator,
-            "gpu_info": gpu_info,
-        }
+        # Model wrappers are built once and reused by every request; share
+        # the components above with them rather than building second copies
+        service = AvatarService(config, storage_path, vram_manager=vram_manager)
+        service.voice_profile_manager = voice_profile_manager
+        service.avatar_profile_manager = avatar_profile_manager
+        service.face_detector = face_detector
+        service.encoder = video_encoder
+        await asyncio.to_thread(_build_model_wrappers, service)
+
+        # Wake long-poll and event-stream requests on job saves
+        jobs.watch_queue(job_queue)
+
+        # Bound concurrent model jobs so they don't exhaust VRAM together
+        gpu_lock = asyncio.Semaphore(
+            config.get("api", {}).get("max_concurrent_gpu_jobs", 1)
+        )
 
-        # Inject dependencies into route modules
-        jobs.set_job_queue(job_queue)
-        voice.set_components(config, vram_manager, voice_profile_manager)
-        avatar.set_components(
-            config, vram_manager, avatar_profile_manager, face_detector
+        # Coalesce concurrent generate requests into batched model calls
+        avatar_batcher = avatar.start_generate_batcher(
+            service, gpu_lock, config, outputs_dir
         )
-        video.set_components(config, vram_manager, video_encoder)
 
         logger.info("API initialization complete")
 
@@ -123,74 +201,243 @@ def create_app(
         logger.error(f"API initialization failed: {e}", exc_info=True)
         raise
 
+    return {
+        "gpu_lock": gpu_lock,
+        "config": config,
+        "storage_path": storage_path,
+        "outputs_dir": outputs_dir,
+        "vram_manager": vram_manager,
+        "voice_profile_manager": voice_profile_manager,
+        "avatar_profile_manager": avatar_profile_manager,
+        "face_detector": face_detector,
+        "detect_cache": OrderedDict(),
+        "video_encoder": video_encoder,
+        "job_queue": job_queue,
+        "pipeline_coordinator": pipeline_coordinator,
+        "service": service,
+        "avatar_batcher": avatar_batcher,
+        "gpu_info": gpu_info,
+        "status_static": _build_status_static(gpu_info, config, storage_path),
+    }
+
+
+def _vram_status(components: dict) -> VRAMStatus:
+    """Get VRAM status, shared between /health and /status within vram_ms."""
+    ttl = components["config"].get("api", {}).get("status_cache_ttl", {})
+    return components["vram_manager"].get_status(max_age_ms=ttl.get("vram_ms", 0))
+
+
+def _build_health(components: dict) -> HealthResponse:
+    """Query GPU state for the /health response."""
+    gpu_info = components["gpu_info"]
+    vram_status = _vram_status(components)
+
+    return HealthResponse(
+        status="healthy",
+        version=VERSION,
+        gpu_available=gpu_info["cuda_available"],
+        gpu_name=gpu_info.get("name"),
+        vram_total_mb=vram_status.total_mb if vram_status.cuda_available else None,
+        vram_free_mb=vram_status.free_mb if vram_status.cuda_available else None,
+    )
+
+
+def _build_status_static(gpu_info: dict, config: dict, storage_path: Path) -> dict:
+    """Build the /status fields that are fixed once the app has started."""
+    return {
+        "gpu": {
+            "name": gpu_info.get("name", "Unknown"),
+            "cuda_available": gpu_info["cuda_available"],
+            "device_id": gpu_info.get("device_id", 0),
+        },
+        "hardware_profile": config.get("hardware_profile", "unknown"),
+        "storage_path": str(storage_path),
+    }
+
+
+def _build_status(components: dict) -> StatusResponse:
+    """Query GPU state and job stats for the /status response."""
+    vram_status = _vram_status(components)
+    job_stats = components["job_queue"].get_stats()
+
+    return StatusResponse(
+        **components["status_static"],
+        vram={
+            "total_mb": vram_status.total_mb,
+            "used_mb": vram_status.used_mb,
+            "free_mb": vram_status.free_mb,
+            "utilization_percent": vram_status.utilization_percent,
+        },
+        job_queue=job_stats,
+    )
+
+
+def _add_cors(app: FastAPI, config_path: Optional[Path]) -> None:
+    """
+    Add CORS middleware configured from the api.cors config section.
+
+    Middleware must be in place before startup, so this reads the config
+    when the app is built rather than in the lifespan handler.
+
+    Args:
+        app: Application to add the middleware to
+        config_path: Path to config YAML file (optional)
+    """
+    cors = {**CORS_DEFAULTS, **load_config(config_path).get("api", {}).get("cors", {})}
+    app.add_middleware(CORSMiddleware, **cors)
+
+
+class _SkipPaths:
+    """ASGI middleware that bypasses a wrapped middleware for some paths."""
+
+    def __init__(self, app, middleware_cls, paths: list[str], **kwargs):
+        self.app = app
+        self.wrapped = middleware_cls(app, **kwargs)
+        self.paths = [re.compile(path) for path in paths]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and any(p.match(scope["path"]) for p in self.paths):
+            await self.app(scope, receive, send)
+        else:
+            await self.wrapped(scope, receive, send)
+
+
+def _add_compression(app: FastAPI) -> None:
+    """
+    Compress JSON responses, preferring Brotli when brotli-asgi is installed.
+
+    Brotli falls back to gzip for clients that don't accept br.
+
+    Args:
+        app: Application to add the middleware to
+    """
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        app.add_middleware(
+            _SkipPaths,
+            middleware_cls=GZipMiddleware,
+            paths=UNCOMPRESSED_PATHS,
+            minimum_size=COMPRESSION_MIN_BYTES,
+            compresslevel=5,
+        )
+        return
+
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=COMPRESSION_MIN_BYTES,
+        gzip_fallback=True,
+        excluded_handlers=UNCOMPRESSED_PATHS,
+    )
+
+
+def create_app(
+    config_path: Optional[Path] = None,
+    storage_path: Path = Path("storage"),
+) -> FastAPI:
+    """
+    Create and configure FastAPI application.
+
+    Components are initialized when the app starts (see _lifespan), not
+    here, so building the app is cheap and each worker process loads its
+    own state.
+
+    Args:
+        config_path: Path to config YAML file (optional)
+        storage_path: Base storage directory
+
+    Returns:
+        Configured FastAPI application
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Blocking work from routes (model inference, file I/O) runs here
+        executor = ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 1) * 2, thread_name_prefix="avatar-api"
+        )
+        asyncio.get_running_loop().set_default_executor(executor)
+
+        try:
+            app.state.components = await _init_components(config_path, storage_path)
+            app.state.status_cache = {"health": _TTLCache(), "status": _TTLCache()}
+            yield
+        finally:
+            if app.state.components is not None:
+                await app.state.components["avatar_batcher"].stop()
+            executor.shutdown(wait=False)
+
+    # Create app
+    app = FastAPI(
+        title="Avatar Pipeline API",
+        description="REST API for AI avatar video generation with voice cloning and lip-sync",
+        version=VERSION,
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+    )
+    app.state.components = None
+
+    # Add CORS middleware
+    _add_cors(app, config_path)
+
+    # Compress larger JSON payloads (job lists, batch status)
+    _add_compression(app)
+
     # Register routes
     app.include_router(jobs.router)
     app.include_router(voice.router)
     app.include_router(avatar.router)
     app.include_router(video.router)
 
+    def get_cache_ttl(components: dict, endpoint: str) -> float:
+        # Snapshot TTL in seconds (0 = always recompute)
+        ttl = components["config"].get("api", {}).get("status_cache_ttl", {})
+        return ttl.get(f"{endpoint}_ms", 0) / 1000
+
     # Health check endpoint
     @app.get("/health", response_model=HealthResponse, tags=["system"])
-    async def health_check():
+    async def health_check(
+        request: Request, components: dict = Depends(get_components)
+    ):
         """
         Health check endpoint.
 
         Returns:
             System health status
         """
-        if _app_state is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-
-        gpu_info = _app_state["gpu_info"]
-        vram_manager = _app_state["vram_manager"]
-        vram_status = vram_manager.get_status()
-
-        return HealthResponse(
-            status="healthy",
-            version=VERSION,
-            gpu_available=gpu_info["cuda_available"],
-            gpu_name=gpu_info.get("name"),
-            vram_total_mb=vram_status.total_mb if vram_status.cuda_available else None,
-            vram_free_mb=vram_status.free_mb if vram_status.cuda_available else None,
+        return await _get_cached(
+            request.app.state.status_cache["health"],
+            get_cache_ttl(components, "health"),
+            lambda: _build_health(components),
         )
 
     # System status endpoint
-    @app.get("/status", response_model=StatusResponse, tags=["system"])
-    async def get_status():
+    @app.get(
+        "/status",
+        response_model=StatusResponse,
+        responses={304: {"description": "Unchanged since If-None-Match"}},
+        tags=["system"],
+    )
+    async def get_status(
+        request: Request,
+        components: dict = Depends(get_components),
+        if_none_match: Optional[str] = Header(None),
+    ):
         """
         Get system status.
 
         Returns:
-            Detailed system status including GPU, VRAM, and job queue
+            Detailed system status including GPU, VRAM, and job queue,
+            with an ETag (304 if it matches If-None-Match)
         """
-        if _app_state is None:
-            raise HTTPException(status_code=503, detail="Service not initialized")
-
-        gpu_info = _app_state["gpu_info"]
-        vram_manager = _app_state["vram_manager"]
-        job_queue = _app_state["job_queue"]
-        config = _app_state["config"]
-        storage_path = _app_state["storage_path"]
-
-        vram_status = vram_manager.get_status()
-        job_stats = job_queue.get_stats()
-
-        return StatusResponse(
-            gpu={
-                "name": gpu_info.get("name", "Unknown"),
-                "cuda_available": gpu_info["cuda_available"],
-                "device_id": gpu_info.get("device_id", 0),
-            },
-            vram={
-                "total_mb": vram_status.total_mb,
-                "used_mb": vram_status.used_mb,
-                "free_mb": vram_status.free_mb,
-                "utilization_percent": vram_status.utilization_percent,
-            },
-            hardware_profile=config.get("hardware_profile", "unknown"),
-            job_queue=job_stats,
-            storage_path=str(storage_path),
+        status = await _get_cached(
+            request.app.state.status_cache["status"],
+            get_cache_ttl(components, "status"),
+            lambda: _build_status(components),
         )
+        return etag_response(status, if_none_match)
 
     # Root endpoint
     @app.get("/", tags=["system"])
@@ -212,8 +459,29 @@ def create_app(
     return app
 
 
-# Default app instance
-app = create_app()
+_default_app: Optional[FastAPI] = None
+
+
+def __getattr__(name: str):
+    """
+    Build the default app instance on first access.
+
+    Deferred so importing this module stays cheap, and so each uvicorn
+    worker process initializes its own state. Options come from the
+    AVATAR_CONFIG and AVATAR_STORAGE environment variables.
+    """
+    global _default_app
+
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if _default_app is None:
+        config_path = os.environ.get(CONFIG_ENV)
+        _default_app = create_app(
+            config_path=Path(config_path) if config_path else None,
+            storage_path=Path(os.environ.get(STORAGE_ENV, "storage")),
+        )
+    return _default_app
 
 
 if __name__ == "__main__":
@@ -225,11 +493,15 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
-    # Run server
+    # Auto-reload is for development only and forces a single worker
+    dev_mode = os.environ.get("AVATAR_DEV") == "1"
+
+    # Run server (uvicorn[standard] selects uvloop and httptools)
     uvicorn.run(
-        "main:app",
+        APP_IMPORT_STRING,
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=dev_mode,
+        workers=None if dev_mode else int(os.environ.get("AVATAR_WORKERS", "1")),
         log_level="info",
     )
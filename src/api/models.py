@@ -4,9 +4,24 @@ Pydantic models for API request/response validation.
 Defines request and response schemas for all API endpoints.
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound on jobs in a list response (matches the GET /jobs limit)
+MAX_JOB_LIST_ITEMS = 1000
+
+
+class ResponseModel(BaseModel):
+    """
+    Base for response models.
+
+    Responses are built once from trusted data and never modified, so they
+    are frozen (safe to share from the status caches) and reject unknown
+    fields to catch typos in route code.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 # Pipeline models
@@ -22,7 +37,7 @@ class PipelineRequest(BaseModel):
     cleanup_intermediates: bool = Field(True, description="Remove intermediate files")
 
 
-class PipelineResponse(BaseModel):
+class PipelineResponse(ResponseModel):
     """Response model for pipeline execution."""
 
     job_id: str = Field(..., description="Job ID for async tracking")
@@ -32,7 +47,7 @@ class PipelineResponse(BaseModel):
 
 
 # Job models
-class JobResponse(BaseModel):
+class JobResponse(ResponseModel):
     """Response model for job status."""
 
     job_id: str
@@ -47,15 +62,21 @@ class JobResponse(BaseModel):
     error: Optional[str] = None
 
 
-class JobListResponse(BaseModel):
+class JobListResponse(ResponseModel):
     """Response model for job listing."""
 
-    jobs: list[JobResponse]
+    jobs: Annotated[list[JobResponse], Field(max_length=MAX_JOB_LIST_ITEMS)]
     total: int
     status_filter: Optional[str] = None
 
 
-class JobStatsResponse(BaseModel):
+class JobBatchRequest(BaseModel):
+    """Request model for looking up several jobs at once."""
+
+    job_ids: list[str] = Field(..., description="Job IDs to query", min_length=1, max_length=500)
+
+
+class JobStatsResponse(ResponseModel):
     """Response model for job statistics."""
 
     total: int
@@ -82,7 +103,16 @@ class VoiceSynthesizeRequest(BaseModel):
     output_filename: Optional[str] = Field(None, description="Output filename (optional)")
 
 
-class VoiceProfileResponse(BaseModel):
+class VoiceSynthesizeResponse(ResponseModel):
+    """Response model for speech synthesis."""
+
+    success: bool
+    audio_path: str
+    duration_seconds: float
+    processing_time_seconds: float
+
+
+class VoiceProfileResponse(ResponseModel):
     """Response model for voice profile."""
 
     profile_id: str
@@ -92,7 +122,7 @@ class VoiceProfileResponse(BaseModel):
     reference_audio_url: Optional[str] = None
 
 
-class VoiceListResponse(BaseModel):
+class VoiceListResponse(ResponseModel):
     """Response model for voice profile listing."""
 
     profiles: list[VoiceProfileResponse]
@@ -105,12 +135,14 @@ class AvatarGenerateRequest(BaseModel):
 
     prompt: str = Field(..., description="Generation prompt", min_length=1, max_length=500)
     negative_prompt: str = Field("", description="Negative prompt")
-    aspect_ratio: str = Field("16:9", description="Image aspect ratio")
+    aspect_ratio: str = Field(
+        "16:9", description="Image aspect ratio (16:9, 9:16 or 1:1)"
+    )
     seed: Optional[int] = Field(None, description="Random seed")
     output_filename: Optional[str] = Field(None, description="Output filename (optional)")
 
 
-class AvatarProfileResponse(BaseModel):
+class AvatarProfileResponse(ResponseModel):
     """Response model for avatar profile."""
 
     profile_id: str
@@ -122,14 +154,14 @@ class AvatarProfileResponse(BaseModel):
     image_url: Optional[str] = None
 
 
-class AvatarListResponse(BaseModel):
+class AvatarListResponse(ResponseModel):
     """Response model for avatar profile listing."""
 
     profiles: list[AvatarProfileResponse]
     total: int
 
 
-class FaceDetectionResponse(BaseModel):
+class FaceDetectionResponse(ResponseModel):
     """Response model for face detection."""
 
     detected: bool
@@ -159,9 +191,34 @@ class VideoEncodeRequest(BaseModel):
     output_filename: Optional[str] = Field(None, description="Output filename (optional)")
     preset: str = Field("medium", description="Encoding preset")
     crf: int = Field(23, description="CRF quality value", ge=0, le=51)
+    stream: bool = Field(
+        False, description="Return the encoded MP4 in the response body"
+    )
+
+
+class VideoLipSyncResponse(ResponseModel):
+    """Response model for lip-sync generation."""
+
+    success: bool
+    video_path: str
+    duration_seconds: float
+    frame_count: int
+    fps: float
+    resolution: dict
+    processing_time_seconds: float
+
+
+class VideoEncodeResponse(ResponseModel):
+    """Response model for video encoding."""
+
+    success: bool
+    output_path: str
+    file_size_bytes: int
+    duration_seconds: float
+    processing_time_seconds: float
 
 
-class VideoInfoResponse(BaseModel):
+class VideoInfoResponse(ResponseModel):
     """Response model for video information."""
 
     file_path: str
@@ -174,7 +231,7 @@ class VideoInfoResponse(BaseModel):
 
 
 # System models
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseModel):
     """Response model for health check."""
 
     status: str
@@ -185,7 +242,7 @@ class HealthResponse(BaseModel):
     vram_free_mb: Optional[int] = None
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(ResponseModel):
     """Response model for system status."""
 
     gpu: dict
@@ -196,7 +253,7 @@ class StatusResponse(BaseModel):
 
 
 # Error models
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Response model for errors."""
 
     error: str
@@ -4,58 +4,52 @@ Avatar API endpoints.
 Provides endpoints for avatar generation, face detection, and profile management.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
-
-from ...avatar import AvatarProfileManager, MediaPipeFaceDetector, SDXLAvatarGenerator
-from ...utils import VRAMManager
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+
+from ...avatar import AvatarProfileManager, FaceDetectionResult, MediaPipeFaceDetector
+from ...service import AvatarService
+from ...utils import decode_rgb
+from ..batching import MicroBatcher
+from ..deps import (
+    get_avatar_batcher,
+    get_avatar_profile_manager,
+    get_detect_cache,
+    get_face_detector,
+)
+from ..files import output_path
 from ..models import AvatarGenerateRequest, AvatarListResponse, AvatarProfileResponse, FaceDetectionResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/avatar", tags=["avatar"])
 
-# Global components (injected by main app)
-_config: Optional[dict] = None
-_vram_manager: Optional[VRAMManager] = None
-_profile_manager: Optional[AvatarProfileManager] = None
-_face_detector: Optional[MediaPipeFaceDetector] = None
-
-
-def set_components(
-    config: dict,
-    vram_manager: VRAMManager,
-    profile_manager: AvatarProfileManager,
-    face_detector: MediaPipeFaceDetector,
-) -> None:
-    """Set global avatar components."""
-    global _config, _vram_manager, _profile_manager, _face_detector
-    _config = config
-    _vram_manager = vram_manager
-    _profile_manager = profile_manager
-    _face_detector = face_detector
+# Detection responses kept for re-uploads of the same image
+DETECT_CACHE_SIZE = 256
 
 
 @router.get("/profiles", response_model=AvatarListResponse)
-async def list_avatar_profiles():
+async def list_avatar_profiles(
+    profile_manager: AvatarProfileManager = Depends(get_avatar_profile_manager),
+):
     """
     List all avatar profiles.
 
     Returns:
         List of available avatar profiles
     """
-    if _profile_manager is None:
-        raise HTTPException(status_code=500, detail="Avatar system not initialized")
-
     try:
-        profiles = _profile_manager.list_profiles()
+        profiles = await asyncio.to_thread(profile_manager.list_profiles)
 
+        # Profiles are read from our own metadata files; skip revalidation
         profile_responses = [
-            AvatarProfileResponse(
+            AvatarProfileResponse.model_construct(
                 profile_id=p.profile_id,
                 name=p.name,
                 aspect_ratio=p.aspect_ratio,
@@ -77,13 +71,69 @@ async def list_avatar_profiles():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def start_generate_batcher(
+    service: AvatarService, gpu_lock: asyncio.Semaphore, config: dict, outputs_dir: Path
+) -> MicroBatcher:
+    """
+    Start the batcher that coalesces concurrent /avatar/generate requests.
+
+    Requests with the same aspect ratio arriving within the batching
+    window share one SDXL pass, up to avatar.sdxl.max_batch_size.
+
+    Args:
+        service: Service holding the generator
+        gpu_lock: Semaphore admitting GPU model work
+        config: Pipeline configuration
+        outputs_dir: Directory for requested output filenames
+
+    Returns:
+        Running batcher (stop it on shutdown)
+    """
+
+    async def run_batch(requests: list[AvatarGenerateRequest]) -> list:
+        async with gpu_lock:
+            return await asyncio.to_thread(
+                service.generator.generate_batch,
+                [r.prompt for r in requests],
+                negative_prompts=[r.negative_prompt for r in requests],
+                aspect_ratio=requests[0].aspect_ratio,
+                seeds=[r.seed for r in requests],
+                output_paths=[
+                    output_path(outputs_dir, r.output_filename, "")
+                    if r.output_filename
+                    else None  # Auto-generate
+                    for r in requests
+                ],
+            )
+
+    sdxl_config = config.get("avatar", {}).get("sdxl", {})
+
+    def batch_key(request: AvatarGenerateRequest) -> tuple:
+        # Requests that skip guidance can't share a pass with ones that don't
+        skips_cfg = sdxl_config.get("skip_cfg_without_negative", False)
+        return request.aspect_ratio, skips_cfg and not request.negative_prompt
+
+    batcher = MicroBatcher(
+        run_batch,
+        key=batch_key,
+        max_batch=sdxl_config.get("max_batch_size", 1),
+        window_ms=config.get("api", {}).get("batching", {}).get("window_ms", 30),
+    )
+    batcher.start()
+    return batcher
+
+
 @router.post("/generate", response_model=AvatarProfileResponse, status_code=201)
-async def generate_avatar(request: AvatarGenerateRequest):
+async def generate_avatar(
+    request: AvatarGenerateRequest,
+    batcher: MicroBatcher = Depends(get_avatar_batcher),
+):
     """
     Generate avatar image from text prompt.
 
     Creates a photorealistic portrait image using SDXL 1.5.
     Automatically detects face and creates an avatar profile.
+    Concurrent requests may be generated together in one batch.
 
     Args:
         request: Generation parameters
@@ -95,33 +145,11 @@ async def generate_avatar(request: AvatarGenerateRequest):
         400: Invalid input
         500: Generation failed
     """
-    if None in (_config, _vram_manager, _profile_manager):
-        raise HTTPException(status_code=500, detail="Avatar system not initialized")
-
     try:
-        # Determine output path
-        if request.output_filename:
-            output_path = Path("storage") / "outputs" / request.output_filename
-        else:
-            output_path = None  # Auto-generate
-
         logger.info(f"Generating avatar: {request.prompt}")
 
-        # Initialize generator
-        generator = SDXLAvatarGenerator(
-            config=_config.get("avatar", {}).get("sdxl", {}),
-            vram_manager=_vram_manager,
-            profile_manager=_profile_manager,
-        )
-
         # Generate avatar
-        result = generator.generate(
-            prompt=request.prompt,
-            negative_prompt=request.negative_prompt,
-            aspect_ratio=request.aspect_ratio,
-            seed=request.seed,
-            output_path=output_path,
-        )
+        result = await batcher.submit(request)
 
         if not result.success:
             raise HTTPException(status_code=500, detail=result.error)
@@ -145,15 +173,44 @@ async def generate_avatar(request: AvatarGenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _content_key(data: bytes) -> bytes:
+    """Hash uploaded bytes for the detection cache."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _detect_and_validate(face_detector: MediaPipeFaceDetector, data: bytes) -> tuple:
+    """Decode an image, detect a face, and check it for lip-sync."""
+    image = decode_rgb(data)
+    if image is None:
+        detection = FaceDetectionResult(
+            detected=False,
+            face_region=None,
+            landmarks=None,
+            confidence=0.0,
+            error="Failed to decode image",
+        )
+    else:
+        detection = face_detector.detect_rgb(image)
+
+    if not detection.detected:
+        return detection, False, "No face detected"
+
+    is_valid, validation_message = face_detector.validate_for_lipsync(detection)
+    return detection, is_valid, validation_message
+
+
 @router.post("/detect", response_model=FaceDetectionResponse)
 async def detect_face(
     image: UploadFile = File(..., description="Image file to analyze"),
+    face_detector: MediaPipeFaceDetector = Depends(get_face_detector),
+    detect_cache: OrderedDict = Depends(get_detect_cache),
 ):
     """
     Detect and validate face in uploaded image.
 
     Detects faces using MediaPipe and validates suitability for lip-sync.
-    Returns face region, landmarks, and validation results.
+    Returns face region, landmarks, and validation results. Results are
+    cached by image content, so re-uploading an image skips detection.
 
     Args:
         image: Image file upload
@@ -165,52 +222,46 @@ async def detect_face(
         400: Invalid input
         500: Detection failed
     """
-    if _face_detector is None:
-        raise HTTPException(status_code=500, detail="Face detector not initialized")
-
     try:
         # Validate file
         if not image.filename:
             raise HTTPException(status_code=400, detail="No file uploaded")
 
-        # Save to temporary file
-        import tempfile
-
-        suffix = Path(image.filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            content = await image.read()
-            tmp_file.write(content)
-            tmp_path = Path(tmp_file.name)
-
-        logger.info(f"Detecting face in: {image.filename}")
-
-        try:
-            # Detect face
-            detection = _face_detector.detect(tmp_path)
-
-            # Validate for lip-sync if detected
-            is_valid = False
-            validation_message = "No face detected"
-
-            if detection.detected:
-                is_valid, validation_message = _face_detector.validate_for_lipsync(
-                    detection
-                )
-
-            return FaceDetectionResponse(
-                detected=detection.detected,
-                confidence=detection.confidence,
-                face_region=detection.face_region,
-                landmarks=detection.landmarks,
-                is_valid_for_lipsync=is_valid,
-                validation_message=validation_message,
-                error=detection.error,
-            )
+        # Decoded in memory; no temp file needed
+        data = await image.read()
+
+        key = await asyncio.to_thread(_content_key, data)
+        cached = detect_cache.get(key)
+        if cached is not None:
+            detect_cache.move_to_end(key)
+            logger.info("Face detection cache hit: %s", image.filename)
+            return cached
+
+        logger.info("Detecting face in: %s", image.filename)
+
+        # Decode, detect and validate face off the event loop
+        detection, is_valid, validation_message = await asyncio.to_thread(
+            _detect_and_validate, face_detector, data
+        )
+
+        detection_data = detection.to_dict()
+        response = FaceDetectionResponse(
+            detected=detection.detected,
+            confidence=detection.confidence,
+            face_region=detection_data["face_region"],
+            landmarks=detection_data["landmarks"],
+            is_valid_for_lipsync=is_valid,
+            validation_message=validation_message,
+            error=detection.error,
+        )
+
+        # Don't cache failures; they may be transient
+        if detection.error is None:
+            detect_cache[key] = response
+            if len(detect_cache) > DETECT_CACHE_SIZE:
+                detect_cache.popitem(last=False)
 
-        finally:
-            # Cleanup temp file
-            if tmp_path.exists():
-                tmp_path.unlink()
+        return response
 
     except HTTPException:
         raise
@@ -4,30 +4,138 @@ Job management API endpoints.
 Provides endpoints for job submission, status checking, and cancellation.
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
-
-from ...orchestration import JobQueue, JobStatus
-from ..models import JobListResponse, JobResponse, JobStatsResponse, PipelineRequest, PipelineResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from ...orchestration import Job, JobQueue, JobStatus
+from ..deps import get_job_queue
+from ..etag import etag_response
+from ..models import (
+    MAX_JOB_LIST_ITEMS,
+    JobBatchRequest,
+    JobListResponse,
+    JobResponse,
+    JobStatsResponse,
+    PipelineRequest,
+    PipelineResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
-# Global job queue (injected by main app)
-_job_queue: Optional[JobQueue] = None
+# Long-poll and event-stream waiters per job ID, woken when the queue saves that job
+_waiters: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+# Re-read interval for changes written by other processes (e.g. CLI workers)
+WAIT_RECHECK_SECONDS = 1.0
+
+# Progress granularity for long-poll change detection
+PROGRESS_BUCKETS = 20
+
+# Comment line sent on idle event streams so proxies keep them open
+SSE_HEARTBEAT_SECONDS = 15.0
+
+TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+_VALID_JOB_STATUSES = ", ".join(s.value for s in JobStatus)
+
+# Response models of recently served job revisions (see _to_response)
+RESPONSE_CACHE_SIZE = 4096
+_responses: OrderedDict[tuple, JobResponse] = OrderedDict()
+
+
+def watch_queue(queue: JobQueue) -> None:
+    """Wake waiting requests whenever the queue saves a job."""
+    queue.add_listener(_notify_waiters)
+
+
+def _notify_waiters(job: Job) -> None:
+    """Wake requests waiting on this job (thread-safe)."""
+    for loop, event in list(_waiters.get(job.job_id, ())):
+        loop.call_soon_threadsafe(event.set)
 
 
-def set_job_queue(queue: JobQueue) -> None:
-    """Set the global job queue instance."""
-    global _job_queue
-    _job_queue = queue
+@contextmanager
+def _job_waiter(job_id: str) -> Iterator[asyncio.Event]:
+    """Register an event that is set whenever the job is saved."""
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    _waiters.setdefault(job_id, set()).add(waiter)
+
+    try:
+        yield waiter[1]
+    finally:
+        waiters = _waiters.get(job_id)
+        if waiters is not None:
+            waiters.discard(waiter)
+            if not waiters:
+                del _waiters[job_id]
+
+
+async def _wait_for_save(event: asyncio.Event, timeout: float) -> None:
+    """Wait for an in-process save, or the timeout to recheck external writers."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+def _job_etag(job: Job) -> str:
+    """ETag that changes with job status or a progress step."""
+    bucket = int(job.progress * PROGRESS_BUCKETS)
+    return f'"{job.status.value}-{bucket}"'
+
+
+def _to_response(job: Job) -> JobResponse:
+    """
+    Convert a Job to its API response model.
+
+    Responses are frozen, so one is built per saved job revision and
+    reused while the job is unchanged. Status is part of the key in case
+    two processes save the same revision. Jobs without a revision (never
+    saved, or saved by older code) are always rebuilt.
+    """
+    key = (job.job_id, job.revision, job.status)
+    response = _responses.get(key) if job.revision else None
+    if response is not None:
+        _responses.move_to_end(key)
+        return response
+
+    # Job fields are already typed, so skip validation
+    response = JobResponse.model_construct(
+        job_id=job.job_id,
+        status=job.status.value,
+        job_type=job.job_type.value,
+        progress=job.progress,
+        stage=job.stage,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        result=job.result,
+        error=job.error,
+    )
+
+    if job.revision:
+        _responses[key] = response
+        if len(_responses) > RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
+
+    return response
 
 
 @router.post("", response_model=PipelineResponse, status_code=202)
-async def submit_job(request: PipelineRequest):
+async def submit_job(
+    request: PipelineRequest,
+    job_queue: JobQueue = Depends(get_job_queue),
+):
     """
     Submit a new pipeline job for async execution.
 
@@ -44,9 +152,6 @@ async def submit_job(request: PipelineRequest):
         The job will be processed asynchronously. Use GET /jobs/{job_id}
         to check status and retrieve results.
     """
-    if _job_queue is None:
-        raise HTTPException(status_code=500, detail="Job queue not initialized")
-
     try:
         from ...orchestration import JobType
 
@@ -62,9 +167,11 @@ async def submit_job(request: PipelineRequest):
         }
 
         # Submit job
-        job_id = _job_queue.submit(JobType.FULL_PIPELINE, params)
+        job_id = await asyncio.to_thread(
+            job_queue.submit, JobType.FULL_PIPELINE, params
+        )
 
-        logger.info(f"Pipeline job submitted: {job_id}")
+        logger.info("Pipeline job submitted: %s", job_id)
 
         return PipelineResponse(
             job_id=job_id,
@@ -81,7 +188,10 @@ async def submit_job(request: PipelineRequest):
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of jobs"),
+    limit: int = Query(
+        100, ge=1, le=MAX_JOB_LIST_ITEMS, description="Maximum number of jobs"
+    ),
+    job_queue: JobQueue = Depends(get_job_queue),
 ):
     """
     List all jobs, optionally filtered by status.
@@ -93,9 +203,6 @@ async def list_jobs(
     Returns:
         List of jobs matching criteria
     """
-    if _job_queue is None:
-        raise HTTPException(status_code=500, detail="Job queue not initialized")
-
     try:
         # Parse status filter
         status_filter = None
@@ -105,29 +212,17 @@ async def list_jobs(
             except ValueError:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Invalid status: {status}. Valid values: "
-                    f"{', '.join([s.value for s in JobStatus])}",
+                    detail=f"Invalid status: {status}. "
+                    f"Valid values: {_VALID_JOB_STATUSES}",
                 )
 
         # Get jobs
-        jobs = _job_queue.list_jobs(status=status_filter, limit=limit)
+        jobs = await asyncio.to_thread(
+            job_queue.list_jobs, status=status_filter, limit=limit
+        )
 
         # Convert to response models
-        job_responses = [
-            JobResponse(
-                job_id=job.job_id,
-                status=job.status.value,
-                job_type=job.job_type.value,
-                progress=job.progress,
-                stage=job.stage,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-                result=job.result,
-                error=job.error,
-            )
-            for job in jobs
-        ]
+        job_responses = [_to_response(job) for job in jobs]
 
         return JobListResponse(
             jobs=job_responses,
@@ -142,19 +237,39 @@ async def list_jobs(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=list[JobResponse])
+async def get_job_statuses(
+    request: JobBatchRequest,
+    job_queue: JobQueue = Depends(get_job_queue),
+):
+    """
+    Get status of several jobs in one request.
+
+    Args:
+        request: Job IDs to query
+
+    Returns:
+        Status of each job found, in request order (unknown IDs are omitted)
+    """
+    try:
+        jobs = await asyncio.to_thread(job_queue.get_many, request.job_ids)
+        return [_to_response(job) for job in jobs.values()]
+
+    except Exception as e:
+        logger.error(f"Failed to get job statuses: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/stats", response_model=JobStatsResponse)
-async def get_job_stats():
+async def get_job_stats(job_queue: JobQueue = Depends(get_job_queue)):
     """
     Get job queue statistics.
 
     Returns:
         Job counts by status
     """
-    if _job_queue is None:
-        raise HTTPException(status_code=500, detail="Job queue not initialized")
-
     try:
-        stats = _job_queue.get_stats()
+        stats = await asyncio.to_thread(job_queue.get_stats)
         return JobStatsResponse(**stats)
 
     except Exception as e:
@@ -162,41 +277,36 @@ async def get_job_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: str):
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    responses={304: {"description": "Unchanged since If-None-Match"}},
+)
+async def get_job_status(
+    job_id: str,
+    if_none_match: Optional[str] = Header(None),
+    job_queue: JobQueue = Depends(get_job_queue),
+):
     """
     Get status of a specific job.
 
     Args:
         job_id: Job ID to query
+        if_none_match: ETag from a previous response
 
     Returns:
-        Job status and details
+        Job status and details, with an ETag (304 if it matches If-None-Match)
 
     Raises:
         404: Job not found
     """
-    if _job_queue is None:
-        raise HTTPException(status_code=500, detail="Job queue not initialized")
-
     try:
-        job = _job_queue.get(job_id)
+        job = job_queue.get(job_id)
 
         if job is None:
             raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
-        return JobResponse(
-            job_id=job.job_id,
-            status=job.status.value,
-            job_type=job.job_type.value,
-            progress=job.progress,
-            stage=job.stage,
-            created_at=job.created_at,
-            started_at=job.started_at,
-            completed_at=job.completed_at,
-            result=job.result,
-            error=job.error,
-        )
+        return etag_response(_to_response(job), if_none_match)
 
     except HTTPException:
         raise
@@ -205,8 +315,121 @@ async def get_job_status(job_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/{job_id}/wait",
+    response_model=JobResponse,
+    responses={304: {"description": "No change before timeout"}},
+)
+async def wait_for_job(
+    job_id: str,
+    response: Response,
+    timeout: float = Query(30.0, gt=0, le=60, description="Seconds to hold the request"),
+    if_none_match: Optional[str] = Header(None),
+    job_queue: JobQueue = Depends(get_job_queue),
+):
+    """
+    Long-poll a job until its state changes.
+
+    Returns as soon as the job's status or progress step differs from the
+    If-None-Match ETag, or the job is finished. Returns 304 if nothing
+    changed within the timeout.
+
+    Args:
+        job_id: Job ID to wait on
+        timeout: Maximum seconds to wait
+        if_none_match: ETag from the previous response
+
+    Returns:
+        Job status and details, with an ETag header
+
+    Raises:
+        404: Job not found
+    """
+    deadline = time.monotonic() + timeout
+
+    with _job_waiter(job_id) as saved:
+        while True:
+            # Clear before reading so an update in between isn't missed
+            saved.clear()
+            job = job_queue.get(job_id)
+
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+            etag = _job_etag(job)
+            if etag != if_none_match or job.status in TERMINAL_STATUSES:
+                response.headers["ETag"] = etag
+                return _to_response(job)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return Response(status_code=304, headers={"ETag": etag})
+
+            await _wait_for_save(saved, min(remaining, WAIT_RECHECK_SECONDS))
+
+
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_job_events(job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
+    """
+    Stream job state changes as Server-Sent Events.
+
+    Sends the current state immediately, then one event per status or
+    progress step change. The stream ends after the job finishes.
+
+    Args:
+        job_id: Job ID to follow
+
+    Returns:
+        text/event-stream of JobResponse JSON payloads
+
+    Raises:
+        404: Job not found
+    """
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return StreamingResponse(
+        _job_event_stream(job_queue, job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _job_event_stream(job_queue: JobQueue, job_id: str) -> AsyncIterator[str]:
+    """Yield SSE messages for a job until it finishes or disappears."""
+    last_etag = None
+    last_sent = time.monotonic()
+
+    with _job_waiter(job_id) as saved:
+        while True:
+            saved.clear()
+            job = job_queue.get(job_id)
+
+            if job is None:
+                return
+
+            etag = _job_etag(job)
+            if etag != last_etag:
+                yield f"id: {etag}\ndata: {_to_response(job).model_dump_json()}\n\n"
+                last_etag = etag
+                last_sent = time.monotonic()
+
+                if job.status in TERMINAL_STATUSES:
+                    return
+
+            elif time.monotonic() - last_sent >= SSE_HEARTBEAT_SECONDS:
+                yield ":ping\n\n"
+                last_sent = time.monotonic()
+
+            await _wait_for_save(saved, WAIT_RECHECK_SECONDS)
+
+
 @router.delete("/{job_id}", status_code=204)
-async def cancel_job(job_id: str):
+async def cancel_job(job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
     """
     Cancel a pending job.
 
@@ -217,27 +440,22 @@ async def cancel_job(job_id: str):
         404: Job not found
         400: Job cannot be cancelled (not pending)
     """
-    if _job_queue is None:
-        raise HTTPException(status_code=500, detail="Job queue not initialized")
-
     try:
-        job = _job_queue.get(job_id)
+        status, success = await asyncio.to_thread(job_queue.try_cancel, job_id)
 
-        if job is None:
+        if status is None:
             raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
-        if job.status != JobStatus.PENDING:
+        if status != JobStatus.PENDING:
             raise HTTPException(
                 status_code=400,
-                detail=f"Job cannot be cancelled: status is {job.status.value}",
+                detail=f"Job cannot be cancelled: status is {status.value}",
             )
 
-        success = _job_queue.cancel(job_id)
-
         if not success:
             raise HTTPException(status_code=500, detail="Failed to cancel job")
 
-        logger.info(f"Job cancelled: {job_id}")
+        logger.info("Job cancelled: %s", job_id)
 
     except HTTPException:
         raise
@@ -4,39 +4,39 @@ Video API endpoints.
 Provides endpoints for lip-sync generation and video encoding.
 """
 
+import asyncio
 import logging
 import time
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
-
-from ...utils import VRAMManager
-from ...video import EncodingConfig, FFmpegEncoder, LipSyncConfig, MuseTalkLipSync
-from ..models import VideoEncodeRequest, VideoInfoResponse, VideoLipSyncRequest
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+
+from ...service import AvatarService
+from ...video import EncodingConfig, FFmpegEncoder, LipSyncConfig
+from ..deps import get_gpu_lock, get_outputs_dir, get_service, get_video_encoder
+from ..files import missing_paths, output_path
+from ..models import (
+    VideoEncodeRequest,
+    VideoEncodeResponse,
+    VideoInfoResponse,
+    VideoLipSyncRequest,
+    VideoLipSyncResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/video", tags=["video"])
 
-# Global components (injected by main app)
-_config: Optional[dict] = None
-_vram_manager: Optional[VRAMManager] = None
-_encoder: Optional[FFmpegEncoder] = None
-
-
-def set_components(
-    config: dict, vram_manager: VRAMManager, encoder: FFmpegEncoder
-) -> None:
-    """Set global video components."""
-    global _config, _vram_manager, _encoder
-    _config = config
-    _vram_manager = vram_manager
-    _encoder = encoder
-
 
-@router.post("/lipsync", status_code=201)
-async def generate_lipsync(request: VideoLipSyncRequest):
+@router.post("/lipsync", response_model=VideoLipSyncResponse, status_code=201)
+async def generate_lipsync(
+    request: VideoLipSyncRequest,
+    service: AvatarService = Depends(get_service),
+    gpu_lock: asyncio.Semaphore = Depends(get_gpu_lock),
+    outputs_dir: Path = Depends(get_outputs_dir),
+):
     """
     Generate lip-synced video from image and audio.
 
@@ -53,54 +53,43 @@ async def generate_lipsync(request: VideoLipSyncRequest):
         404: Input files not found
         500: Generation failed
     """
-    if None in (_config, _vram_manager):
-        raise HTTPException(status_code=500, detail="Video system not initialized")
-
     try:
         # Validate input paths
         avatar_image = Path(request.avatar_image_path)
         audio_file = Path(request.audio_file_path)
+        missing = await missing_paths(avatar_image, audio_file)
 
-        if not avatar_image.exists():
+        if avatar_image in missing:
             raise HTTPException(
                 status_code=404, detail=f"Avatar image not found: {avatar_image}"
             )
 
-        if not audio_file.exists():
+        if audio_file in missing:
             raise HTTPException(
                 status_code=404, detail=f"Audio file not found: {audio_file}"
             )
 
-        # Determine output path
-        if request.output_filename:
-            output_path = Path("storage") / "outputs" / request.output_filename
-        else:
-            output_path = (
-                Path("storage") / "outputs" / f"lipsync_{int(time.time())}.mp4"
-            )
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Determine output path (nanoseconds so concurrent requests don't collide)
+        video_path = output_path(
+            outputs_dir, request.output_filename, f"lipsync_{time.time_ns()}.mp4"
+        )
 
         logger.info(f"Generating lip-sync video: {avatar_image} + {audio_file}")
 
-        # Initialize lip-sync engine
-        lipsync_engine = MuseTalkLipSync(
-            config=_config.get("video", {}).get("lipsync", {}),
-            vram_manager=_vram_manager,
-        )
-
         # Create lip-sync config
         lipsync_config = LipSyncConfig(quality=request.quality)
         if request.fps is not None:
             lipsync_config.fps = request.fps
 
         # Generate video
-        result = lipsync_engine.generate(
-            avatar_image=avatar_image,
-            audio_file=audio_file,
-            output_path=output_path,
-            config=lipsync_config,
-        )
+        async with gpu_lock:
+            result = await asyncio.to_thread(
+                service.lipsync.generate,
+                avatar_image=avatar_image,
+                audio_file=audio_file,
+                output_path=video_path,
+                config=lipsync_config,
+            )
 
         if not result.success:
             raise HTTPException(status_code=500, detail=result.error)
@@ -110,15 +99,15 @@ async def generate_lipsync(request: VideoLipSyncRequest):
             f"{result.frame_count} frames @ {result.fps}fps"
         )
 
-        return {
-            "success": True,
-            "video_path": str(result.video_path),
-            "duration_seconds": result.duration_seconds,
-            "frame_count": result.frame_count,
-            "fps": result.fps,
-            "resolution": {"width": result.resolution[0], "height": result.resolution[1]},
-            "processing_time_seconds": result.processing_time_seconds,
-        }
+        return VideoLipSyncResponse.model_construct(
+            success=True,
+            video_path=str(result.video_path),
+            duration_seconds=result.duration_seconds,
+            frame_count=result.frame_count,
+            fps=result.fps,
+            resolution={"width": result.resolution[0], "height": result.resolution[1]},
+            processing_time_seconds=result.processing_time_seconds,
+        )
 
     except HTTPException:
         raise
@@ -127,56 +116,72 @@ async def generate_lipsync(request: VideoLipSyncRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/encode", status_code=201)
-async def encode_video(request: VideoEncodeRequest):
+@router.post("/encode", response_model=VideoEncodeResponse, status_code=201)
+async def encode_video(
+    request: VideoEncodeRequest,
+    encoder: FFmpegEncoder = Depends(get_video_encoder),
+    outputs_dir: Path = Depends(get_outputs_dir),
+):
     """
     Encode or transcode video file.
 
     Re-encodes video with specified quality settings. Useful for
     compression, format conversion, or quality adjustments.
 
+    With stream=true the encoded MP4 is sent as the response body while
+    FFmpeg runs, instead of being saved to the outputs directory.
+
     Args:
         request: Encoding parameters
 
     Returns:
-        Encoded video information
+        Encoded video information, or the video itself if streaming
 
     Raises:
         404: Input video not found
         500: Encoding failed
     """
-    if _encoder is None:
-        raise HTTPException(status_code=500, detail="Video encoder not initialized")
-
     try:
         # Validate input path
         input_video = Path(request.input_video_path)
 
-        if not input_video.exists():
+        if await missing_paths(input_video):
             raise HTTPException(
                 status_code=404, detail=f"Input video not found: {input_video}"
             )
 
-        # Determine output path
-        if request.output_filename:
-            output_path = Path("storage") / "outputs" / request.output_filename
-        else:
-            output_path = (
-                Path("storage") / "outputs" / f"encoded_{int(time.time())}.mp4"
-            )
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Encoding video: {input_video} -> {output_path}")
-
         # Create encoding config
         encoding_config = EncodingConfig(
             preset=request.preset,
             crf=request.crf,
         )
 
+        if request.stream:
+            chunks = await asyncio.to_thread(
+                encoder.encode_streaming, input_video, encoding_config
+            )
+            filename = Path(
+                request.output_filename or f"encoded_{input_video.stem}.mp4"
+            )
+            return StreamingResponse(
+                chunks,
+                media_type="video/mp4",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{filename.name}"'
+                },
+            )
+
+        # Determine output path (nanoseconds so concurrent requests don't collide)
+        video_path = output_path(
+            outputs_dir, request.output_filename, f"encoded_{time.time_ns()}.mp4"
+        )
+
+        logger.info(f"Encoding video: {input_video} -> {video_path}")
+
         # Encode video
-        result = _encoder.encode(input_video, output_path, encoding_config)
+        result = await asyncio.to_thread(
+            encoder.encode, input_video, video_path, encoding_config
+        )
 
         if not result.success:
             raise HTTPException(status_code=500, detail=result.error)
@@ -186,13 +191,13 @@ async def encode_video(request: VideoEncodeRequest):
             f"({result.processing_time_seconds:.2f}s processing)"
         )
 
-        return {
-            "success": True,
-            "output_path": str(result.output_path),
-            "file_size_bytes": result.file_size_bytes,
-            "duration_seconds": result.duration_seconds,
-            "processing_time_seconds": result.processing_time_seconds,
-        }
+        return VideoEncodeResponse.model_construct(
+            success=True,
+            output_path=str(result.output_path),
+            file_size_bytes=result.file_size_bytes,
+            duration_seconds=result.duration_seconds,
+            processing_time_seconds=result.processing_time_seconds,
+        )
 
     except HTTPException:
         raise
@@ -201,8 +206,23 @@ async def encode_video(request: VideoEncodeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _probe_video(
+    encoder: FFmpegEncoder, video_file: Path
+) -> Optional[tuple[dict, int]]:
+    """Get video metadata and file size in one worker-thread call (None if missing)."""
+    try:
+        file_size_bytes = video_file.stat().st_size
+    except FileNotFoundError:
+        return None
+
+    return encoder.get_video_info(video_file), file_size_bytes
+
+
 @router.get("/info", response_model=VideoInfoResponse)
-async def get_video_info(video_path: str):
+async def get_video_info(
+    video_path: str,
+    encoder: FFmpegEncoder = Depends(get_video_encoder),
+):
     """
     Get video file information.
 
@@ -218,25 +238,22 @@ async def get_video_info(video_path: str):
         404: Video file not found
         500: Info extraction failed
     """
-    if _encoder is None:
-        raise HTTPException(status_code=500, detail="Video encoder not initialized")
-
     try:
         # Validate path
         video_file = Path(video_path)
 
-        if not video_file.exists():
+        logger.info("Getting video info: %s", video_file)
+
+        # Stat and probe video (both block)
+        probe = await asyncio.to_thread(_probe_video, encoder, video_file)
+
+        if probe is None:
             raise HTTPException(
                 status_code=404, detail=f"Video file not found: {video_file}"
             )
 
-        logger.info(f"Getting video info: {video_file}")
-
-        # Get video info
-        info = _encoder.get_video_info(video_file)
-
-        # Get file size
-        file_size_mb = video_file.stat().st_size / 1024 / 1024
+        info, file_size_bytes = probe
+        file_size_mb = file_size_bytes / (1024 * 1024)
 
         return VideoInfoResponse(
             file_path=str(video_file),
@@ -253,3 +270,34 @@ async def get_video_info(video_path: str):
     except Exception as e:
         logger.error(f"Failed to get video info: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/outputs/{filename}", response_class=FileResponse)
+async def download_output(
+    filename: str, outputs_dir: Path = Depends(get_outputs_dir)
+):
+    """
+    Download a generated file from the outputs directory.
+
+    The file is streamed with sendfile where the server supports it, so
+    large videos are not copied through Python.
+
+    Args:
+        filename: Name of a file in storage/outputs
+
+    Returns:
+        File contents
+
+    Raises:
+        400: Invalid filename
+        404: File not found
+    """
+    if Path(filename).name != filename or filename in (".", ".."):
+        raise HTTPException(status_code=400, detail=f"Invalid filename: {filename}")
+
+    output_file = outputs_dir / filename
+
+    if not await asyncio.to_thread(output_file.is_file):
+        raise HTTPException(status_code=404, detail=f"Output not found: {filename}")
+
+    return FileResponse(output_file, filename=filename)
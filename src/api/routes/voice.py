@@ -4,54 +4,50 @@ Voice API endpoints.
 Provides endpoints for voice cloning, synthesis, and profile management.
 """
 
+import asyncio
 import logging
-import tempfile
 import time
 from pathlib import Path
-from typing import Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-
-from ...utils import VRAMManager
-from ...voice import CoquiTTSSynthesizer, VoiceProfileManager, XTTSVoiceCloner
-from ..models import VoiceListResponse, VoiceProfileResponse, VoiceSynthesizeRequest
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+
+from ...service import AvatarService
+from ...voice import VoiceProfileManager
+from ..deps import (
+    get_gpu_lock,
+    get_outputs_dir,
+    get_service,
+    get_voice_profile_manager,
+)
+from ..files import output_path, save_upload
+from ..models import (
+    VoiceListResponse,
+    VoiceProfileResponse,
+    VoiceSynthesizeRequest,
+    VoiceSynthesizeResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 
-# Global components (injected by main app)
-_config: Optional[dict] = None
-_vram_manager: Optional[VRAMManager] = None
-_profile_manager: Optional[VoiceProfileManager] = None
-
-
-def set_components(
-    config: dict, vram_manager: VRAMManager, profile_manager: VoiceProfileManager
-) -> None:
-    """Set global voice components."""
-    global _config, _vram_manager, _profile_manager
-    _config = config
-    _vram_manager = vram_manager
-    _profile_manager = profile_manager
-
 
 @router.get("/profiles", response_model=VoiceListResponse)
-async def list_voice_profiles():
+async def list_voice_profiles(
+    profile_manager: VoiceProfileManager = Depends(get_voice_profile_manager),
+):
     """
     List all voice profiles.
 
     Returns:
         List of available voice profiles
     """
-    if _profile_manager is None:
-        raise HTTPException(status_code=500, detail="Voice system not initialized")
-
     try:
-        profiles = _profile_manager.list_profiles()
+        profiles = await asyncio.to_thread(profile_manager.list_profiles)
 
+        # Profiles are read from our own metadata files; skip revalidation
         profile_responses = [
-            VoiceProfileResponse(
+            VoiceProfileResponse.model_construct(
                 profile_id=p.profile_id,
                 name=p.name,
                 language=p.language,
@@ -76,6 +72,8 @@ async def clone_voice(
     audio_file: UploadFile = File(..., description="Reference audio file (WAV/MP3)"),
     name: str = Form(..., description="Profile name"),
     language: str = Form("en", description="Language code"),
+    service: AvatarService = Depends(get_service),
+    gpu_lock: asyncio.Semaphore = Depends(get_gpu_lock),
 ):
     """
     Clone a voice from uploaded audio file.
@@ -96,33 +94,22 @@ async def clone_voice(
         400: Invalid input
         500: Cloning failed
     """
-    if None in (_config, _vram_manager, _profile_manager):
-        raise HTTPException(status_code=500, detail="Voice system not initialized")
-
     try:
         # Validate audio file
         if not audio_file.filename:
             raise HTTPException(status_code=400, detail="No file uploaded")
 
         # Save uploaded file to temporary location
-        suffix = Path(audio_file.filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            content = await audio_file.read()
-            tmp_file.write(content)
-            tmp_path = Path(tmp_file.name)
+        tmp_path = await save_upload(audio_file)
 
         logger.info(f"Voice cloning: {audio_file.filename} -> {name}")
 
         try:
-            # Initialize cloner
-            cloner = XTTSVoiceCloner(
-                config=_config.get("voice", {}).get("xtts", {}),
-                vram_manager=_vram_manager,
-                profile_manager=_profile_manager,
-            )
-
             # Clone voice
-            result = cloner.clone_voice(tmp_path, name, language)
+            async with gpu_lock:
+                result = await asyncio.to_thread(
+                    service.cloner.clone_voice, tmp_path, name, language
+                )
 
             if not result.success:
                 raise HTTPException(status_code=500, detail=result.error)
@@ -139,8 +126,7 @@ async def clone_voice(
 
         finally:
             # Cleanup temp file
-            if tmp_path.exists():
-                tmp_path.unlink()
+            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
 
     except HTTPException:
         raise
@@ -149,8 +135,14 @@ async def clone_voice(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/synthesize", status_code=201)
-async def synthesize_speech(request: VoiceSynthesizeRequest):
+@router.post("/synthesize", response_model=VoiceSynthesizeResponse, status_code=201)
+async def synthesize_speech(
+    request: VoiceSynthesizeRequest,
+    profile_manager: VoiceProfileManager = Depends(get_voice_profile_manager),
+    service: AvatarService = Depends(get_service),
+    gpu_lock: asyncio.Semaphore = Depends(get_gpu_lock),
+    outputs_dir: Path = Depends(get_outputs_dir),
+):
     """
     Synthesize speech from text using a voice profile.
 
@@ -167,37 +159,28 @@ async def synthesize_speech(request: VoiceSynthesizeRequest):
         404: Voice profile not found
         500: Synthesis failed
     """
-    if None in (_config, _vram_manager, _profile_manager):
-        raise HTTPException(status_code=500, detail="Voice system not initialized")
-
     try:
         # Load voice profile
         try:
-            voice_profile = _profile_manager.load_profile(request.voice_profile_id)
+            voice_profile = profile_manager.load_profile(request.voice_profile_id)
         except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail=f"Voice profile not found: {request.voice_profile_id}",
             )
 
-        # Determine output path
-        if request.output_filename:
-            output_path = Path("storage") / "outputs" / request.output_filename
-        else:
-            output_path = Path("storage") / "outputs" / f"speech_{int(time.time())}.wav"
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Determine output path (nanoseconds so concurrent requests don't collide)
+        audio_path = output_path(
+            outputs_dir, request.output_filename, f"speech_{time.time_ns()}.wav"
+        )
 
         logger.info(f"Synthesizing speech with profile {voice_profile.profile_id}")
 
-        # Initialize synthesizer
-        synthesizer = CoquiTTSSynthesizer(
-            config=_config.get("voice", {}).get("tts", {}),
-            vram_manager=_vram_manager,
-        )
-
         # Synthesize speech
-        result = synthesizer.synthesize(request.text, voice_profile, output_path)
+        async with gpu_lock:
+            result = await asyncio.to_thread(
+                service.synthesizer.synthesize, request.text, voice_profile, audio_path
+            )
 
         if not result.success:
             raise HTTPException(status_code=500, detail=result.error)
@@ -207,12 +190,12 @@ async def synthesize_speech(request: VoiceSynthesizeRequest):
             f"({result.processing_time_seconds:.2f}s processing)"
         )
 
-        return {
-            "success": True,
-            "audio_path": str(result.audio_path),
-            "duration_seconds": result.duration_seconds,
-            "processing_time_seconds": result.processing_time_seconds,
-        }
+        return VoiceSynthesizeResponse.model_construct(
+            success=True,
+            audio_path=str(result.audio_path),
+            duration_seconds=result.duration_seconds,
+            processing_time_seconds=result.processing_time_seconds,
+        )
 
     except HTTPException:
         raise
@@ -11,7 +11,9 @@ from .interfaces import (
     AvatarGeneratorInterface,
     AvatarProfile,
     FaceDetectorInterface,
+    FaceRegion,
     GenerationResult,
+    Point,
 )
 from .profiles import AvatarProfileManager
 
@@ -20,6 +22,8 @@ __all__ = [
     "AvatarProfile",
     "GenerationResult",
     "FaceDetectionResult",
+    "FaceRegion",
+    "Point",
     "AvatarGeneratorInterface",
     "FaceDetectorInterface",
     # Implementations
@@ -5,36 +5,105 @@ Detects faces in images and validates them for lip-sync compatibility.
 """
 
 import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import cv2
 import numpy as np
 
-from .interfaces import FaceDetectionResult, FaceDetectorInterface
+from ..utils.image_io import load_rgb
+from .interfaces import FaceDetectionResult, FaceDetectorInterface, FaceRegion, Point
 
 logger = logging.getLogger(__name__)
 
+# Faces whose eye line is tilted more than this are rejected for lip-sync
+MAX_TILT_DEGREES = 15
+_TAN_MAX_TILT = math.tan(math.radians(MAX_TILT_DEGREES))
+
+# MediaPipe face detection keypoints, in output order
+KEYPOINT_NAMES = [
+    "right_eye",
+    "left_eye",
+    "nose_tip",
+    "mouth_center",
+    "right_ear",
+    "left_ear",
+]
+
+
+def _scale_points(points: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Scale relative (x, y) rows to int32 pixel coordinates, truncating like int()."""
+    return (points.reshape(-1, 2) * (width, height)).astype(np.int32)
+
+
+def _downscale(image: np.ndarray, max_side: int) -> np.ndarray:
+    """Shrink an image so its longer side is at most max_side (never enlarges)."""
+    height, width = image.shape[:2]
+    scale = max_side / max(height, width)
+    if scale >= 1:
+        return image
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def mesh_landmarks_as_dicts(mesh: dict) -> list[dict]:
+    """
+    Convert get_face_mesh() arrays to a list of {x, y, z} dicts.
+
+    For callers written against the older list-of-dicts mesh format.
+
+    Args:
+        mesh: Result of MediaPipeFaceDetector.get_face_mesh()
+
+    Returns:
+        One dict per landmark, with pixel x/y and depth z
+    """
+    return [
+        {"x": x, "y": y, "z": z}
+        for (x, y), z in zip(mesh["xy"].tolist(), mesh["z"].tolist(), strict=True)
+    ]
+
 
 class MediaPipeFaceDetector(FaceDetectorInterface):
     """
     MediaPipe face detection implementation.
 
     Uses MediaPipe Face Detection and Face Mesh for robust face detection
-    and landmark extraction suitable for lip-sync validation.
+    and landmark extraction suitable for lip-sync validation. The MediaPipe
+    graphs are built on first use and reused; one instance can be shared
+    across threads.
     """
 
-    def __init__(self, min_detection_confidence: float = 0.5):
+    def __init__(
+        self,
+        min_detection_confidence: float = 0.5,
+        max_detect_side: int = 640,
+        max_mesh_side: int = 1024,
+    ):
         """
         Initialize MediaPipe face detector.
 
+        MediaPipe resizes inputs to its own small model resolution and
+        returns coordinates relative to the image, so large images are
+        shrunk first and results are scaled to the original size.
+
         Args:
             min_detection_confidence: Minimum confidence for detection (0.0-1.0)
+            max_detect_side: Longest side images are shrunk to for detection
+            max_mesh_side: Longest side images are shrunk to for face mesh
         """
         self.min_detection_confidence = min_detection_confidence
+        self.max_detect_side = max_detect_side
+        self.max_mesh_side = max_mesh_side
         self._face_detection = None
         self._face_mesh = None
 
+        # MediaPipe graphs are stateful and not safe for concurrent use
+        self._lock = threading.Lock()
+
         logger.info("MediaPipe face detector initialized")
 
     def detect(self, image_path: Path) -> FaceDetectionResult:
@@ -47,30 +116,115 @@ class MediaPipeFaceDetector(FaceDetectorInterface):
         Returns:
             FaceDetectionResult with detection status and face data
         """
+        image_rgb, error = self._load_image(image_path)
+        if error is not None:
+            return self._failed(error)
+
+        return self.detect_rgb(image_rgb)
+
+    def detect_batch(self, image_paths: list[Path]) -> list[FaceDetectionResult]:
+        """
+        Detect faces in several images with one MediaPipe graph.
+
+        The next image is decoded in a background thread (decoders release
+        the GIL) while MediaPipe processes the current one.
+
+        Args:
+            image_paths: Image files
+
+        Returns:
+            FaceDetectionResult per image, in order
+        """
+        results = []
+        if not image_paths:
+            return results
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._load_image, image_paths[0])
+            for next_path in [*image_paths[1:], None]:
+                image_rgb, error = pending.result()
+                if next_path is not None:
+                    pending = executor.submit(self._load_image, next_path)
+
+                if error is not None:
+                    results.append(self._failed(error))
+                else:
+                    results.append(self.detect_rgb(image_rgb))
+
+        return results
+
+    def _load_image(
+        self, image_path: Path
+    ) -> tuple[Optional[np.ndarray], Optional[str]]:
+        """Load an image as RGB, returning (image, None) or (None, error)."""
         try:
             # Validate image exists
             if not image_path.exists():
                 raise FileNotFoundError(f"Image not found: {image_path}")
 
-            # Load image
-            image = cv2.imread(str(image_path))
-            if image is None:
+            # Load image (decoded straight to RGB, as MediaPipe expects)
+            image_rgb = load_rgb(image_path)
+            if image_rgb is None:
                 raise ValueError(f"Failed to load image: {image_path}")
 
-            # Convert BGR to RGB (MediaPipe expects RGB)
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            height, width, _ = image.shape
+            return image_rgb, None
+
+        except Exception as e:
+            logger.error(f"Face detection failed: {e}")
+            return None, str(e)
+
+    @staticmethod
+    def _failed(error: str) -> FaceDetectionResult:
+        """Build the result for a detection that could not run."""
+        return FaceDetectionResult(
+            detected=False,
+            face_region=None,
+            landmarks=None,
+            confidence=0.0,
+            error=error,
+        )
+
+    def detect_rgb(self, image_rgb: np.ndarray) -> FaceDetectionResult:
+        """
+        Detect face in an already decoded RGB image.
 
-            # Initialize MediaPipe Face Detection
-            if self._face_detection is None:
-                import mediapipe as mp
+        Args:
+            image_rgb: RGB image array, as returned by utils.decode_rgb
 
-                self._face_detection = mp.solutions.face_detection.FaceDetection(
-                    min_detection_confidence=self.min_detection_confidence
-                )
+        Returns:
+            FaceDetectionResult with detection status and face data
+        """
+        height, width = image_rgb.shape[:2]
+        return self._detect_scaled(
+            _downscale(image_rgb, self.max_detect_side), width, height
+        )
 
-            # Detect faces
-            results = self._face_detection.process(image_rgb)
+    def _detect_scaled(
+        self, image_rgb: np.ndarray, width: int, height: int
+    ) -> FaceDetectionResult:
+        """
+        Detect face in a (possibly downscaled) RGB image.
+
+        Args:
+            image_rgb: RGB image passed to MediaPipe
+            width: Width of the original image, in pixels
+            height: Height of the original image, in pixels
+
+        Returns:
+            FaceDetectionResult in original image coordinates
+        """
+        try:
+            with self._lock:
+                # Initialize MediaPipe Face Detection
+                if self._face_detection is None:
+                    import mediapipe as mp
+
+                    self._face_detection = mp.solutions.face_detection.FaceDetection(
+                        min_detection_confidence=self.min_detection_confidence
+                    )
+
+                # Detect faces (relative coordinates, so size-independent)
+                results = self._face_detection.process(image_rgb)
 
             if not results.detections:
                 logger.info("No face detected")
@@ -88,34 +242,31 @@ class MediaPipeFaceDetector(FaceDetectorInterface):
 
             # Extract bounding box
             bbox = detection.location_data.relative_bounding_box
-            face_region = {
-                "x": int(bbox.xmin * width),
-                "y": int(bbox.ymin * height),
-                "width": int(bbox.width * width),
-                "height": int(bbox.height * height),
-            }
+            face_region = FaceRegion(
+                int(bbox.xmin * width),
+                int(bbox.ymin * height),
+                int(bbox.width * width),
+                int(bbox.height * height),
+            )
 
-            # Extract key landmarks (eyes, nose, mouth, ears)
-            landmarks = {}
-            keypoint_names = [
-                "right_eye",
-                "left_eye",
-                "nose_tip",
-                "mouth_center",
-                "right_ear",
-                "left_ear",
-            ]
-
-            for idx, keypoint in enumerate(detection.location_data.relative_keypoints):
-                if idx < len(keypoint_names):
-                    landmarks[keypoint_names[idx]] = {
-                        "x": int(keypoint.x * width),
-                        "y": int(keypoint.y * height),
-                    }
+            # Extract key landmarks (eyes, nose, mouth, ears), scaled in one pass
+            keypoints = detection.location_data.relative_keypoints
+            points = np.array(
+                [(kp.x, kp.y) for kp in keypoints[: len(KEYPOINT_NAMES)]],
+                dtype=np.float64,
+            )
+            landmarks = {
+                name: Point(x, y)
+                for name, (x, y) in zip(
+                    KEYPOINT_NAMES[: len(points)],
+                    _scale_points(points, width, height).tolist(),
+                    strict=True,
+                )
+            }
 
             logger.info(
                 f"Face detected: confidence {confidence:.2f}, "
-                f"region {face_region['width']}x{face_region['height']}"
+                f"region {face_region.width}x{face_region.height}"
             )
 
             return FaceDetectionResult(
@@ -164,19 +315,18 @@ class MediaPipeFaceDetector(FaceDetectorInterface):
         face_region = detection.face_region
         min_face_size = 128
 
-        if (
-            face_region["width"] < min_face_size
-            or face_region["height"] < min_face_size
-        ):
+        if face_region.width < min_face_size or face_region.height < min_face_size:
             return (
                 False,
-                f"Face too small: {face_region['width']}x{face_region['height']} "
+                f"Face too small: {face_region.width}x{face_region.height} "
                 f"(minimum: {min_face_size}x{min_face_size})",
             )
 
-        # Check aspect ratio (face should be roughly portrait oriented)
-        aspect_ratio = face_region["width"] / face_region["height"]
-        if aspect_ratio < 0.5 or aspect_ratio > 1.5:
+        # Check aspect ratio is within 0.5-1.5 (face should be roughly
+        # portrait oriented); cross-multiplied to stay in integers
+        face_width, face_height = face_region.width, face_region.height
+        if 2 * face_width < face_height or 2 * face_width > 3 * face_height:
+            aspect_ratio = face_width / face_height
             return (
                 False,
                 f"Unusual face aspect ratio: {aspect_ratio:.2f} "
@@ -198,18 +348,19 @@ class MediaPipeFaceDetector(FaceDetectorInterface):
         left_eye = landmarks["left_eye"]
         right_eye = landmarks["right_eye"]
 
-        eye_dy = abs(left_eye["y"] - right_eye["y"])
-        eye_dx = abs(left_eye["x"] - right_eye["x"])
+        eye_dy = abs(left_eye.y - right_eye.y)
+        eye_dx = abs(left_eye.x - right_eye.x)
 
         if eye_dx == 0:
             return False, "Cannot determine face orientation"
 
-        eye_angle = abs(np.arctan(eye_dy / eye_dx) * 180 / np.pi)
-
-        if eye_angle > 15:
+        # Same as atan(dy / dx) > MAX_TILT_DEGREES, without the trig; the
+        # angle is only computed for the error message
+        if eye_dy > _TAN_MAX_TILT * eye_dx:
+            eye_angle = math.degrees(math.atan(eye_dy / eye_dx))
             return (
                 False,
-                f"Face is tilted: {eye_angle:.1f}° (maximum: 15°)",
+                f"Face is tilted: {eye_angle:.1f}° (maximum: {MAX_TILT_DEGREES}°)",
             )
 
         # All checks passed
@@ -226,57 +377,55 @@ class MediaPipeFaceDetector(FaceDetectorInterface):
             image_path: Path to image file
 
         Returns:
-            Dictionary with face mesh data or None if detection failed
+            Dictionary with face mesh data or None if detection failed.
+            Landmarks are stored as arrays: "xy" holds (N, 2) int32 pixel
+            coordinates and "z" holds (N,) float32 depths.
 
         Note:
             This provides detailed mesh for advanced lip-sync applications.
         """
         try:
-            # Load image
-            image = cv2.imread(str(image_path))
-            if image is None:
+            # Load image (decoded straight to RGB)
+            image_rgb = load_rgb(image_path)
+            if image_rgb is None:
                 logger.error(f"Failed to load image: {image_path}")
                 return None
 
-            # Convert BGR to RGB
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            height, width, _ = image.shape
+            height, width, _ = image_rgb.shape
 
-            # Initialize MediaPipe Face Mesh
-            if self._face_mesh is None:
-                import mediapipe as mp
+            with self._lock:
+                # Initialize MediaPipe Face Mesh
+                if self._face_mesh is None:
+                    import mediapipe as mp
 
-                self._face_mesh = mp.solutions.face_mesh.FaceMesh(
-                    static_image_mode=True,
-                    max_num_faces=1,
-                    min_detection_confidence=self.min_detection_confidence,
-                )
+                    self._face_mesh = mp.solutions.face_mesh.FaceMesh(
+                        static_image_mode=True,
+                        max_num_faces=1,
+                        min_detection_confidence=self.min_detection_confidence,
+                    )
 
-            # Process image
-            results = self._face_mesh.process(image_rgb)
+                # Process image (relative coordinates, so size-independent)
+                results = self._face_mesh.process(
+                    _downscale(image_rgb, self.max_mesh_side)
+                )
 
             if not results.multi_face_landmarks:
                 logger.info("No face mesh detected")
                 return None
 
-            # Extract landmarks
+            # Extract landmarks, scaling all 468 points in one pass
             face_landmarks = results.multi_face_landmarks[0]
-            landmarks = []
-
-            for landmark in face_landmarks.landmark:
-                landmarks.append(
-                    {
-                        "x": int(landmark.x * width),
-                        "y": int(landmark.y * height),
-                        "z": landmark.z,  # Depth information
-                    }
-                )
+            coords = np.array(
+                [(lm.x, lm.y, lm.z) for lm in face_landmarks.landmark],
+                dtype=np.float64,
+            ).reshape(-1, 3)
 
-            logger.info(f"Extracted face mesh with {len(landmarks)} landmarks")
+            logger.info(f"Extracted face mesh with {len(coords)} landmarks")
 
             return {
-                "num_landmarks": len(landmarks),
-                "landmarks": landmarks,
+                "num_landmarks": len(coords),
+                "xy": _scale_points(coords[:, :2], width, height),
+                "z": coords[:, 2].astype(np.float32),  # Depth information
                 "image_width": width,
                 "image_height": height,
             }
@@ -5,7 +5,13 @@ Generates photorealistic portrait images using Stable Diffusion XL.
 Uses VRAM-aware loading and automatic cleanup.
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -13,8 +19,15 @@ from typing import Optional
 import torch
 from PIL import Image
 
-from ..utils.vram import VRAMManager
-from .interfaces import AvatarGeneratorInterface, GenerationResult
+from ..utils.image_io import fast_save
+from ..utils.quantization import quantize_linear_layers
+from ..utils.vram import VRAMManager, exclusive_model
+from .interfaces import (
+    AvatarGeneratorInterface,
+    FaceDetectionResult,
+    FaceDetectorInterface,
+    GenerationResult,
+)
 from .profiles import AvatarProfileManager
 
 logger = logging.getLogger(__name__)
@@ -33,6 +46,22 @@ DEFAULT_NEGATIVE_PROMPT = (
     "low resolution, watermark, text, multiple people"
 )
 
+# DPM-Solver++ variants (Karras sigmas) selectable via the scheduler option.
+# They converge in 20-25 steps, where the default scheduler needs 40-50.
+SCHEDULERS = {
+    "dpmpp_2m_karras": "dpmsolver++",
+    "dpmpp_2m_sde_karras": "sde-dpmsolver++",
+}
+DEFAULT_SCHEDULER = "dpmpp_2m_sde_karras"
+
+# Denoising steps per warmup resolution; a compiled UNet records its CUDA
+# graphs on the second call
+WARMUP_STEPS = 2
+
+# Prompts containing any of these are left unenhanced (one case-insensitive
+# scan, no lowercased copy)
+QUALITY_KEYWORDS_RE = re.compile(r"professional|high quality|detailed|portrait", re.I)
+
 
 class SDXLAvatarGenerator(AvatarGeneratorInterface):
     """
@@ -47,6 +76,7 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
         config: dict,
         vram_manager: VRAMManager,
         profile_manager: AvatarProfileManager,
+        face_detector: Optional[FaceDetectorInterface] = None,
     ):
         """
         Initialize SDXL avatar generator.
@@ -55,21 +85,40 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
             config: Configuration dict (avatar.sdxl section)
             vram_manager: VRAM management instance
             profile_manager: Avatar profile manager
+            face_detector: Detector run on generated images (optional,
+                created on first generation)
         """
         self.config = config
         self.vram_manager = vram_manager
         self.profile_manager = profile_manager
+        self.face_detector = face_detector
         self._pipeline = None
+        # Held for each load-run-unload call (see exclusive_model)
+        self._model_lock = threading.RLock()
         self._device = None
 
         # Model settings
         self.vram_requirement_mb = 7168  # SDXL requires ~7GB for FP16
         self.model_id = config.get("model_id", "stabilityai/stable-diffusion-xl-base-1.0")
-        self.num_inference_steps = config.get("num_inference_steps", 30)
+        self.num_inference_steps = config.get("num_inference_steps", 20)
         self.guidance_scale = config.get("guidance_scale", 7.5)
+        self.skip_cfg_without_negative = config.get("skip_cfg_without_negative", False)
+
+        # Keep the pipeline loaded between generations; the VRAM manager
+        # unloads it when another model needs the memory
+        self.cache_models = config.get("cache_models", True)
+
+        # Directory memoizing seeded generations (None disables the cache)
+        cache_dir = config.get("generation_cache_dir")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
         logger.info("SDXL avatar generator initialized")
 
+        # warmup: true warms 1:1; a list names the aspect ratios to warm
+        warmup = config.get("warmup", False)
+        if warmup:
+            self.warmup(*([] if warmup is True else warmup))
+
     def generate(
         self,
         prompt: str,
@@ -91,7 +140,56 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
         Returns:
             GenerationResult with success status and profile
         """
+        return self.generate_batch(
+            [prompt],
+            negative_prompts=[negative_prompt],
+            aspect_ratio=aspect_ratio,
+            seeds=[seed],
+            output_paths=[output_path],
+        )[0]
+
+    @exclusive_model
+    @torch.inference_mode()
+    def generate_batch(
+        self,
+        prompts: list[str],
+        negative_prompts: Optional[list[str]] = None,
+        aspect_ratio: str = "16:9",
+        seeds: Optional[list[Optional[int]]] = None,
+        output_paths: Optional[list[Optional[Path]]] = None,
+    ) -> list[GenerationResult]:
+        """
+        Generate several avatars of one aspect ratio in a single denoise pass.
+
+        Batching shares the model load and fills the GPU better than one
+        prompt at a time; VRAM use grows with the batch size.
+
+        Args:
+            prompts: Text descriptions, one per avatar
+            negative_prompts: Things to avoid per prompt (optional). With
+                skip_cfg_without_negative set and none given, the batch runs
+                without classifier-free guidance (one UNet pass per step)
+            aspect_ratio: Image aspect ratio shared by the batch
+            seeds: Random seed per prompt (optional, None entries are random)
+            output_paths: Where to save each image (optional, None entries
+                are auto-generated)
+
+        Returns:
+            GenerationResult per prompt, in order. If generation fails, every
+            result carries the error; a failure saving one image only fails
+            its own result.
+        """
         start_time = time.time()
+        count = len(prompts)
+        negative_prompts = negative_prompts or [""] * count
+        guidance_scale = self.guidance_scale
+        if self.skip_cfg_without_negative and not any(negative_prompts):
+            # diffusers skips the unconditional UNet pass at guidance <= 1
+            guidance_scale = 1.0
+        else:
+            negative_prompts = [p or DEFAULT_NEGATIVE_PROMPT for p in negative_prompts]
+        seeds = seeds or [None] * count
+        output_paths = list(output_paths or [None] * count)
 
         try:
             # Validate aspect ratio
@@ -103,15 +201,45 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
 
             width, height = ASPECT_RATIOS[aspect_ratio]
 
-            # Enhance prompt for portrait generation
-            enhanced_prompt = self._enhance_prompt(prompt)
-
-            # Use default negative prompt if none provided
-            if not negative_prompt:
-                negative_prompt = DEFAULT_NEGATIVE_PROMPT
-
-            # Check VRAM availability
-            if not self.vram_manager.can_load(self.vram_requirement_mb):
+            for i, output_path in enumerate(output_paths):
+                if output_path is None:
+                    # Auto-generate output path in temp storage
+                    from datetime import datetime
+
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    suffix = f"_{i}" if count > 1 else ""
+                    output_paths[i] = Path(f"temp_avatar_{timestamp}{suffix}.png")
+
+            # Seeded generations are deterministic, so repeats are served
+            # from the generation cache without running the pipeline
+            cache_keys = [
+                self._cache_key(
+                    prompts[i], negative_prompts[i], seeds[i], aspect_ratio,
+                    guidance_scale,
+                )
+                for i in range(count)
+            ]
+            results = [
+                self._save_item(
+                    self._restore_cached,
+                    cache_keys[i],
+                    output_paths[i],
+                    prompt=prompts[i],
+                    negative_prompt=negative_prompts[i],
+                    aspect_ratio=aspect_ratio,
+                    seed=seeds[i],
+                    guidance_scale=guidance_scale,
+                )
+                for i in range(count)
+            ]
+            pending = [i for i, result in enumerate(results) if result is None]
+            if not pending:
+                return self._finish(results, start_time)
+
+            # Check VRAM availability (already counted if still loaded)
+            if self._pipeline is None and not self.vram_manager.can_load(
+                self.vram_requirement_mb
+            ):
                 raise RuntimeError(
                     f"Insufficient VRAM: need {self.vram_requirement_mb}MB for SDXL"
                 )
@@ -119,117 +247,419 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
             # Load model
             self._load_model()
 
-            # Generate image
-            logger.info(f"Generating avatar: {prompt[:50]}...")
+            # Generate images
+            logger.info(
+                f"Generating {len(pending)} avatar(s): {prompts[pending[0]][:50]}..."
+            )
             logger.info(f"Resolution: {width}x{height} ({aspect_ratio})")
 
-            # Set random seed if provided
+            # One generator per image keeps seeded images reproducible
+            # regardless of what they were batched with
             generator = None
-            if seed is not None:
-                generator = torch.Generator(device=self._device).manual_seed(seed)
-                logger.info(f"Using seed: {seed}")
+            if any(seeds[i] is not None for i in pending):
+                generator = [self._make_generator(seeds[i]) for i in pending]
 
-            # Generate with pipeline
+            # Generate with pipeline (prompts enhanced for portraits)
             result = self._pipeline(
-                prompt=enhanced_prompt,
-                negative_prompt=negative_prompt,
+                prompt=[self._enhance_prompt(prompts[i]) for i in pending],
+                negative_prompt=(
+                    [negative_prompts[i] for i in pending]
+                    if guidance_scale > 1
+                    else None
+                ),
                 width=width,
                 height=height,
                 num_inference_steps=self.num_inference_steps,
-                guidance_scale=self.guidance_scale,
+                guidance_scale=guidance_scale,
                 generator=generator,
             )
 
-            image = result.images[0]
+            images = result.images
+
+            if not self.cache_models:
+                self._unload_model()
+
+            # Detect faces in generated images (detector reused across
+            # generations so MediaPipe builds its graph once)
+            if self.face_detector is None:
+                from .detector import MediaPipeFaceDetector
+
+                self.face_detector = MediaPipeFaceDetector()
+            detector = self.face_detector
+
+            # Each image is saved separately so one failure doesn't fail the
+            # requests batched with it
+            for i, image in zip(pending, images, strict=True):
+                results[i] = self._save_item(
+                    self._save_avatar,
+                    image,
+                    output_paths[i],
+                    detector,
+                    prompt=prompts[i],
+                    negative_prompt=negative_prompts[i],
+                    aspect_ratio=aspect_ratio,
+                    seed=seeds[i],
+                    guidance_scale=guidance_scale,
+                    cache_key=cache_keys[i],
+                )
+
+            return self._finish(results, start_time)
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+            logger.error(f"Avatar generation failed: {e}")
 
-            # Unload model and cleanup
+            # Ensure cleanup on error
             self._unload_model()
 
-            # Save image
-            if output_path is None:
-                # Auto-generate output path in temp storage
-                from datetime import datetime
+            return [
+                GenerationResult(
+                    success=False,
+                    profile=None,
+                    error=str(e),
+                    processing_time_seconds=processing_time,
+                )
+                for _ in prompts
+            ]
 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_path = Path(f"temp_avatar_{timestamp}.png")
+    def _save_item(self, save, *args, **kwargs) -> Optional[GenerationResult]:
+        """
+        Run one item's save step, turning an exception into a failed result.
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            image.save(output_path)
-            logger.info(f"Saved avatar to {output_path}")
+        Args:
+            save: _save_avatar or _restore_cached
+            *args, **kwargs: Arguments for save
 
-            # Detect face in generated image
-            from .detector import MediaPipeFaceDetector
+        Returns:
+            Result of save, or a failed GenerationResult if it raised
+        """
+        try:
+            return save(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to save avatar: {e}")
+            return GenerationResult(
+                success=False,
+                profile=None,
+                error=str(e),
+                processing_time_seconds=0.0,
+            )
 
-            detector = MediaPipeFaceDetector()
-            detection = detector.detect(output_path)
+    def _finish(
+        self, results: list[GenerationResult], start_time: float
+    ) -> list[GenerationResult]:
+        """Stamp the batch processing time on each result and return them."""
+        processing_time = time.time() - start_time
+        succeeded = sum(generation.success for generation in results)
+        logger.info(
+            f"Avatar generation finished: {succeeded}/{len(results)} "
+            f"succeeded ({processing_time:.2f}s)"
+        )
+
+        for generation in results:
+            generation.processing_time_seconds = processing_time
+        return results
+
+    def _cache_key(
+        self,
+        prompt: str,
+        negative_prompt: str,
+        seed: Optional[int],
+        aspect_ratio: str,
+        guidance_scale: float,
+    ) -> Optional[str]:
+        """
+        Hash everything that determines a generated image.
 
-            if not detection.detected:
-                logger.warning("No face detected in generated image")
-                face_region = {"x": 0, "y": 0, "width": width, "height": height}
-            else:
-                face_region = detection.face_region
-                logger.info(
-                    f"Face detected: confidence {detection.confidence:.2f}"
-                )
+        Returns:
+            Hex digest, or None if caching is off or the seed is random
+        """
+        if self.cache_dir is None or seed is None:
+            return None
+
+        inputs = {
+            "model_id": self.model_id,
+            "vae_model_id": self.config.get("vae_model_id"),
+            "scheduler": self.config.get("scheduler", DEFAULT_SCHEDULER),
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            "seed": seed,
+            "size": ASPECT_RATIOS[aspect_ratio],
+            "steps": self.num_inference_steps,
+            "guidance_scale": guidance_scale,
+        }
+        encoded = json.dumps(inputs, sort_keys=True).encode()
+        return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+    def _restore_cached(
+        self, cache_key: Optional[str], output_path: Path, **metadata
+    ) -> Optional[GenerationResult]:
+        """
+        Copy a cached image to output_path and return its profile.
 
-            # Create profile (extract name from prompt)
-            profile_name = self._extract_name_from_prompt(prompt)
-
-            generation_metadata = {
-                "prompt": prompt,
-                "negative_prompt": negative_prompt,
-                "seed": seed,
-                "width": width,
-                "height": height,
-                "steps": self.num_inference_steps,
-                "guidance_scale": self.guidance_scale,
-                "face_detected": detection.detected,
-                "face_confidence": detection.confidence,
-            }
-
-            profile = self.profile_manager.create_profile(
-                name=profile_name,
-                image_path=output_path,
-                face_region=face_region,
-                aspect_ratio=aspect_ratio,
-                generation_metadata=generation_metadata,
-            )
+        The profile created when the image was first generated is reused;
+        a new one is only created if that profile has since been deleted.
 
-            processing_time = time.time() - start_time
-            logger.info(
-                f"Avatar generation successful: {profile.profile_id} "
-                f"({processing_time:.2f}s)"
+        Args:
+            cache_key: Key from _cache_key (None skips the lookup)
+            output_path: Where to save the image
+            **metadata: Generation settings passed to _create_profile
+
+        Returns:
+            GenerationResult, or None on a cache miss
+        """
+        if cache_key is None:
+            return None
+
+        try:
+            entry = json.loads(
+                (self.cache_dir / f"{cache_key}.json").read_text(encoding="utf-8")
             )
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.cache_dir / f"{cache_key}.png", output_path)
+        except FileNotFoundError:
+            return None
 
-            return GenerationResult(
-                success=True,
-                profile=profile,
-                error=None,
-                processing_time_seconds=processing_time,
+        logger.info(f"Generation cache hit, saved avatar to {output_path}")
+        detection = FaceDetectionResult.from_dict(entry["detection"])
+
+        try:
+            profile = self.profile_manager.load_profile(entry["profile_id"])
+        except FileNotFoundError:
+            result = self._create_profile(output_path, detection, **metadata)
+            self._write_cache_entry(cache_key, result.profile.profile_id, detection)
+            return result
+
+        return GenerationResult(
+            success=True,
+            profile=profile,
+            error=None,
+            processing_time_seconds=0.0,
+            face_detection=detection,
+        )
+
+    def _store_cached(
+        self,
+        cache_key: str,
+        image_path: Path,
+        profile_id: str,
+        detection: FaceDetectionResult,
+    ) -> None:
+        """Add a saved image, its profile and detection to the generation cache."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write via a temp file and rename so readers never see partial
+            # entries; the sidecar goes last since lookups start from it
+            image_tmp = self.cache_dir / f"{cache_key}.png.tmp"
+            shutil.copyfile(image_path, image_tmp)
+            os.replace(image_tmp, self.cache_dir / f"{cache_key}.png")
+        except OSError as e:
+            logger.warning(f"Failed to cache generated avatar: {e}")
+            return
+
+        self._write_cache_entry(cache_key, profile_id, detection)
+
+    def _write_cache_entry(
+        self, cache_key: str, profile_id: str, detection: FaceDetectionResult
+    ) -> None:
+        """Write the sidecar recording a cached image's profile and detection."""
+        entry = {"profile_id": profile_id, "detection": detection.to_dict()}
+        try:
+            sidecar_tmp = self.cache_dir / f"{cache_key}.json.tmp"
+            sidecar_tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(sidecar_tmp, self.cache_dir / f"{cache_key}.json")
+        except OSError as e:
+            logger.warning(f"Failed to cache generated avatar: {e}")
+
+    def _make_generator(self, seed: Optional[int]) -> torch.Generator:
+        """Create a torch generator seeded with seed, or randomly if None."""
+        generator = torch.Generator(device=self._device)
+        if seed is None:
+            generator.seed()
+        else:
+            generator.manual_seed(seed)
+            logger.info(f"Using seed: {seed}")
+        return generator
+
+    def _save_avatar(
+        self,
+        image: Image.Image,
+        output_path: Path,
+        detector,
+        prompt: str,
+        negative_prompt: str,
+        aspect_ratio: str,
+        seed: Optional[int],
+        guidance_scale: float,
+        cache_key: Optional[str] = None,
+    ) -> GenerationResult:
+        """
+        Save a generated image and create its avatar profile.
+
+        Args:
+            image: Generated image
+            output_path: Where to save the image
+            detector: Face detector run on the saved image
+            prompt: Prompt the image was generated from
+            negative_prompt: Negative prompt used
+            aspect_ratio: Image aspect ratio
+            seed: Seed used (None if random)
+            guidance_scale: Guidance scale used
+            cache_key: Generation cache key to store the result under
+                (optional)
+
+        Returns:
+            Successful GenerationResult (processing time filled in by caller)
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fast_save(image, output_path)
+        logger.info(f"Saved avatar to {output_path}")
+
+        detection = detector.detect(output_path)
+
+        result = self._create_profile(
+            output_path,
+            detection,
+            prompt=prompt,
+            negative_prompt=negative_prompt,
+            aspect_ratio=aspect_ratio,
+            seed=seed,
+            guidance_scale=guidance_scale,
+        )
+
+        if cache_key is not None:
+            self._store_cached(
+                cache_key, output_path, result.profile.profile_id, detection
             )
 
-        except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Avatar generation failed: {e}")
+        return result
 
-            # Ensure cleanup on error
-            self._unload_model()
+    def _create_profile(
+        self,
+        output_path: Path,
+        detection: FaceDetectionResult,
+        prompt: str,
+        negative_prompt: str,
+        aspect_ratio: str,
+        seed: Optional[int],
+        guidance_scale: float,
+    ) -> GenerationResult:
+        """
+        Create the avatar profile for a saved image.
 
-            return GenerationResult(
-                success=False,
-                profile=None,
-                error=str(e),
-                processing_time_seconds=processing_time,
+        Args:
+            output_path: Saved image
+            detection: Face detection on the image
+            prompt: Prompt the image was generated from
+            negative_prompt: Negative prompt used
+            aspect_ratio: Image aspect ratio
+            seed: Seed used (None if random)
+            guidance_scale: Guidance scale used
+
+        Returns:
+            Successful GenerationResult (processing time filled in by caller)
+        """
+        width, height = ASPECT_RATIOS[aspect_ratio]
+
+        if not detection.detected:
+            logger.warning("No face detected in generated image")
+            face_region = {"x": 0, "y": 0, "width": width, "height": height}
+        else:
+            face_region = detection.face_region._asdict()
+            logger.info(
+                f"Face detected: confidence {detection.confidence:.2f}"
             )
 
+        # Create profile (extract name from prompt)
+        profile_name = self._extract_name_from_prompt(prompt)
+
+        generation_metadata = {
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            "seed": seed,
+            "width": width,
+            "height": height,
+            "steps": self.num_inference_steps,
+            "guidance_scale": guidance_scale,
+            "face_detected": detection.detected,
+            "face_confidence": detection.confidence,
+        }
+
+        profile = self.profile_manager.create_profile(
+            name=profile_name,
+            image_path=output_path,
+            face_region=face_region,
+            aspect_ratio=aspect_ratio,
+            generation_metadata=generation_metadata,
+        )
+        logger.info(f"Created avatar profile: {profile.profile_id}")
+
+        return GenerationResult(
+            success=True,
+            profile=profile,
+            error=None,
+            processing_time_seconds=0.0,
+            face_detection=detection,
+        )
+
     def get_supported_aspect_ratios(self) -> list[str]:
         """Get list of supported aspect ratios."""
         return list(ASPECT_RATIOS.keys())
 
+    @exclusive_model
+    @torch.inference_mode()
+    def warmup(self, *aspect_ratios: str) -> bool:
+        """
+        Run a short denoise so the first real generation skips CUDA setup.
+
+        Creates the CUDA context and fills the cuDNN autotuning cache for
+        each resolution. Both persist after the model is unloaded; with
+        cache_models the pipeline itself also stays loaded. With
+        compile_unet this also compiles the UNet and records its CUDA
+        graphs per resolution.
+
+        Args:
+            *aspect_ratios: Aspect ratios whose resolutions to warm up
+                (default: "1:1")
+
+        Returns:
+            True if warmup ran, False if skipped or failed
+        """
+        if not torch.cuda.is_available():
+            logger.debug("CUDA not available, skipping SDXL warmup")
+            return False
+
+        try:
+            sizes = {ASPECT_RATIOS[ratio] for ratio in aspect_ratios or ["1:1"]}
+            start_time = time.time()
+
+            self._load_model()
+            for width, height in sizes:
+                self._pipeline(
+                    prompt="",
+                    width=width,
+                    height=height,
+                    num_inference_steps=WARMUP_STEPS,
+                    guidance_scale=self.guidance_scale,
+                    output_type="latent",
+                )
+
+            logger.info(f"SDXL warmup complete ({time.time() - start_time:.2f}s)")
+            if not self.cache_models:
+                self._unload_model()
+            return True
+
+        except Exception as e:
+            logger.warning(f"SDXL warmup failed: {e}")
+            self._unload_model()
+            return False
+
     def _load_model(self) -> None:
         """Load SDXL pipeline into memory."""
         if self._pipeline is not None:
             logger.debug("SDXL pipeline already loaded")
+            if self.cache_models:
+                # Mark as recently used so other models are evicted first
+                self.vram_manager.keep_resident("sdxl", self._evict)
             return
 
         try:
@@ -245,38 +675,149 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
 
             # Load pipeline with FP16 for memory efficiency
             if self._device == "cuda":
-                self._pipeline = StableDiffusionXLPipeline.from_pretrained(
-                    self.model_id,
+                # The stock SDXL VAE overflows in FP16, so diffusers upcasts
+                # it to FP32 for every decode; an FP16-safe VAE avoids that
+                vae_kwargs = {}
+                vae_model_id = self.config.get("vae_model_id")
+                if vae_model_id:
+                    from diffusers import AutoencoderKL
+
+                    vae_kwargs["vae"] = self._from_pretrained(
+                        AutoencoderKL, model_id=vae_model_id, torch_dtype=torch.float16
+                    )
+
+                self._pipeline = self._from_pretrained(
+                    StableDiffusionXLPipeline,
                     torch_dtype=torch.float16,
                     variant="fp16",
                     use_safetensors=True,
+                    **vae_kwargs,
                 )
             else:
-                self._pipeline = StableDiffusionXLPipeline.from_pretrained(
-                    self.model_id,
+                self._pipeline = self._from_pretrained(
+                    StableDiffusionXLPipeline,
                     use_safetensors=True,
                 )
 
             self._pipeline = self._pipeline.to(self._device)
 
+            # Progress is logged per generation; skip tqdm's per-step updates
+            self._pipeline.set_progress_bar_config(disable=True)
+
+            scheduler = self.config.get("scheduler", DEFAULT_SCHEDULER)
+            if scheduler in SCHEDULERS:
+                from diffusers import DPMSolverMultistepScheduler
+
+                self._pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
+                    self._pipeline.scheduler.config,
+                    use_karras_sigmas=True,
+                    algorithm_type=SCHEDULERS[scheduler],
+                )
+                logger.debug(f"Using {scheduler} scheduler")
+            elif scheduler != "default":
+                logger.warning(f"Unknown scheduler '{scheduler}', keeping default")
+
+            # Optional FP8 weight storage for the UNet
+            if self.config.get("fp8", False):
+                quantize_linear_layers(self._pipeline.unet)
+
             # Enable memory optimizations
             if self._device == "cuda":
-                # Enable attention slicing to reduce VRAM usage
-                self._pipeline.enable_attention_slicing()
-                logger.debug("Enabled attention slicing")
+                # NHWC lets cuDNN pick tensor-core conv kernels for the UNet
+                # and VAE (SDPA attention is layout-agnostic)
+                self._pipeline.unet.to(memory_format=torch.channels_last)
+                self._pipeline.vae.to(memory_format=torch.channels_last)
+
+                # Diffusers defaults to fused SDPA attention on torch 2, which
+                # is faster and about as lean as slicing; slice only on request
+                if self.config.get("enable_attention_slicing", False):
+                    self._pipeline.enable_attention_slicing()
+                    logger.debug("Enabled attention slicing")
+
+                # Decode batches one image at a time / in tiles to cut the
+                # VAE decode VRAM peak
+                if self.config.get("enable_vae_slicing", False):
+                    self._pipeline.vae.enable_slicing()
+                    logger.debug("Enabled VAE slicing")
+                if self.config.get("enable_vae_tiling", False):
+                    self._pipeline.vae.enable_tiling()
+                    logger.debug("Enabled VAE tiling")
+
+                # Optionally compile the UNet and VAE decoder into fused
+                # kernels with CUDA graphs. The first generate per resolution
+                # pays the compile cost; later loads hit the inductor on-disk
+                # cache.
+                if self.config.get("compile_unet", False):
+                    mode = self.config.get("compile_mode", "max-autotune")
+                    self._pipeline.unet = torch.compile(
+                        self._pipeline.unet, mode=mode, fullgraph=True
+                    )
+                    self._pipeline.vae.decode = torch.compile(
+                        self._pipeline.vae.decode, mode=mode
+                    )
+                    logger.info(f"Compiled SDXL UNet and VAE decoder ({mode})")
 
             logger.info(f"SDXL pipeline loaded on {self._device}")
             self.vram_manager.log_status()
 
+            if self.cache_models:
+                self.vram_manager.keep_resident("sdxl", self._evict)
+
         except Exception as e:
             logger.error(f"Failed to load SDXL pipeline: {e}")
             raise RuntimeError(f"Model loading failed: {e}") from e
 
+    def _from_pretrained(
+        self, pipeline_cls, model_id: Optional[str] = None, **kwargs
+    ):
+        """
+        Load a pipeline from the local HF cache, downloading only if missing.
+
+        Trying local_files_only first skips the Hub revision/etag checks
+        that from_pretrained otherwise makes on every load. Weights are
+        loaded straight from the memory-mapped safetensors instead of
+        into randomly initialized modules first.
+
+        Args:
+            pipeline_cls: Diffusers pipeline or model class
+            model_id: Hub model ID (default: the configured SDXL model)
+            **kwargs: Extra from_pretrained arguments
+
+        Returns:
+            Loaded pipeline or model
+        """
+        model_id = model_id or self.model_id
+        kwargs.setdefault("low_cpu_mem_usage", True)
+        try:
+            return pipeline_cls.from_pretrained(
+                model_id, local_files_only=True, **kwargs
+            )
+        except OSError:
+            logger.info(f"{model_id} not in local cache, downloading...")
+            return pipeline_cls.from_pretrained(model_id, **kwargs)
+
+    def unload(self) -> None:
+        """Unload the pipeline and free its VRAM (reloaded on next use)."""
+        with self._model_lock:
+            self._unload_model()
+
+    def _evict(self) -> bool:
+        """Unload for VRAMManager eviction, unless a generation is running."""
+        if not self._model_lock.acquire(blocking=False):
+            return False
+        try:
+            self._unload_model()
+        finally:
+            self._model_lock.release()
+        return True
+
     def _unload_model(self) -> None:
         """Unload model and free VRAM."""
         if self._pipeline is None:
             return
 
+        self.vram_manager.release_resident("sdxl")
+
         try:
             logger.debug("Unloading SDXL pipeline...")
 
@@ -301,25 +842,14 @@ class SDXLAvatarGenerator(AvatarGeneratorInterface):
         Returns:
             Enhanced prompt with quality modifiers
         """
-        # Add quality and style modifiers if not present
-        quality_keywords = [
-            "professional",
-            "high quality",
-            "detailed",
-            "portrait",
-        ]
-
-        # Check if prompt already has quality keywords
-        prompt_lower = prompt.lower()
-        has_quality = any(kw in prompt_lower for kw in quality_keywords)
-
-        if not has_quality:
-            # Add professional portrait modifiers
-            enhanced = f"professional portrait, {prompt}, high quality, detailed face, studio lighting, 8k"
-        else:
-            enhanced = prompt
+        # Add professional portrait modifiers if no quality keyword is present
+        if not QUALITY_KEYWORDS_RE.search(prompt):
+            return (
+                f"professional portrait, {prompt}, "
+                "high quality, detailed face, studio lighting, 8k"
+            )
 
-        return enhanced
+        return prompt
 
     def _extract_name_from_prompt(self, prompt: str) -> str:
         """
@@ -6,9 +6,9 @@ and face detection operations.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 @dataclass
@@ -45,12 +45,30 @@ class GenerationResult:
         profile: Created avatar profile (if successful)
         error: Error message (if failed)
         processing_time_seconds: Time taken for generation
+        face_detection: Face detection run on the generated image (if successful)
     """
 
     success: bool
     profile: Optional[AvatarProfile]
     error: Optional[str]
     processing_time_seconds: float
+    face_detection: Optional["FaceDetectionResult"] = None
+
+
+class FaceRegion(NamedTuple):
+    """Face bounding box in pixels."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class Point(NamedTuple):
+    """Landmark position in pixels."""
+
+    x: int
+    y: int
 
 
 @dataclass
@@ -60,18 +78,54 @@ class FaceDetectionResult:
 
     Attributes:
         detected: Whether a face was detected
-        face_region: Face bounding box {x, y, width, height} (if detected)
-        landmarks: Key facial landmarks dictionary (if detected)
+        face_region: Face bounding box (if detected)
+        landmarks: Key facial landmark points by name (if detected)
         confidence: Detection confidence score (0.0-1.0)
         error: Error message (if failed)
     """
 
     detected: bool
-    face_region: Optional[dict]
-    landmarks: Optional[dict]
+    face_region: Optional[FaceRegion]
+    landmarks: Optional[dict[str, Point]]
     confidence: float
     error: Optional[str]
 
+    def to_dict(self) -> dict:
+        """
+        Convert result to a JSON-ready dictionary.
+
+        Returns:
+            Dictionary with the region and landmarks as {x, y, ...} dicts
+        """
+        data = asdict(self)
+        if self.face_region is not None:
+            data["face_region"] = self.face_region._asdict()
+        if self.landmarks is not None:
+            data["landmarks"] = {
+                name: point._asdict() for name, point in self.landmarks.items()
+            }
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> "FaceDetectionResult":
+        """
+        Create result from a to_dict() dictionary.
+
+        Args:
+            data: Dictionary with detection data
+
+        Returns:
+            FaceDetectionResult instance
+        """
+        data_copy = data.copy()
+        if data["face_region"] is not None:
+            data_copy["face_region"] = FaceRegion(**data["face_region"])
+        if data["landmarks"] is not None:
+            data_copy["landmarks"] = {
+                name: Point(**point) for name, point in data["landmarks"].items()
+            }
+        return FaceDetectionResult(**data_copy)
+
 
 class AvatarGeneratorInterface(ABC):
     """
@@ -5,17 +5,163 @@ Handles CRUD operations for avatar profiles, including storage of
 generated images and face detection metadata.
 """
 
+import errno
 import json
 import logging
-import secrets
-from datetime import datetime
+import os
+import re
+import shutil
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from .interfaces import AvatarProfile
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# errnos meaning a kernel copy method can't handle this pair of files
+_NO_KERNEL_COPY = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+}
+
+# Linux ioctl that makes a file share another file's extents
+FICLONE = 0x40049409
+
+# First "name" field in a metadata file (the top-level profile name);
+# group 1 is the raw JSON string body, escapes included
+_NAME_RE = re.compile(rb'"name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# list_profiles reads metadata on a thread pool from this many profiles up
+PARALLEL_LIST_MIN = 4
+LIST_MAX_WORKERS = 32
+
+# Buffer size for the userspace copy fallback (shutil's default is 64KB)
+COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def _reflink(infd: int, outfd: int) -> bool:
+    """
+    Clone a file with the FICLONE ioctl (copy-on-write filesystems).
+
+    Returns:
+        True if cloned, False if the filesystem doesn't support it
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(outfd, FICLONE, infd)
+    except OSError as e:
+        if e.errno not in _NO_KERNEL_COPY:
+            raise
+        return False
+    return True
+
+
+def _copy_file_range(infd: int, outfd: int, count: int) -> int:
+    """Copy with copy_file_range (can share extents on btrfs/xfs)."""
+    return os.copy_file_range(infd, outfd, count)
+
+
+def _sendfile(infd: int, outfd: int, count: int) -> int:
+    """Copy with sendfile from the current file offsets."""
+    return os.sendfile(outfd, infd, None, count)
+
+
+# In-kernel copy methods to try, in order
+_KERNEL_COPIES = [
+    method
+    for method, name in ((_copy_file_range, "copy_file_range"), (_sendfile, "sendfile"))
+    if hasattr(os, name)
+]
+
+
+def _dumps(obj: dict) -> bytes:
+    """Serialize metadata to indented JSON bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    """Parse metadata JSON bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix."""
+    now = time.time()
+    seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+    return f"{seconds}.{int(now % 1 * 1_000_000):06d}Z"
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file without moving its bytes through userspace.
+
+    Tries a reflink clone (constant time on btrfs/xfs), then
+    copy_file_range, then sendfile, then a plain buffered copy. Each
+    method continues from where the previous one stopped.
+
+    Args:
+        src: File to copy
+        dst: Destination file (overwritten)
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        if _reflink(infd, outfd):
+            return
+
+        remaining = os.fstat(infd).st_size
+
+        for copy in _KERNEL_COPIES:
+            try:
+                while remaining > 0:
+                    copied = copy(infd, outfd, remaining)
+                    if copied == 0:
+                        break  # Source shrank while copying
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _NO_KERNEL_COPY:
+                    raise
+                logger.debug(f"{copy.__name__} unavailable for {src}: {e}")
+
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_BYTES)
+
+
+def _profile_dirs(storage_dir: Path) -> list[Path]:
+    """
+    List profile directories in storage.
+
+    Uses scandir so the directory check comes from the cached entry type
+    instead of a stat per entry.
+    """
+    with os.scandir(storage_dir) as entries:
+        return [
+            storage_dir / entry.name
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        ]
+
 
 class AvatarProfileManager:
     """
@@ -25,6 +171,9 @@ class AvatarProfileManager:
         storage/avatars/{profile_id}/
         ├── avatar.png
         └── metadata.json
+
+    A name -> profile ID index is kept in memory and rescanned when the
+    avatars directory's mtime changes (a profile was added or removed).
     """
 
     def __init__(self, storage_dir: Path):
@@ -36,6 +185,8 @@ class AvatarProfileManager:
         """
         self.storage_dir = Path(storage_dir) / "avatars"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._name_to_id: Optional[dict[str, str]] = None
+        self._index_mtime_ns: Optional[int] = None
         logger.info(f"Avatar profile storage: {self.storage_dir}")
 
     def create_profile(
@@ -64,8 +215,7 @@ class AvatarProfileManager:
             IOError: If storage operations fail
         """
         # Check for duplicate names
-        existing = self.list_profiles()
-        if any(p.name == name for p in existing):
+        if self._name_exists(name):
             raise ValueError(f"Profile with name '{name}' already exists")
 
         # Generate unique ID
@@ -74,15 +224,15 @@ class AvatarProfileManager:
         profile_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Copy image to profile directory
+            # Copy image to profile directory in the background while the
+            # metadata is written
             avatar_path = profile_dir / "avatar.png"
-            import shutil
-
-            shutil.copy2(image_path, avatar_path)
-            logger.debug(f"Copied avatar image to {avatar_path}")
+            executor = ThreadPoolExecutor(max_workers=1)
+            copy = executor.submit(_fast_copy, image_path, avatar_path)
+            executor.shutdown(wait=False)
 
             # Create metadata
-            created_at = datetime.utcnow().isoformat() + "Z"
+            created_at = _utc_timestamp()
             metadata = {
                 "profile_id": profile_id,
                 "name": name,
@@ -96,9 +246,22 @@ class AvatarProfileManager:
             if generation_metadata:
                 metadata["generation"] = generation_metadata
 
+            # Write via a temp file and rename so concurrent readers never
+            # see partial metadata, publishing only once the image is complete
             metadata_path = profile_dir / "metadata.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            tmp_path = profile_dir / "metadata.json.tmp"
+            try:
+                tmp_path.write_bytes(_dumps(metadata))
+            finally:
+                copy.result()
+            logger.debug(f"Copied avatar image to {avatar_path}")
+            os.replace(tmp_path, metadata_path)
+
+            # Record the new name without a rescan (the mkdir above changed
+            # the directory mtime)
+            if self._index_mtime_ns is not None:
+                self._name_to_id[name] = profile_id
+                self._index_mtime_ns = self.storage_dir.stat().st_mtime_ns
 
             logger.info(f"Created avatar profile: {profile_id} ({name})")
 
@@ -115,8 +278,6 @@ class AvatarProfileManager:
         except Exception as e:
             # Cleanup on failure
             if profile_dir.exists():
-                import shutil
-
                 shutil.rmtree(profile_dir)
             logger.error(f"Failed to create profile: {e}")
             raise IOError(f"Profile creation failed: {e}") from e
@@ -141,21 +302,7 @@ class AvatarProfileManager:
             raise FileNotFoundError(f"Profile not found: {profile_id}")
 
         try:
-            # Load metadata
-            metadata_path = profile_dir / "metadata.json"
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
-
-            # Build profile object
-            profile = AvatarProfile(
-                profile_id=metadata["profile_id"],
-                name=metadata["name"],
-                base_image_path=profile_dir / "avatar.png",
-                face_region=metadata["face_region"],
-                aspect_ratio=metadata["aspect_ratio"],
-                created_at=metadata["created_at"],
-                metadata=metadata,
-            )
+            profile = self._build_profile(profile_dir, self._read_metadata(profile_dir))
 
             logger.debug(f"Loaded profile: {profile_id}")
             return profile
@@ -168,26 +315,66 @@ class AvatarProfileManager:
         """
         List all avatar profiles.
 
+        With several profiles, metadata files are read on a thread pool so
+        their storage latency overlaps.
+
         Returns:
             List of AvatarProfile objects
         """
-        profiles = []
-
         try:
-            for profile_dir in self.storage_dir.iterdir():
-                if not profile_dir.is_dir():
-                    continue
+            profile_dirs = _profile_dirs(self.storage_dir)
+        except Exception as e:
+            logger.error(f"Failed to list profiles: {e}")
+            return []
+
+        if len(profile_dirs) < PARALLEL_LIST_MIN:
+            loaded = map(self._try_load, profile_dirs)
+        else:
+            workers = min(LIST_MAX_WORKERS, len(profile_dirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._try_load, profile_dirs))
+
+        return [profile for profile in loaded if profile is not None]
+
+    def iter_profiles(self) -> Iterator[AvatarProfile]:
+        """
+        Iterate over avatar profiles, reading each only when it is reached.
 
-                try:
-                    profile = self.load_profile(profile_dir.name)
-                    profiles.append(profile)
-                except Exception as e:
-                    logger.warning(f"Skipping invalid profile {profile_dir.name}: {e}")
+        For callers that may stop early (e.g. searching for one profile);
+        list_profiles is faster for reading everything.
 
+        Yields:
+            AvatarProfile objects (invalid profiles are skipped)
+        """
+        try:
+            profile_dirs = _profile_dirs(self.storage_dir)
         except Exception as e:
             logger.error(f"Failed to list profiles: {e}")
+            return
 
-        return profiles
+        for profile_dir in profile_dirs:
+            profile = self._try_load(profile_dir)
+            if profile is not None:
+                yield profile
+
+    def _try_load(self, profile_dir: Path) -> Optional[AvatarProfile]:
+        """
+        Load a listed profile, logging and skipping it if invalid.
+
+        Reads directly rather than via load_profile, which first re-checks
+        that the directory exists.
+
+        Args:
+            profile_dir: Profile directory
+
+        Returns:
+            AvatarProfile, or None if it couldn't be loaded
+        """
+        try:
+            return self._build_profile(profile_dir, self._read_metadata(profile_dir))
+        except Exception as e:
+            logger.warning(f"Skipping invalid profile {profile_dir.name}: {e}")
+            return None
 
     def delete_profile(self, profile_id: str) -> bool:
         """
@@ -205,9 +392,9 @@ class AvatarProfileManager:
             return False
 
         try:
-            import shutil
-
             shutil.rmtree(profile_dir)
+            self._name_to_id = None  # Rescanned on next use
+
             logger.info(f"Deleted profile: {profile_id}")
             return True
 
@@ -215,6 +402,95 @@ class AvatarProfileManager:
             logger.error(f"Failed to delete profile {profile_id}: {e}")
             raise IOError(f"Profile deletion failed: {e}") from e
 
+    def _read_metadata(self, profile_dir: Path) -> dict:
+        """
+        Read a profile's metadata.json with a single read call.
+
+        Args:
+            profile_dir: Profile directory
+
+        Returns:
+            Parsed metadata
+        """
+        return _loads((profile_dir / "metadata.json").read_bytes())
+
+    def _read_name(self, profile_dir: Path) -> str:
+        """
+        Read just a profile's name, without parsing the whole metadata.
+
+        Args:
+            profile_dir: Profile directory
+
+        Returns:
+            Profile name
+        """
+        data = (profile_dir / "metadata.json").read_bytes()
+        match = _NAME_RE.search(data)
+        if match is None:
+            return _loads(data)["name"]
+        return json.loads(b'"' + match.group(1) + b'"')
+
+    def _build_profile(self, profile_dir: Path, metadata: dict) -> AvatarProfile:
+        """
+        Build a profile object from its directory and metadata.
+
+        Args:
+            profile_dir: Profile directory
+            metadata: Parsed metadata.json
+
+        Returns:
+            AvatarProfile object
+        """
+        return AvatarProfile(
+            profile_id=metadata["profile_id"],
+            name=metadata["name"],
+            base_image_path=profile_dir / "avatar.png",
+            face_region=metadata["face_region"],
+            aspect_ratio=metadata["aspect_ratio"],
+            created_at=metadata["created_at"],
+            metadata=metadata,
+        )
+
+    def _name_exists(self, name: str) -> bool:
+        """
+        Check whether a profile with this name exists.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            True if the name is taken
+        """
+        return name in self._get_index()
+
+    def _get_index(self) -> dict[str, str]:
+        """
+        Get the name index, rescanning if profiles were added or removed.
+
+        Only each profile's name is taken from its metadata; no
+        AvatarProfile objects are built.
+
+        Returns:
+            Name -> profile ID mapping
+        """
+        mtime_ns = self.storage_dir.stat().st_mtime_ns
+        if self._name_to_id is not None and mtime_ns == self._index_mtime_ns:
+            return self._name_to_id
+
+        index = {}
+        complete = True
+        for profile_dir in _profile_dirs(self.storage_dir):
+            try:
+                index[self._read_name(profile_dir)] = profile_dir.name
+            except (OSError, ValueError, KeyError) as e:
+                # May be a profile still being written; rescan next time
+                logger.debug(f"Skipping profile {profile_dir.name} in index: {e}")
+                complete = False
+
+        self._name_to_id = index
+        self._index_mtime_ns = mtime_ns if complete else None
+        return index
+
     def _generate_id(self) -> str:
         """
         Generate unique profile ID.
@@ -222,6 +498,5 @@ class AvatarProfileManager:
         Returns:
             Profile ID in format 'ap-{8 chars}'
         """
-        # Generate 8 random hex characters
-        random_hex = secrets.token_hex(4)  # 4 bytes = 8 hex chars
-        return f"ap-{random_hex}"
+        # 4 random bytes = 8 hex chars
+        return f"ap-{os.urandom(4).hex()}"
@@ -6,6 +6,7 @@ and pipeline execution.
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -293,11 +294,9 @@ def speak(text: str, profile: str, output: Path, storage: Path, config: Path):
             voice_profile = profile_manager.load_profile(profile)
         except FileNotFoundError:
             # Try finding by name
-            profiles = profile_manager.list_profiles()
-            matching = [p for p in profiles if p.name == profile]
-            if not matching:
+            voice_profile = profile_manager.find_by_name(profile)
+            if voice_profile is None:
                 raise ValueError(f"Profile not found: {profile}")
-            voice_profile = matching[0]
             click.echo(f"Using profile: {voice_profile.profile_id} ({voice_profile.name})")
 
         # Synthesize speech
@@ -462,76 +461,92 @@ def generate(
 
 
 @avatar.command()
-@click.argument("image", type=click.Path(exists=True, path_type=Path))
+@click.argument(
+    "images", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path)
+)
 @click.option(
     "--verbose",
     "-v",
     is_flag=True,
     help="Show detailed detection information",
 )
-def detect(image: Path, verbose: bool):
+def detect(images: tuple[Path, ...], verbose: bool):
     """
-    Detect and validate face in image.
+    Detect and validate faces in one or more images.
 
     Detects faces using MediaPipe and validates suitability for lip-sync.
-    Shows face region, landmarks, and validation results.
+    Shows face region, landmarks, and validation results. Exits non-zero
+    if any image has no usable face.
 
     Example:
         avatar avatar detect image.png --verbose
+        avatar avatar detect avatars/*.png
     """
     try:
-        click.echo(f"Detecting face in: {image}")
-
         # Initialize detector
         detector = MediaPipeFaceDetector()
 
-        # Detect face
-        result = detector.detect(image)
+        # Detect faces (the next image decodes while one is being detected)
+        results = detector.detect_batch(list(images))
 
-        if result.error:
-            click.echo(f"\nError: {result.error}", err=True)
-            sys.exit(1)
+        failed = 0
+        for image, result in zip(images, results, strict=True):
+            if not _show_detection(detector, image, result, verbose):
+                failed += 1
 
-        if not result.detected:
-            click.echo("\nNo face detected in image.")
+        if failed:
             sys.exit(1)
 
-        # Show detection results
-        click.echo("\n" + "=" * 60)
-        click.echo("Face Detection Results")
-        click.echo("=" * 60)
-        click.echo(f"Detected: Yes")
-        click.echo(f"Confidence: {result.confidence:.2f}")
-        click.echo(f"\nFace Region:")
-        click.echo(f"  X: {result.face_region['x']}")
-        click.echo(f"  Y: {result.face_region['y']}")
-        click.echo(f"  Width: {result.face_region['width']}")
-        click.echo(f"  Height: {result.face_region['height']}")
-
-        if verbose and result.landmarks:
-            click.echo(f"\nKey Landmarks:")
-            for name, coords in result.landmarks.items():
-                click.echo(f"  {name}: ({coords['x']}, {coords['y']})")
-
-        # Validate for lip-sync
-        is_valid, message = detector.validate_for_lipsync(result)
-
-        click.echo(f"\nLip-Sync Validation:")
-        if is_valid:
-            click.echo(f"  Status: Valid")
-            click.echo(f"  Message: {message}")
-        else:
-            click.echo(f"  Status: Invalid")
-            click.echo(f"  Reason: {message}")
-
-        click.echo("=" * 60)
-
     except Exception as e:
         logger.error(f"Face detection failed: {e}", exc_info=True)
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+def _show_detection(detector, image: Path, result, verbose: bool) -> bool:
+    """Print one image's detection and validation; return False on failure."""
+    click.echo(f"Detecting face in: {image}")
+
+    if result.error:
+        click.echo(f"\nError: {result.error}", err=True)
+        return False
+
+    if not result.detected:
+        click.echo("\nNo face detected in image.")
+        return False
+
+    # Show detection results
+    click.echo("\n" + "=" * 60)
+    click.echo("Face Detection Results")
+    click.echo("=" * 60)
+    click.echo("Detected: Yes")
+    click.echo(f"Confidence: {result.confidence:.2f}")
+    click.echo("\nFace Region:")
+    click.echo(f"  X: {result.face_region.x}")
+    click.echo(f"  Y: {result.face_region.y}")
+    click.echo(f"  Width: {result.face_region.width}")
+    click.echo(f"  Height: {result.face_region.height}")
+
+    if verbose and result.landmarks:
+        click.echo("\nKey Landmarks:")
+        for name, coords in result.landmarks.items():
+            click.echo(f"  {name}: ({coords.x}, {coords.y})")
+
+    # Validate for lip-sync
+    is_valid, message = detector.validate_for_lipsync(result)
+
+    click.echo("\nLip-Sync Validation:")
+    if is_valid:
+        click.echo("  Status: Valid")
+        click.echo(f"  Message: {message}")
+    else:
+        click.echo("  Status: Invalid")
+        click.echo(f"  Reason: {message}")
+
+    click.echo("=" * 60)
+    return True
+
+
 @avatar.command("list")
 @click.option(
     "--storage",
@@ -875,12 +890,11 @@ def pipeline_run(
             voice_profile_id = voice_profile.profile_id
         except FileNotFoundError:
             # Try finding by name
-            profiles = voice_profile_manager.list_profiles()
-            matching = [p for p in profiles if p.name == voice]
-            if not matching:
+            voice_profile = voice_profile_manager.find_by_name(voice)
+            if voice_profile is None:
                 raise ValueError(f"Voice profile not found: {voice}")
-            voice_profile_id = matching[0].profile_id
-            click.echo(f"Using voice profile: {voice_profile_id} ({matching[0].name})")
+            voice_profile_id = voice_profile.profile_id
+            click.echo(f"Using voice profile: {voice_profile_id} ({voice_profile.name})")
 
         # Create pipeline config
         pipeline_config = PipelineConfig(
@@ -932,6 +946,18 @@ def server():
 @click.option("--host", default="0.0.0.0", help="Server host (default: 0.0.0.0)")
 @click.option("--port", default=8000, type=int, help="Server port (default: 8000)")
 @click.option("--reload", is_flag=True, help="Enable auto-reload for development")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Worker processes (default: api.workers from config, else 1; "
+    "each loads models on the same GPU)",
+)
+@click.option(
+    "--limit-concurrency",
+    type=click.IntRange(min=1),
+    help="Max concurrent connections per worker before returning 503 "
+    "(bounds memory used by parallel uploads)",
+)
 @click.option(
     "--storage",
     type=click.Path(path_type=Path),
@@ -945,7 +971,13 @@ def server():
     help="Path to config YAML file",
 )
 def server_start(
-    host: str, port: int, reload: bool, storage: Path, config: Path
+    host: str,
+    port: int,
+    reload: bool,
+    workers: Optional[int],
+    limit_concurrency: Optional[int],
+    storage: Path,
+    config: Path,
 ):
     """
     Start REST API server.
@@ -960,6 +992,9 @@ def server_start(
     try:
         import uvicorn
 
+        if workers is None:
+            workers = load_config(config).get("api", {}).get("workers", 1)
+
         click.echo("=" * 70)
         click.echo("Avatar Pipeline - API Server")
         click.echo("=" * 70)
@@ -969,20 +1004,28 @@ def server_start(
         if config:
             click.echo(f"Config: {config}")
         click.echo(f"Auto-reload: {'enabled' if reload else 'disabled'}")
+        if not reload:
+            click.echo(f"Workers: {workers}")
+        if limit_concurrency:
+            click.echo(f"Concurrency limit: {limit_concurrency}")
         click.echo("\nStarting server...")
         click.echo("=" * 70)
 
-        # Import and create app
-        from .api.main import create_app
+        from .api.main import APP_IMPORT_STRING, CONFIG_ENV, STORAGE_ENV
 
-        app = create_app(config_path=config, storage_path=storage)
+        # Each worker process builds its own app from these
+        os.environ[STORAGE_ENV] = str(storage)
+        if config:
+            os.environ[CONFIG_ENV] = str(config)
 
-        # Run server
+        # Run server (uvicorn[standard] selects uvloop and httptools)
         uvicorn.run(
-            app,
+            APP_IMPORT_STRING,
             host=host,
             port=port,
             reload=reload,
+            workers=None if reload else workers,
+            limit_concurrency=limit_concurrency,
             log_level="info",
         )
 
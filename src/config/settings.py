@@ -4,7 +4,9 @@ Configuration loading and management.
 Loads YAML configuration files with hardware profile-specific defaults.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -32,8 +34,10 @@ DEFAULT_CONFIGS = {
             "sdxl": {
                 "model_id": "stabilityai/stable-diffusion-xl-base-1.0",
                 "precision": "fp16",
-                "num_inference_steps": 50,
+                "num_inference_steps": 30,
+                "max_batch_size": 4,
                 "guidance_scale": 7.5,
+                "cache_models": True,
             },
         },
         "video": {
@@ -60,8 +64,10 @@ DEFAULT_CONFIGS = {
             "sdxl": {
                 "model_id": "stabilityai/stable-diffusion-xl-base-1.0",
                 "precision": "fp16",
-                "num_inference_steps": 40,
+                "num_inference_steps": 25,
+                "max_batch_size": 1,
                 "guidance_scale": 7.5,
+                "cache_models": False,
             },
         },
         "video": {
@@ -88,8 +94,11 @@ DEFAULT_CONFIGS = {
             "sdxl": {
                 "model_id": "stabilityai/stable-diffusion-xl-base-1.0",
                 "precision": "fp16",
-                "num_inference_steps": 25,
+                "num_inference_steps": 20,
+                "max_batch_size": 1,
                 "guidance_scale": 7.0,
+                "enable_attention_slicing": True,
+                "cache_models": False,
             },
         },
         "video": {
@@ -103,12 +112,13 @@ DEFAULT_CONFIGS = {
 }
 
 
-def load_config(config_path: Optional[Path] = None) -> dict:
+def load_config(config_path: Optional[Path] = None, reload: bool = False) -> dict:
     """
     Load configuration from YAML file with hardware profile defaults.
 
     Args:
         config_path: Path to YAML config file. If None, uses defaults only.
+        reload: Discard cached configs and re-read from disk (default: False)
 
     Returns:
         Configuration dictionary with merged defaults and user overrides.
@@ -119,6 +129,11 @@ def load_config(config_path: Optional[Path] = None) -> dict:
         3. If config_path provided, loads and merges user config
         4. User config values override defaults
 
+    Note:
+        Parsed configs are cached per (profile, resolved path), so repeated
+        calls skip the YAML read. Each call returns an independent copy.
+        Pass reload=True to pick up edits to the config file.
+
     Example config structure:
         voice:
           xtts:
@@ -128,20 +143,40 @@ def load_config(config_path: Optional[Path] = None) -> dict:
           sdxl:
             num_inference_steps: 40
     """
+    if reload:
+        _load_config_cached.cache_clear()
+
     # Get hardware profile
     profile = get_hardware_profile()
+
+    if config_path is not None:
+        config_path = Path(config_path).resolve()
+
+    return copy.deepcopy(_load_config_cached(profile, config_path))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(profile: str, config_path: Optional[Path]) -> dict:
+    """
+    Build merged configuration for a hardware profile and config file.
+
+    Args:
+        profile: Hardware profile name
+        config_path: Resolved path to YAML config file, or None
+
+    Returns:
+        Configuration dictionary (shared cache entry, do not mutate)
+    """
     logger.info(f"Loading config for profile: {profile}")
 
     # Start with profile defaults
-    config = DEFAULT_CONFIGS[profile].copy()
+    config = copy.deepcopy(DEFAULT_CONFIGS[profile])
 
     # Add hardware profile to config
     config["hardware_profile"] = profile
 
     # Load user config if provided
     if config_path is not None:
-        config_path = Path(config_path)
-
         if not config_path.exists():
             logger.warning(f"Config file not found: {config_path}, using defaults")
             return config
@@ -10,12 +10,13 @@ Orchestrates the full pipeline from text to video:
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from ..avatar import MediaPipeFaceDetector
-from ..utils import VRAMManager
+from ..utils import VRAMManager, human_size
 from ..video import FFmpegEncoder, LipSyncConfig, MuseTalkLipSync
 from ..voice import CoquiTTSSynthesizer, VoiceProfileManager
 
@@ -35,6 +36,8 @@ class PipelineConfig:
         video_fps: Video frame rate (None = use quality preset default)
         encoding_preset: FFmpeg encoding preset
         encoding_crf: FFmpeg CRF quality (0-51, lower is better)
+        overlap_stages: Validate the avatar face on a worker thread while
+            speech is synthesized, instead of after it
     """
 
     max_video_length_seconds: int = 120
@@ -44,6 +47,7 @@ class PipelineConfig:
     video_fps: Optional[int] = None
     encoding_preset: str = "medium"
     encoding_crf: int = 23
+    overlap_stages: bool = True
 
 
 @dataclass
@@ -60,6 +64,7 @@ class PipelineResult:
         error: Error message if failed
         processing_time_seconds: Total processing time
         intermediate_files: Paths to intermediate files (if not cleaned up)
+        file_size_bytes: Size of the final video file
     """
 
     success: bool
@@ -70,6 +75,7 @@ class PipelineResult:
     error: Optional[str]
     processing_time_seconds: float
     intermediate_files: Optional[dict] = None
+    file_size_bytes: int = 0
 
 
 class PipelineCoordinator:
@@ -151,6 +157,11 @@ class PipelineCoordinator:
         if config is None:
             config = PipelineConfig()
 
+        # Face validation is CPU-bound and independent of TTS, so it can run
+        # alongside synthesis when overlap is enabled
+        executor = ThreadPoolExecutor(max_workers=1) if config.overlap_stages else None
+        validation_future = None
+
         try:
             logger.info("=" * 60)
             logger.info("Starting avatar video pipeline")
@@ -166,6 +177,9 @@ class PipelineCoordinator:
             logger.info(f"Loaded profile: {voice_profile.name} ({voice_profile.language})")
             stages_completed.append("load_profile")
 
+            if executor is not None:
+                validation_future = executor.submit(self._validate_avatar, avatar_image)
+
             # Stage 2: Synthesize speech
             logger.info("\n[Stage 2/5] Synthesizing speech...")
             audio_path = self.temp_dir / f"speech_{int(time.time())}.wav"
@@ -197,18 +211,10 @@ class PipelineCoordinator:
             # Stage 3: Validate avatar face
             logger.info("\n[Stage 3/5] Validating avatar face...")
 
-            if not avatar_image.exists():
-                raise FileNotFoundError(f"Avatar image not found: {avatar_image}")
-
-            detection = self.face_detector.detect(avatar_image)
-
-            if not detection.detected:
-                raise ValueError("No face detected in avatar image")
-
-            is_valid, message = self.face_detector.validate_for_lipsync(detection)
-
-            if not is_valid:
-                raise ValueError(f"Avatar face validation failed: {message}")
+            if validation_future is not None:
+                message = validation_future.result()
+            else:
+                message = self._validate_avatar(avatar_image)
 
             logger.info(f"Avatar validated: {message}")
             stages_completed.append("validate_avatar")
@@ -232,6 +238,7 @@ class PipelineCoordinator:
                 audio_file=synthesis_result.audio_path,
                 output_path=lipsync_path,
                 config=lipsync_config,
+                audio_buffer=synthesis_result.audio_buffer,
             )
 
             if not lipsync_result.success:
@@ -270,7 +277,7 @@ class PipelineCoordinator:
                 raise RuntimeError(f"Video encoding failed: {encoding_result.error}")
 
             logger.info(
-                f"Final video encoded: {encoding_result.file_size_bytes / 1024 / 1024:.2f}MB "
+                f"Final video encoded: {human_size(encoding_result.file_size_bytes)} "
                 f"({encoding_result.processing_time_seconds:.2f}s processing)"
             )
             stages_completed.append("encode_video")
@@ -302,6 +309,7 @@ class PipelineCoordinator:
                 error=None,
                 processing_time_seconds=processing_time,
                 intermediate_files=intermediate_files,
+                file_size_bytes=encoding_result.file_size_bytes,
             )
 
         except Exception as e:
@@ -323,6 +331,39 @@ class PipelineCoordinator:
                 intermediate_files=None,
             )
 
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _validate_avatar(self, avatar_image: Path) -> str:
+        """
+        Detect and validate the avatar face for lip-sync.
+
+        Args:
+            avatar_image: Path to avatar image
+
+        Returns:
+            Validation message
+
+        Raises:
+            FileNotFoundError: If image does not exist
+            ValueError: If no face is detected or validation fails
+        """
+        if not avatar_image.exists():
+            raise FileNotFoundError(f"Avatar image not found: {avatar_image}")
+
+        detection = self.face_detector.detect(avatar_image)
+
+        if not detection.detected:
+            raise ValueError("No face detected in avatar image")
+
+        is_valid, message = self.face_detector.validate_for_lipsync(detection)
+
+        if not is_valid:
+            raise ValueError(f"Avatar face validation failed: {message}")
+
+        return message
+
     def estimate_duration(self, text: str, voice_profile_id: str) -> dict:
         """
         Estimate pipeline execution time.
@@ -49,6 +49,7 @@ class Job:
         error: Error message (if failed)
         progress: Progress percentage (0.0-1.0)
         stage: Current processing stage description
+        revision: Save counter, incremented by JobQueue on every save
     """
 
     job_id: str
@@ -62,6 +63,7 @@ class Job:
     error: Optional[str] = None
     progress: float = 0.0
     stage: str = "Queued"
+    revision: int = 0
 
     @staticmethod
     def generate_id() -> str:
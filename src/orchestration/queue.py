@@ -4,8 +4,14 @@ Job queue management.
 File-based job queue for async pipeline execution with status tracking.
 """
 
+import copy
 import json
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +20,14 @@ from .jobs import Job, JobStatus, JobType
 logger = logging.getLogger(__name__)
 
 
+def _default_file_mode() -> int:
+    """Mode open() would give a new file under the current umask."""
+    # The umask can only be read by setting it, so put it straight back
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 class JobQueue:
     """
     File-based job queue for async processing.
@@ -32,18 +46,56 @@ class JobQueue:
         - Results/errors
     """
 
-    def __init__(self, storage_path: Path):
+    def __init__(
+        self,
+        storage_path: Path,
+        cache_size: int = 1024,
+        cache_shards: Optional[int] = None,
+    ):
         """
         Initialize job queue.
 
         Args:
             storage_path: Base storage directory
+            cache_size: Maximum number of parsed job files kept in memory
+            cache_shards: Number of independently locked cache shards
+                (default: CPU count, rounded up to a power of two)
         """
         self.storage_path = Path(storage_path)
         self.jobs_dir = self.storage_path / "jobs"
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._listeners: list[Callable[[Job], None]] = []
+
+        # Parsed job files keyed by ID, validated against (inode, mtime, size)
+        # so writes from other processes are picked up on the next read.
+        # Split into shards, each with its own lock and LRU order, so
+        # concurrent API threads reading different jobs don't contend.
+        shards = 1 << ((cache_shards or os.cpu_count() or 1) - 1).bit_length()
+        self.cache_size = cache_size
+        self._shard_mask = shards - 1
+        self._shard_size = -(-cache_size // shards)
+        self._cache_shards: list[tuple[threading.Lock, OrderedDict[str, tuple]]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(shards)
+        ]
+        # Serialize saves of the same job (sharded like the cache) so
+        # read-check-write sequences like try_cancel can't be interleaved
+        self._save_locks = [threading.RLock() for _ in range(shards)]
+        # mkstemp creates 0600 files; job files keep the usual umask mode
+        self._file_mode = _default_file_mode()
         logger.info(f"Job queue storage: {self.jobs_dir}")
 
+    def add_listener(self, callback: Callable[[Job], None]) -> None:
+        """
+        Register a callback invoked after every job save.
+
+        Callbacks run on the saving thread and only see changes made
+        through this JobQueue instance.
+
+        Args:
+            callback: Called with the saved Job
+        """
+        self._listeners.append(callback)
+
     def submit(self, job_type: JobType, params: dict) -> str:
         """
         Submit a new job to the queue.
@@ -76,21 +128,38 @@ class JobQueue:
         """
         job_file = self.jobs_dir / f"{job_id}.json"
 
-        if not job_file.exists():
-            logger.warning(f"Job not found: {job_id}")
-            return None
-
         try:
-            with open(job_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._load_job_data(job_file)
 
-            job = Job.from_dict(data)
-            return job
+            if data is None:
+                logger.warning(f"Job not found: {job_id}")
+                return None
+
+            return Job.from_dict(data)
 
         except Exception as e:
             logger.error(f"Failed to load job {job_id}: {e}")
             return None
 
+    def get_many(self, job_ids: list[str]) -> dict[str, Job]:
+        """
+        Get several jobs by ID.
+
+        Args:
+            job_ids: Job IDs to retrieve
+
+        Returns:
+            Mapping of job ID to Job for the jobs that exist
+        """
+        jobs = {}
+
+        for job_id in dict.fromkeys(job_ids):
+            job = self.get(job_id)
+            if job is not None:
+                jobs[job_id] = job
+
+        return jobs
+
     def list_jobs(
         self, status: Optional[JobStatus] = None, limit: Optional[int] = None
     ) -> list[Job]:
@@ -110,8 +179,9 @@ class JobQueue:
             # Load all job files
             for job_file in self.jobs_dir.glob("*.json"):
                 try:
-                    with open(job_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = self._load_job_data(job_file)
+                    if data is None:
+                        continue  # Deleted since the directory scan
 
                     job = Job.from_dict(data)
 
@@ -163,26 +233,56 @@ class JobQueue:
         Returns:
             True if cancelled successfully, False otherwise
         """
-        job = self.get(job_id)
+        return self.try_cancel(job_id)[1]
 
-        if job is None:
-            logger.warning(f"Cannot cancel: job not found: {job_id}")
-            return False
+    def try_cancel(self, job_id: str) -> tuple[Optional[JobStatus], bool]:
+        """
+        Cancel a pending job, reporting why not if it can't be cancelled.
 
-        # Can only cancel pending jobs
-        if job.status != JobStatus.PENDING:
-            logger.warning(
-                f"Cannot cancel job {job_id}: status is {job.status.value}, "
-                "only PENDING jobs can be cancelled"
-            )
-            return False
+        The read, status check and write hold the job's save lock, so no
+        save from this queue can land in between. The write is also skipped
+        if the job's revision changed since it was read (e.g. a worker in
+        another process started it).
 
-        # Mark as cancelled
-        job.cancel()
-        self.update(job)
+        Args:
+            job_id: Job ID to cancel
+
+        Returns:
+            Tuple of (status before cancelling, success). Status is None if
+            the job does not exist.
+        """
+        with self._save_lock(job_id):
+            job = self.get(job_id)
+
+            if job is None:
+                logger.warning(f"Cannot cancel: job not found: {job_id}")
+                return None, False
+
+            # Can only cancel pending jobs
+            if job.status != JobStatus.PENDING:
+                logger.warning(
+                    f"Cannot cancel job {job_id}: status is {job.status.value}, "
+                    "only PENDING jobs can be cancelled"
+                )
+                return job.status, False
+
+            # Mark as cancelled
+            job.cancel()
+            try:
+                saved = self._save_job(job, expected_revision=job.revision)
+            except OSError:
+                return JobStatus.PENDING, False
+
+            if not saved:
+                current = self.get(job_id)
+                status = current.status if current is not None else None
+                logger.warning(
+                    f"Cannot cancel job {job_id}: changed while cancelling"
+                )
+                return status, False
 
         logger.info(f"Job cancelled: {job_id}")
-        return True
+        return JobStatus.PENDING, True
 
     def delete(self, job_id: str) -> bool:
         """
@@ -206,6 +306,9 @@ class JobQueue:
 
         try:
             job_file.unlink()
+            lock, shard = self._cache_shard(job_id)
+            with lock:
+                shard.pop(job_id, None)
             logger.info(f"Job deleted: {job_id}")
             return True
 
@@ -275,22 +378,136 @@ class JobQueue:
 
         return stats
 
-    def _save_job(self, job: Job) -> None:
+    def _load_job_data(self, job_file: Path) -> Optional[dict]:
+        """
+        Load a job file's contents, reusing the cached parse if unchanged.
+
+        Args:
+            job_file: Path to the job JSON file
+
+        Returns:
+            Copy of the job dictionary, or None if the file does not exist
+        """
+        job_id = job_file.stem
+
+        try:
+            st = os.stat(job_file)
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        lock, shard = self._cache_shard(job_id)
+        with lock:
+            entry = shard.get(job_id)
+            if entry is not None and entry[0] == key:
+                shard.move_to_end(job_id)
+
+        # Cached dicts are replaced, never mutated, so copy outside the lock
+        if entry is not None and entry[0] == key:
+            return copy.deepcopy(entry[1])
+
+        try:
+            with open(job_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        self._cache_put(job_id, key, data)
+        return copy.deepcopy(data)
+
+    def _cache_shard(self, job_id: str) -> tuple[threading.Lock, OrderedDict]:
+        """Get the (lock, entries) cache shard holding a job ID."""
+        return self._cache_shards[hash(job_id) & self._shard_mask]
+
+    def _cache_put(self, job_id: str, key: tuple, data: dict) -> None:
+        """Store a parsed job file, evicting its shard's least recently used."""
+        if self.cache_size <= 0:
+            return
+
+        lock, shard = self._cache_shard(job_id)
+        with lock:
+            shard[job_id] = (key, data)
+            shard.move_to_end(job_id)
+            while len(shard) > self._shard_size:
+                shard.popitem(last=False)
+
+    def _save_lock(self, job_id: str) -> threading.RLock:
+        """Get the lock serializing saves of a job ID."""
+        return self._save_locks[hash(job_id) & self._shard_mask]
+
+    def _save_job(self, job: Job, expected_revision: Optional[int] = None) -> bool:
         """
         Save job to storage.
 
         Args:
             job: Job instance to save
+            expected_revision: Only save if the stored job still has this
+                revision (optional)
+
+        Returns:
+            True if saved, False if the stored revision didn't match
 
         Raises:
             IOError: If save fails
         """
+        with self._save_lock(job.job_id):
+            if expected_revision is not None:
+                stored = self._load_job_data(self.jobs_dir / f"{job.job_id}.json")
+                if stored is None or stored.get("revision") != expected_revision:
+                    return False
+
+            self._write_job(job)
+
+        for callback in self._listeners:
+            try:
+                callback(job)
+            except Exception as e:
+                logger.warning(f"Job listener failed for {job.job_id}: {e}")
+
+        return True
+
+    def _write_job(self, job: Job) -> None:
+        """
+        Write a job file and cache its contents.
+
+        Args:
+            job: Job instance to write
+
+        Raises:
+            IOError: If the write fails
+        """
         job_file = self.jobs_dir / f"{job.job_id}.json"
+        tmp_file = None
 
         try:
-            with open(job_file, "w", encoding="utf-8") as f:
-                json.dump(job.to_dict(), f, indent=2)
+            # Write then rename so concurrent readers never see a partial file.
+            # Each save gets its own temp file so concurrent saves of one job
+            # can't interleave their writes.
+            data = job.to_dict()
+            data["revision"] = job.revision + 1
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.jobs_dir, prefix=f"{job.job_id}.", suffix=".json.tmp"
+            )
+            tmp_file = Path(tmp_name)
+            # Encode in one shot and write once rather than streaming
+            # json.dump's many small chunks through the file object
+            with open(fd, "w", encoding="utf-8") as f:
+                os.fchmod(f.fileno(), self._file_mode)
+                f.write(json.dumps(data, indent=2))
+                f.flush()
+                # Key the cache on this file's own stat, taken before the
+                # rename: stat'ing job_file afterwards could see a concurrent
+                # save's file and cache this data under its key
+                st = os.fstat(f.fileno())
+            os.replace(tmp_file, job_file)
+            tmp_file = None
+            job.revision = data["revision"]
+
+            self._cache_put(job.job_id, (st.st_ino, st.st_mtime_ns, st.st_size), data)
 
         except Exception as e:
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to save job {job.job_id}: {e}")
             raise IOError(f"Job save failed: {e}") from e
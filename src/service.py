@@ -0,0 +1,151 @@
+"""
+Shared in-process service for the avatar pipeline.
+
+Holds a single VRAM manager, the profile managers, and lazily constructed
+model wrappers so that repeated calls within one Python process reuse the
+same instances instead of rebuilding them on every invocation.
+"""
+
+import logging
+import threading
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from .avatar import AvatarProfileManager, MediaPipeFaceDetector, SDXLAvatarGenerator
+from .config import load_config
+from .orchestration import PipelineCoordinator
+from .utils import VRAMManager
+from .video import FFmpegEncoder, MuseTalkLipSync
+from .voice import CoquiTTSSynthesizer, VoiceProfileManager, XTTSVoiceCloner
+
+logger = logging.getLogger(__name__)
+
+
+class AvatarService:
+    """
+    Process-wide container for pipeline components.
+
+    Components are created on first access and kept for the lifetime of
+    the service, so the examples, CLI, and API can share one VRAM manager
+    and one set of model wrappers per process.
+
+    Usage:
+        service = get_service()
+        result = service.cloner.clone_voice(audio_path, "My Voice")
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        storage_path: Path = Path("storage"),
+        vram_manager: Optional[VRAMManager] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            config: Configuration dictionary (from load_config)
+            storage_path: Base storage directory for profiles and temp files
+            vram_manager: Existing VRAM manager to share (default: create one)
+        """
+        self.config = config
+        self.storage_path = Path(storage_path)
+        self.vram_manager = vram_manager or VRAMManager()
+
+        logger.info(f"Avatar service initialized (storage: {self.storage_path})")
+
+    @cached_property
+    def voice_profile_manager(self) -> VoiceProfileManager:
+        """Voice profile manager."""
+        return VoiceProfileManager(self.storage_path)
+
+    @cached_property
+    def avatar_profile_manager(self) -> AvatarProfileManager:
+        """Avatar profile manager."""
+        return AvatarProfileManager(self.storage_path)
+
+    @cached_property
+    def face_detector(self) -> MediaPipeFaceDetector:
+        """MediaPipe face detector."""
+        return MediaPipeFaceDetector()
+
+    @cached_property
+    def encoder(self) -> FFmpegEncoder:
+        """FFmpeg video encoder."""
+        return FFmpegEncoder()
+
+    @cached_property
+    def cloner(self) -> XTTSVoiceCloner:
+        """XTTS-v2 voice cloner."""
+        return XTTSVoiceCloner(
+            config=self.config.get("voice", {}).get("xtts", {}),
+            vram_manager=self.vram_manager,
+            profile_manager=self.voice_profile_manager,
+        )
+
+    @cached_property
+    def synthesizer(self) -> CoquiTTSSynthesizer:
+        """Coqui TTS synthesizer."""
+        return CoquiTTSSynthesizer(
+            config=self.config.get("voice", {}).get("tts", {}),
+            vram_manager=self.vram_manager,
+        )
+
+    @cached_property
+    def generator(self) -> SDXLAvatarGenerator:
+        """SDXL avatar generator."""
+        return SDXLAvatarGenerator(
+            config=self.config.get("avatar", {}).get("sdxl", {}),
+            vram_manager=self.vram_manager,
+            profile_manager=self.avatar_profile_manager,
+            face_detector=self.face_detector,
+        )
+
+    @cached_property
+    def lipsync(self) -> MuseTalkLipSync:
+        """MuseTalk lip-sync engine."""
+        return MuseTalkLipSync(
+            config=self.config.get("video", {}).get("musetalk", {}),
+            vram_manager=self.vram_manager,
+        )
+
+    @cached_property
+    def coordinator(self) -> PipelineCoordinator:
+        """Full pipeline coordinator."""
+        return PipelineCoordinator(
+            config=self.config,
+            vram_manager=self.vram_manager,
+            storage_path=self.storage_path,
+        )
+
+
+# Process-wide service instance
+_service: Optional[AvatarService] = None
+_service_lock = threading.Lock()
+
+
+def get_service(
+    config_path: Optional[Path] = None,
+    storage_path: Path = Path("storage"),
+) -> AvatarService:
+    """
+    Get the process-wide avatar service, creating it on first call.
+
+    Args:
+        config_path: Path to config YAML file (used on first call only)
+        storage_path: Base storage directory (used on first call only)
+
+    Returns:
+        Shared AvatarService instance
+    """
+    global _service
+
+    with _service_lock:
+        if _service is None:
+            _service = AvatarService(
+                config=load_config(config_path),
+                storage_path=storage_path,
+            )
+
+    return _service
@@ -1,12 +1,24 @@
 """
 Utility modules for the avatar pipeline.
 
-Includes VRAM management and other helper functions.
+Includes VRAM management, FP8 quantization, image I/O, and other helper
+functions.
 """
 
-from .vram import VRAMManager, VRAMStatus
+from .formatting import human_size
+from .image_io import decode_rgb, fast_save, load_rgb
+from .quantization import FP8Linear, fp8_available, quantize_linear_layers
+from .vram import VRAMManager, VRAMStatus, exclusive_model
 
 __all__ = [
+    "decode_rgb",
+    "fast_save",
+    "load_rgb",
+    "human_size",
+    "FP8Linear",
+    "fp8_available",
+    "quantize_linear_layers",
     "VRAMManager",
     "VRAMStatus",
+    "exclusive_model",
 ]
@@ -0,0 +1,16 @@
+"""
+Formatting helpers for user-facing output.
+"""
+
+
+def human_size(num_bytes: int) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        Size in megabytes, e.g. "12.34 MB"
+    """
+    return f"{num_bytes / 1024 / 1024:.2f} MB"
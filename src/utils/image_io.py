@@ -0,0 +1,138 @@
+"""
+Fast image reading and writing for avatars.
+
+JPEG input and output go through libjpeg-turbo (PyTurboJPEG) when it is
+installed; PNG output uses zlib level 1, which encodes several times faster
+than PIL's default level 6 at a modest size cost. WebP output is lossy and
+much smaller than PNG. Images are decoded straight to RGB rather than
+decoded to BGR and then converted.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+JPEG_SUFFIXES = (".jpg", ".jpeg")
+
+# Leading bytes of every JPEG file
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+# zlib level for PNG output (PIL default is 6)
+PNG_COMPRESS_LEVEL = 1
+
+# libwebp effort (0 = fastest, 6 = smallest)
+WEBP_METHOD = 4
+
+
+@lru_cache(maxsize=1)
+def _get_turbojpeg():
+    """Return a shared TurboJPEG encoder, or None if unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError) as e:
+        # OSError/RuntimeError: Python bindings present but libturbojpeg missing
+        logger.debug(f"TurboJPEG not available, using PIL for JPEG: {e}")
+        return None
+
+
+def decode_rgb(data: bytes) -> np.ndarray | None:
+    """
+    Decode encoded image bytes straight to an RGB array.
+
+    Args:
+        data: Encoded image (JPEG, PNG, or anything OpenCV reads)
+
+    Returns:
+        HxWx3 uint8 RGB array, or None if the data isn't a readable image
+    """
+    if data.startswith(JPEG_MAGIC):
+        decoder = _get_turbojpeg()
+        if decoder is not None:
+            from turbojpeg import TJPF_RGB
+
+            try:
+                return decoder.decode(data, pixel_format=TJPF_RGB)
+            except OSError as e:
+                logger.debug(f"TurboJPEG decode failed, trying OpenCV: {e}")
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if hasattr(cv2, "IMREAD_COLOR_RGB"):
+        # Newer OpenCV builds swap channels inside the decoder
+        return cv2.imdecode(buffer, cv2.IMREAD_COLOR_RGB)
+
+    image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if image is None:
+        return None
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def load_rgb(path: Path) -> np.ndarray | None:
+    """
+    Read an image file straight to an RGB array.
+
+    Args:
+        path: Image file
+
+    Returns:
+        HxWx3 uint8 RGB array, or None if the file isn't a readable image
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return decode_rgb(Path(path).read_bytes())
+
+
+def fast_save(
+    image: Image.Image | np.ndarray, path: Path, quality: int = 95
+) -> None:
+    """
+    Save an RGB image, picking the fastest encoder for the file type.
+
+    Args:
+        image: PIL image or HxWx3 uint8 RGB array
+        path: Output path; the suffix selects the format
+        quality: JPEG/WebP quality (ignored for other formats)
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix in JPEG_SUFFIXES:
+        encoder = _get_turbojpeg()
+        if encoder is not None:
+            from turbojpeg import TJPF_RGB
+
+            array = np.ascontiguousarray(_to_rgb_array(image))
+            path.write_bytes(
+                encoder.encode(array, quality=quality, pixel_format=TJPF_RGB)
+            )
+            return
+
+        _to_pil(image).convert("RGB").save(path, quality=quality)
+    elif suffix == ".png":
+        _to_pil(image).save(path, optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+    elif suffix == ".webp":
+        _to_pil(image).save(path, format="WEBP", quality=quality, method=WEBP_METHOD)
+    else:
+        _to_pil(image).save(path)
+
+
+def _to_pil(image: Image.Image | np.ndarray) -> Image.Image:
+    """Convert an array to a PIL image (PIL images pass through)."""
+    if isinstance(image, Image.Image):
+        return image
+    return Image.fromarray(image)
+
+
+def _to_rgb_array(image: Image.Image | np.ndarray) -> np.ndarray:
+    """Convert an image to an HxWx3 uint8 RGB array."""
+    if isinstance(image, Image.Image):
+        return np.asarray(image.convert("RGB"))
+    return image
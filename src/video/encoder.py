@@ -7,14 +7,26 @@ Provides video encoding, audio mixing, and video manipulation using FFmpeg.
 import logging
 import shutil
 import subprocess
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from .interfaces import EncodingConfig, EncodingResult, VideoEncoderInterface
 
 logger = logging.getLogger(__name__)
 
+# Read size for streamed FFmpeg output
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Number of probed files whose metadata is kept
+INFO_CACHE_SIZE = 1024
+
 
 class FFmpegEncoder(VideoEncoderInterface):
     """
@@ -28,6 +40,10 @@ class FFmpegEncoder(VideoEncoderInterface):
         """Initialize FFmpeg encoder."""
         self._ffmpeg_available = self._check_ffmpeg()
 
+        # ffprobe results keyed by (path, inode, mtime, size)
+        self._info_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._info_lock = threading.Lock()
+
         if not self._ffmpeg_available:
             logger.warning(
                 "FFmpeg not found in PATH. Video encoding will not work. "
@@ -134,6 +150,274 @@ class FFmpegEncoder(VideoEncoderInterface):
                 processing_time_seconds=processing_time,
             )
 
+    def encode_streaming(
+        self,
+        input_video: Path,
+        config: Optional[EncodingConfig] = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> Iterator[bytes]:
+        """
+        Encode a video to fragmented MP4, yielding bytes as FFmpeg writes them.
+
+        Nothing is written to disk, and callers can forward chunks while
+        encoding is still running. This blocks until FFmpeg writes its
+        first bytes, so setup errors and inputs FFmpeg rejects outright are
+        raised here, before any output is produced.
+
+        Args:
+            input_video: Path to input video file
+            config: Optional encoding configuration
+            chunk_size: Maximum bytes per yielded chunk
+
+        Returns:
+            Iterator over the encoded MP4 bytes. Closing it early stops FFmpeg.
+
+        Raises:
+            FileNotFoundError: If the input video does not exist
+            RuntimeError: If FFmpeg is not available or fails before
+                producing output
+        """
+        if not input_video.exists():
+            raise FileNotFoundError(f"Input video not found: {input_video}")
+
+        if not self._ffmpeg_available:
+            raise RuntimeError("FFmpeg not available")
+
+        if config is None:
+            config = EncodingConfig()
+
+        logger.info(f"Streaming encode: {input_video}")
+
+        # Fragmented MP4 needs no seek back to write the moov atom
+        cmd = [
+            "ffmpeg",
+            "-loglevel", "error",
+            "-i", str(input_video),  # Input file
+            "-c:v", config.codec,  # Video codec
+            "-preset", config.preset,  # Encoding preset
+            "-crf", str(config.crf),  # Quality setting
+            "-c:a", config.audio_codec,  # Audio codec
+            "-b:a", config.audio_bitrate,  # Audio bitrate
+            "-pix_fmt", "yuv420p",  # Pixel format for compatibility
+            "-f", "mp4",
+            "-movflags", "frag_keyframe+empty_moov",
+            "pipe:1",
+        ]
+
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        # stderr goes to a temp file so it can't fill a pipe and stall FFmpeg
+        stderr_file = tempfile.TemporaryFile()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+
+        # Read the first chunk now: once a response has started streaming,
+        # a failure can only show up as a truncated file
+        try:
+            first_chunk = proc.stdout.read(chunk_size)
+            if not first_chunk and proc.wait(timeout=600) != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+                raise RuntimeError(f"FFmpeg streaming encode failed: {stderr}")
+        except BaseException:
+            self._stop_stream(proc, stderr_file)
+            raise
+
+        return self._read_stream(proc, stderr_file, chunk_size, first_chunk)
+
+    def _read_stream(
+        self,
+        proc: subprocess.Popen,
+        stderr_file,
+        chunk_size: int,
+        first_chunk: bytes,
+    ) -> Iterator[bytes]:
+        """Yield a process's stdout, then check its exit status."""
+        start_time = time.time()
+        total = 0
+
+        try:
+            chunk = first_chunk
+            while chunk:
+                total += len(chunk)
+                yield chunk
+                chunk = proc.stdout.read(chunk_size)
+
+            returncode = proc.wait(timeout=600)
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+                # Headers are already sent; the client sees a truncated file
+                logger.error(f"FFmpeg streaming encode failed: {stderr}")
+                return
+
+            logger.info(
+                f"Streaming encode complete: {total / 1024 / 1024:.2f}MB, "
+                f"took {time.time() - start_time:.2f}s"
+            )
+
+        finally:
+            # Stop FFmpeg if the consumer went away early
+            self._stop_stream(proc, stderr_file)
+
+    @staticmethod
+    def _stop_stream(proc: subprocess.Popen, stderr_file) -> None:
+        """Kill a streaming FFmpeg process if still running and close its files."""
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        stderr_file.close()
+
+    def encode_frames(
+        self,
+        frames: Iterable,
+        audio_path: Path,
+        output_path: Path,
+        fps: int,
+        config: Optional[EncodingConfig] = None,
+    ) -> EncodingResult:
+        """
+        Encode RGB frames and audio into a video in a single FFmpeg pass.
+
+        Frames are piped to FFmpeg's stdin as raw RGB24, so no intermediate
+        video file is written.
+
+        Args:
+            frames: Iterable of HxWx3 uint8 RGB frames (numpy arrays or
+                tensors), all the same size
+            audio_path: Path to audio file to mux
+            output_path: Where to save encoded video
+            fps: Frames per second
+            config: Optional encoding configuration
+
+        Returns:
+            EncodingResult with success status and file info
+        """
+        start_time = time.time()
+
+        try:
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio not found: {audio_path}")
+
+            if not self._ffmpeg_available:
+                raise RuntimeError("FFmpeg not available")
+
+            if config is None:
+                config = EncodingConfig()
+
+            # Peek at the first frame for dimensions
+            frames = iter(frames)
+            first = next(frames, None)
+            if first is None:
+                raise ValueError("No frames to encode")
+            first = self._frame_to_array(first)
+            height, width = first.shape[:2]
+
+            logger.info(
+                f"Encoding {width}x{height}@{fps}fps frames with {audio_path} "
+                f"-> {output_path}"
+            )
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            cmd = [
+                "ffmpeg",
+                "-y",  # Overwrite output
+                "-loglevel", "error",
+                "-f", "rawvideo",  # Raw frames on stdin
+                "-pix_fmt", "rgb24",
+                "-s", f"{width}x{height}",
+                "-r", str(fps),
+                "-i", "-",
+                "-i", str(audio_path),  # Input audio
+                "-c:v", config.codec,  # Video codec
+                "-preset", config.preset,  # Encoding preset
+                "-crf", str(config.crf),  # Quality setting
+                "-c:a", config.audio_codec,  # Audio codec
+                "-b:a", config.audio_bitrate,  # Audio bitrate
+                "-pix_fmt", "yuv420p",  # Pixel format for compatibility
+                "-map", "0:v:0",
+                "-map", "1:a:0",
+                "-shortest",  # Match shortest stream duration
+                str(output_path),
+            ]
+
+            logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+            # stderr goes to a temp file so a chatty FFmpeg can't block on a
+            # full pipe while we are writing frames
+            with tempfile.TemporaryFile() as stderr_file:
+                proc = subprocess.Popen(
+                    cmd, stdin=subprocess.PIPE, stderr=stderr_file
+                )
+
+                frame_count = 0
+                try:
+                    proc.stdin.write(first.data)
+                    frame_count += 1
+                    for frame in frames:
+                        array = self._frame_to_array(frame)
+                        # Raw frames have no header, so a wrong size would
+                        # silently shift every following frame
+                        if array.shape != first.shape:
+                            raise ValueError(
+                                f"Frame {frame_count} has shape {array.shape}, "
+                                f"expected {first.shape}"
+                            )
+                        proc.stdin.write(array.data)
+                        frame_count += 1
+                except BrokenPipeError:
+                    # FFmpeg exited early; the error is reported below
+                    pass
+                except Exception:
+                    proc.kill()
+                    proc.wait()
+                    output_path.unlink(missing_ok=True)
+                    raise
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except BrokenPipeError:
+                        pass
+
+                returncode = proc.wait(timeout=600)
+
+                if returncode != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode(errors="replace")
+                    raise RuntimeError(f"FFmpeg frame encoding failed: {stderr}")
+
+            file_size = output_path.stat().st_size
+            duration = self._get_video_duration(output_path)
+
+            processing_time = time.time() - start_time
+            logger.info(
+                f"Frame encoding complete: {frame_count} frames, "
+                f"{file_size / 1024 / 1024:.2f}MB, took {processing_time:.2f}s"
+            )
+
+            return EncodingResult(
+                success=True,
+                output_path=output_path,
+                file_size_bytes=file_size,
+                duration_seconds=duration,
+                error=None,
+                processing_time_seconds=processing_time,
+            )
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+            logger.error(f"Frame encoding failed: {e}")
+
+            return EncodingResult(
+                success=False,
+                output_path=None,
+                file_size_bytes=0,
+                duration_seconds=0.0,
+                error=str(e),
+                processing_time_seconds=processing_time,
+            )
+
     def add_audio(
         self,
         video_path: Path,
@@ -326,6 +610,9 @@ class FFmpegEncoder(VideoEncoderInterface):
         """
         Get video metadata.
 
+        Results are cached per file and reused until the file's inode,
+        mtime or size changes, so repeat queries skip spawning ffprobe.
+
         Args:
             video_path: Path to video file
 
@@ -335,9 +622,29 @@ class FFmpegEncoder(VideoEncoderInterface):
         Raises:
             RuntimeError: If FFmpeg probe fails
         """
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video not found: {video_path}")
+        try:
+            st = video_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video not found: {video_path}") from None
+
+        cache_key = (str(video_path), st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._info_lock:
+            info = self._info_cache.get(cache_key)
+            if info is not None:
+                self._info_cache.move_to_end(cache_key)
+                return dict(info)
+
+        info = self._probe_video_info(video_path)
+
+        with self._info_lock:
+            self._info_cache[cache_key] = info
+            while len(self._info_cache) > INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+
+        return dict(info)
 
+    def _probe_video_info(self, video_path: Path) -> dict:
+        """Run ffprobe for get_video_info."""
         if not self._ffmpeg_available:
             raise RuntimeError("FFmpeg not available")
 
@@ -429,6 +736,21 @@ class FFmpegEncoder(VideoEncoderInterface):
             logger.warning(f"FFmpeg check failed: {e}")
             return False
 
+    @staticmethod
+    def _frame_to_array(frame) -> np.ndarray:
+        """
+        Convert a frame to a contiguous uint8 numpy array.
+
+        Args:
+            frame: HxWx3 RGB frame (numpy array or torch tensor)
+
+        Returns:
+            C-contiguous uint8 array
+        """
+        if hasattr(frame, "cpu"):
+            frame = frame.cpu().numpy()
+        return np.ascontiguousarray(frame, dtype=np.uint8)
+
     def _get_video_duration(self, video_path: Path) -> float:
         """
         Get video duration in seconds.
@@ -43,6 +43,7 @@ class LipSyncResult:
         resolution: Video resolution as (width, height)
         error: Error message (if failed)
         processing_time_seconds: Time taken for generation
+        file_size_bytes: Size of the video file, recorded when it was written
     """
 
     success: bool
@@ -53,6 +54,7 @@ class LipSyncResult:
     resolution: tuple[int, int]
     error: Optional[str]
     processing_time_seconds: float
+    file_size_bytes: int = 0
 
 
 @dataclass
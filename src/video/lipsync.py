@@ -6,6 +6,7 @@ Uses VRAM-aware loading and automatic cleanup.
 """
 
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -14,11 +15,16 @@ import torch
 import torchaudio
 from PIL import Image
 
-from ..utils.vram import VRAMManager
+from ..utils.quantization import quantize_linear_layers
+from ..utils.vram import VRAMManager, exclusive_model
+from ..voice.interfaces import AudioBuffer
 from .interfaces import LipSyncConfig, LipSyncEngineInterface, LipSyncResult
 
 logger = logging.getLogger(__name__)
 
+# Submodules kept in full precision when quantizing (image quality critical)
+QUANTIZE_SKIP = ("vae", "decoder", "face_projector")
+
 # Quality presets for lip-sync generation
 QUALITY_PRESETS = {
     "high": {"fps": 25, "face_det_batch": 1, "wav2lip_batch": 1},
@@ -53,9 +59,16 @@ class MuseTalkLipSync(LipSyncEngineInterface):
         self.config = config
         self.vram_manager = vram_manager
         self._model = None
+        # Held for each load-run-unload call (see exclusive_model)
+        self._model_lock = threading.RLock()
         self._device = None
         self._musetalk_available = False
 
+        # Preprocessing transforms, built once and reused across calls
+        self._avatar_transform = None
+        self._mel_transform = None
+        self._resamplers: dict[int, torch.nn.Module] = {}
+
         # Model settings
         self.vram_requirement_mb = 5120  # MuseTalk requires ~5GB
         self.max_video_seconds = 120.0  # Maximum video length
@@ -76,21 +89,29 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             f"MuseTalk lip-sync initialized (fallback mode: {not self._musetalk_available})"
         )
 
+        if config.get("warmup", False):
+            self.warmup()
+
+    @exclusive_model
+    @torch.inference_mode()
     def generate(
         self,
         avatar_image: Path,
         audio_file: Path,
         output_path: Path,
         config: Optional[LipSyncConfig] = None,
+        audio_buffer: Optional[AudioBuffer] = None,
     ) -> LipSyncResult:
         """
         Generate lip-synced video from avatar image and audio.
 
         Args:
             avatar_image: Path to avatar image
-            audio_file: Path to audio file
+            audio_file: Path to audio file (muxed into the output video)
             output_path: Where to save video
             config: Optional lip-sync configuration
+            audio_buffer: In-memory samples of audio_file, if already
+                available, so the file is not decoded again
 
         Returns:
             LipSyncResult with success status and video info
@@ -106,7 +127,10 @@ class MuseTalkLipSync(LipSyncEngineInterface):
                 raise FileNotFoundError(f"Audio file not found: {audio_file}")
 
             # Get audio duration
-            audio_duration = self._get_audio_duration(audio_file)
+            if audio_buffer is not None:
+                audio_duration = audio_buffer.duration_seconds
+            else:
+                audio_duration = self._get_audio_duration(audio_file)
 
             if audio_duration > self.max_video_seconds:
                 raise ValueError(
@@ -133,7 +157,12 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             # Choose generation method
             if self._musetalk_available:
                 result = self._generate_with_musetalk(
-                    avatar_image, audio_file, output_path, config, audio_duration
+                    avatar_image,
+                    audio_file,
+                    output_path,
+                    config,
+                    audio_duration,
+                    audio_buffer,
                 )
             else:
                 result = self._generate_fallback(
@@ -171,6 +200,48 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             "video": ["mp4"],
         }
 
+    @exclusive_model
+    @torch.inference_mode()
+    def warmup(self) -> bool:
+        """
+        Run one MuseTalk forward so the first real call skips CUDA setup.
+
+        Uses a blank 256x256 avatar and one second of silence. The CUDA
+        context and cuDNN autotuning cache persist after the model is
+        unloaded.
+
+        Returns:
+            True if warmup ran, False if skipped or failed
+        """
+        if not self._musetalk_available or not torch.cuda.is_available():
+            logger.debug("MuseTalk or CUDA not available, skipping warmup")
+            return False
+
+        try:
+            start_time = time.time()
+            self._load_model()
+
+            avatar = torch.zeros(1, 3, 256, 256, device=self._device)
+            silence = AudioBuffer(waveform=torch.zeros(1, 16000), sample_rate=16000)
+            audio_features = self._extract_audio_features(Path(), silence)
+
+            self._model.generate_frames(
+                avatar=avatar,
+                audio_features=audio_features,
+                fps=25,
+                batch_size=1,
+            )
+
+            logger.info(f"MuseTalk warmup complete ({time.time() - start_time:.2f}s)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"MuseTalk warmup failed: {e}")
+            return False
+
+        finally:
+            self._unload_model()
+
     def _generate_with_musetalk(
         self,
         avatar_image: Path,
@@ -178,6 +249,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
         output_path: Path,
         config: LipSyncConfig,
         audio_duration: float,
+        audio_buffer: Optional[AudioBuffer] = None,
     ) -> LipSyncResult:
         """
         Generate video using MuseTalk model.
@@ -188,6 +260,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             output_path: Where to save video
             config: Lip-sync configuration
             audio_duration: Duration of audio in seconds
+            audio_buffer: In-memory samples of audio_file (optional)
 
         Returns:
             LipSyncResult with generation results
@@ -206,7 +279,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             avatar_tensor = self._preprocess_avatar(avatar_image)
 
             # Extract audio features
-            audio_features = self._extract_audio_features(audio_file)
+            audio_features = self._extract_audio_features(audio_file, audio_buffer)
 
             # Generate video frames
             logger.info("Generating lip-sync frames...")
@@ -222,7 +295,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             height, width = frames[0].shape[:2]
 
             # Save video
-            self._save_video(
+            file_size = self._save_video(
                 frames, audio_file, output_path, fps=config.fps
             )
 
@@ -240,6 +313,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
                 resolution=(width, height),
                 error=None,
                 processing_time_seconds=processing_time,
+                file_size_bytes=file_size,
             )
 
         except Exception as e:
@@ -332,6 +406,7 @@ class MuseTalkLipSync(LipSyncEngineInterface):
                 resolution=(width, height),
                 error=None,
                 processing_time_seconds=processing_time,
+                file_size_bytes=output_path.stat().st_size,
             )
 
         except Exception as e:
@@ -361,6 +436,13 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             # Load MuseTalk model
             self._model = musetalk.MuseTalkModel(device=self._device)
 
+            # Optional 8-bit weight storage for the transformer blocks
+            if self.config.get("quantize") == "8bit":
+                if isinstance(self._model, torch.nn.Module):
+                    quantize_linear_layers(self._model, skip=QUANTIZE_SKIP)
+                else:
+                    logger.warning("MuseTalk model is not an nn.Module, skipping quantization")
+
             logger.info(f"MuseTalk model loaded on {self._device}")
             self.vram_manager.log_status()
 
@@ -402,18 +484,19 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             image = Image.open(image_path).convert("RGB")
 
             # Convert to tensor and normalize (MuseTalk expects [0, 1] range)
-            import torchvision.transforms as transforms
-
-            transform = transforms.Compose(
-                [
-                    transforms.ToTensor(),
-                    transforms.Normalize(
-                        mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]
-                    ),
-                ]
-            )
+            if self._avatar_transform is None:
+                import torchvision.transforms as transforms
+
+                self._avatar_transform = transforms.Compose(
+                    [
+                        transforms.ToTensor(),
+                        transforms.Normalize(
+                            mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5]
+                        ),
+                    ]
+                )
 
-            tensor = transform(image).unsqueeze(0)  # Add batch dimension
+            tensor = self._avatar_transform(image).unsqueeze(0)  # Add batch dimension
 
             if self._device:
                 tensor = tensor.to(self._device)
@@ -425,19 +508,25 @@ class MuseTalkLipSync(LipSyncEngineInterface):
             logger.error(f"Avatar preprocessing failed: {e}")
             raise RuntimeError(f"Failed to preprocess avatar: {e}") from e
 
-    def _extract_audio_features(self, audio_path: Path) -> torch.Tensor:
+    def _extract_audio_features(
+        self, audio_path: Path, audio_buffer: Optional[AudioBuffer] = None
+    ) -> torch.Tensor:
         """
         Extract audio features for MuseTalk.
 
         Args:
             audio_path: Path to audio file
+            audio_buffer: In-memory samples to use instead of reading audio_path
 
         Returns:
             Audio feature tensor (mel spectrogram)
         """
         try:
             # Load audio
-            waveform, sample_rate = torchaudio.load(audio_path)
+            if audio_buffer is not None:
+                waveform, sample_rate = audio_buffer.waveform, audio_buffer.sample_rate
+            else:
+                waveform, sample_rate = torchaudio.load(audio_path)
 
             # Convert to mono if stereo
             if waveform.shape[0] > 1:
@@ -445,20 +534,24 @@ class MuseTalkLipSync(LipSyncEngineInterface):
 
             # Resample to 16kHz (MuseTalk requirement)
             if sample_rate != 16000:
-                resampler = torchaudio.transforms.Resample(
-                    orig_freq=sample_rate, new_freq=16000
-                )
+                resampler = self._resamplers.get(sample_rate)
+                if resampler is None:
+                    resampler = torchaudio.transforms.Resample(
+                        orig_freq=sample_rate, new_freq=16000
+                    )
+                    self._resamplers[sample_rate] = resampler
                 waveform = resampler(waveform)
 
-            # Extract mel spectrogram
-            mel_transform = torchaudio.transforms.MelSpectrogram(
-                sample_rate=16000,
-                n_fft=1024,
-                hop_length=256,
-                n_mels=80,
-            )
+            # Extract mel spectrogram (filterbank is built once)
+            if self._mel_transform is None:
+                self._mel_transform = torchaudio.transforms.MelSpectrogram(
+                    sample_rate=16000,
+                    n_fft=1024,
+                    hop_length=256,
+                    n_mels=80,
+                )
 
-            mel_spec = mel_transform(waveform)
+            mel_spec = self._mel_transform(waveform)
 
             if self._device:
                 mel_spec = mel_spec.to(self._device)
@@ -472,60 +565,33 @@ class MuseTalkLipSync(LipSyncEngineInterface):
 
     def _save_video(
         self, frames: list, audio_path: Path, output_path: Path, fps: int
-    ) -> None:
+    ) -> int:
         """
         Save generated frames as video with audio.
 
+        Frames are streamed straight into FFmpeg together with the audio,
+        so no intermediate video file is written.
+
         Args:
-            frames: List of video frames (numpy arrays)
+            frames: Video frames (numpy arrays or tensors, RGB)
             audio_path: Path to audio file to add
             output_path: Where to save video
             fps: Frames per second
-        """
-        try:
-            import cv2
-            import numpy as np
-
-            # Get frame dimensions
-            height, width = frames[0].shape[:2]
-
-            # Create video writer
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            temp_video = output_path.with_suffix(".temp.mp4")
 
-            writer = cv2.VideoWriter(
-                str(temp_video), fourcc, fps, (width, height)
-            )
-
-            # Write frames
-            for frame in frames:
-                # Convert RGB to BGR for OpenCV
-                if isinstance(frame, torch.Tensor):
-                    frame = frame.cpu().numpy()
-
-                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                writer.write(frame_bgr)
-
-            writer.release()
-
-            # Add audio using FFmpeg
-            from .encoder import FFmpegEncoder
-
-            encoder = FFmpegEncoder()
-            result = encoder.add_audio(temp_video, audio_path, output_path)
-
-            # Clean up temp file
-            if temp_video.exists():
-                temp_video.unlink()
+        Returns:
+            Size of the written video in bytes
+        """
+        from .encoder import FFmpegEncoder
 
-            if not result.success:
-                raise RuntimeError(f"Failed to add audio: {result.error}")
+        encoder = FFmpegEncoder()
+        result = encoder.encode_frames(frames, audio_path, output_path, fps=fps)
 
-            logger.debug(f"Saved video: {output_path}")
+        if not result.success:
+            logger.error(f"Video saving failed: {result.error}")
+            raise RuntimeError(f"Failed to save video: {result.error}")
 
-        except Exception as e:
-            logger.error(f"Video saving failed: {e}")
-            raise RuntimeError(f"Failed to save video: {e}") from e
+        logger.debug(f"Saved video: {output_path}")
+        return result.file_size_bytes
 
     def _get_audio_duration(self, audio_path: Path) -> float:
         """
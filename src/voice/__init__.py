@@ -6,6 +6,7 @@ VRAM-aware sequential model loading.
 """
 
 from .interfaces import (
+    AudioBuffer,
     CloneResult,
     SynthesisResult,
     TTSSynthesizerInterface,
@@ -18,6 +19,7 @@ from .profiles import VoiceProfileManager
 
 __all__ = [
     # Interfaces
+    "AudioBuffer",
     "VoiceProfile",
     "CloneResult",
     "SynthesisResult",
@@ -6,6 +6,7 @@ Uses VRAM-aware loading and automatic cleanup.
 """
 
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -13,7 +14,8 @@ from typing import Optional
 import torch
 import torchaudio
 
-from ..utils.vram import VRAMManager
+from ..utils.quantization import quantize_linear_layers
+from ..utils.vram import VRAMManager, exclusive_model
 from .interfaces import CloneResult, VoiceClonerInterface
 from .profiles import VoiceProfileManager
 
@@ -67,6 +69,8 @@ class XTTSVoiceCloner(VoiceClonerInterface):
         self.vram_manager = vram_manager
         self.profile_manager = profile_manager
         self._model = None
+        # Held for each load-run-unload call (see exclusive_model)
+        self._model_lock = threading.RLock()
         self._device = None
 
         # Model settings
@@ -76,6 +80,8 @@ class XTTSVoiceCloner(VoiceClonerInterface):
 
         logger.info("XTTS voice cloner initialized")
 
+    @exclusive_model
+    @torch.inference_mode()
     def clone_voice(
         self, reference_audio: Path, profile_name: str, language: str = "en"
     ) -> CloneResult:
@@ -131,6 +137,9 @@ class XTTSVoiceCloner(VoiceClonerInterface):
             logger.info(f"Extracting speaker embedding from {reference_audio}")
             embedding = self._extract_embedding(reference_audio)
 
+            # Precompute conditioning latents once so synthesis can reuse them
+            conditioning = self._extract_conditioning(reference_audio)
+
             # Unload model and cleanup
             self._unload_model()
 
@@ -140,6 +149,7 @@ class XTTSVoiceCloner(VoiceClonerInterface):
                 language=language,
                 embedding=embedding,
                 reference_audio=reference_audio,
+                conditioning=conditioning,
             )
 
             processing_time = time.time() - start_time
@@ -195,6 +205,10 @@ class XTTSVoiceCloner(VoiceClonerInterface):
                 self._device
             )
 
+            # Optional FP8 weight storage for the XTTS backbone
+            if self.config.get("fp8", False):
+                quantize_linear_layers(self._model.synthesizer.tts_model)
+
             logger.info(f"XTTS-v2 model loaded on {self._device}")
             self.vram_manager.log_status()
 
@@ -263,6 +277,35 @@ class XTTSVoiceCloner(VoiceClonerInterface):
             logger.error(f"Embedding extraction failed: {e}")
             raise RuntimeError(f"Failed to extract embedding: {e}") from e
 
+    def _extract_conditioning(self, audio_path: Path) -> dict[str, torch.Tensor]:
+        """
+        Compute XTTS conditioning latents from audio.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Dict with 'gpt_cond_latent' and 'speaker_embedding' CPU tensors
+        """
+        if self._model is None:
+            raise RuntimeError("Model not loaded")
+
+        try:
+            gpt_cond_latent, speaker_embedding = (
+                self._model.synthesizer.tts_model.get_conditioning_latents(
+                    audio_path=[str(audio_path)]
+                )
+            )
+
+            return {
+                "gpt_cond_latent": gpt_cond_latent.cpu(),
+                "speaker_embedding": speaker_embedding.cpu(),
+            }
+
+        except Exception as e:
+            logger.error(f"Conditioning extraction failed: {e}")
+            raise RuntimeError(f"Failed to extract conditioning latents: {e}") from e
+
     def _get_audio_duration(self, audio_path: Path) -> float:
         """
         Get audio duration in seconds.
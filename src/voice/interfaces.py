@@ -8,7 +8,10 @@ and TTS synthesis operations.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import torch
 
 
 @dataclass
@@ -53,6 +56,28 @@ class CloneResult:
     processing_time_seconds: float
 
 
+@dataclass
+class AudioBuffer:
+    """
+    In-memory audio samples.
+
+    Lets synthesized audio be handed to the next stage without
+    decoding it back from disk.
+
+    Attributes:
+        waveform: Audio samples as a (channels, samples) float tensor
+        sample_rate: Sample rate in Hz
+    """
+
+    waveform: "torch.Tensor"
+    sample_rate: int
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of the audio in seconds."""
+        return self.waveform.shape[-1] / self.sample_rate
+
+
 @dataclass
 class SynthesisResult:
     """
@@ -64,6 +89,7 @@ class SynthesisResult:
         duration_seconds: Duration of generated audio
         error: Error message (if failed)
         processing_time_seconds: Time taken for synthesis
+        audio_buffer: Generated samples kept in memory (if successful)
     """
 
     success: bool
@@ -71,6 +97,7 @@ class SynthesisResult:
     duration_seconds: float
     error: Optional[str]
     processing_time_seconds: float
+    audio_buffer: Optional[AudioBuffer] = None
 
 
 class VoiceClonerInterface(ABC):
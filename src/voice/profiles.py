@@ -7,6 +7,7 @@ speaker embeddings and reference audio.
 
 import json
 import logging
+import os
 import secrets
 from datetime import datetime
 from pathlib import Path
@@ -27,7 +28,11 @@ class VoiceProfileManager:
         storage/voices/{profile_id}/
         ├── reference.wav
         ├── embedding.pt
+        ├── conditioning.pt  (optional, precomputed XTTS latents)
         └── metadata.json
+
+    A name -> profile ID index is kept in storage/voice_index.json so
+    name lookups do not have to read every profile's metadata.
     """
 
     def __init__(self, storage_dir: Path):
@@ -39,6 +44,9 @@ class VoiceProfileManager:
         """
         self.storage_dir = Path(storage_dir) / "voices"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = Path(storage_dir) / "voice_index.json"
+        self._name_to_id: Optional[dict[str, str]] = None
+        self._index_mtime_ns: Optional[int] = None
         logger.info(f"Voice profile storage: {self.storage_dir}")
 
     def create_profile(
@@ -47,6 +55,7 @@ class VoiceProfileManager:
         language: str,
         embedding: torch.Tensor,
         reference_audio: Path,
+        conditioning: Optional[dict[str, torch.Tensor]] = None,
     ) -> VoiceProfile:
         """
         Create a new voice profile.
@@ -56,6 +65,8 @@ class VoiceProfileManager:
             language: Language code
             embedding: Speaker embedding tensor
             reference_audio: Path to reference audio file
+            conditioning: Precomputed XTTS conditioning latents
+                (gpt_cond_latent, speaker_embedding) to store with the profile
 
         Returns:
             Created VoiceProfile object
@@ -65,8 +76,7 @@ class VoiceProfileManager:
             IOError: If storage operations fail
         """
         # Check for duplicate names
-        existing = self.list_profiles()
-        if any(p.name == name for p in existing):
+        if self.find_by_name(name) is not None:
             raise ValueError(f"Profile with name '{name}' already exists")
 
         # Generate unique ID
@@ -80,6 +90,12 @@ class VoiceProfileManager:
             torch.save(embedding, embedding_path)
             logger.debug(f"Saved embedding to {embedding_path}")
 
+            # Save conditioning latents so synthesis can skip the encoder
+            if conditioning is not None:
+                conditioning_path = profile_dir / "conditioning.pt"
+                torch.save(conditioning, conditioning_path)
+                logger.debug(f"Saved conditioning latents to {conditioning_path}")
+
             # Copy reference audio
             reference_path = profile_dir / "reference.wav"
             import shutil
@@ -102,6 +118,10 @@ class VoiceProfileManager:
             with open(metadata_path, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2)
 
+            index = self._get_index()
+            index[name] = profile_id
+            self._save_index(index)
+
             logger.info(f"Created voice profile: {profile_id} ({name})")
 
             return VoiceProfile(
@@ -210,6 +230,14 @@ class VoiceProfileManager:
             import shutil
 
             shutil.rmtree(profile_dir)
+
+            index = self._get_index()
+            stale = [name for name, pid in index.items() if pid == profile_id]
+            if stale:
+                for name in stale:
+                    del index[name]
+                self._save_index(index)
+
             logger.info(f"Deleted profile: {profile_id}")
             return True
 
@@ -217,6 +245,81 @@ class VoiceProfileManager:
             logger.error(f"Failed to delete profile {profile_id}: {e}")
             raise IOError(f"Profile deletion failed: {e}") from e
 
+    def find_by_name(self, name: str) -> Optional[VoiceProfile]:
+        """
+        Find a voice profile by name using the name index.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            VoiceProfile if found, None otherwise
+        """
+        profile_id = self._get_index().get(name)
+
+        if profile_id is not None:
+            try:
+                return self.load_profile(profile_id)
+            except FileNotFoundError:
+                # Profile directory removed outside this manager
+                logger.warning(f"Name index is stale for '{name}', rebuilding")
+                profile_id = self.rebuild_index().get(name)
+                if profile_id is not None:
+                    return self.load_profile(profile_id)
+
+        return None
+
+    def rebuild_index(self) -> dict[str, str]:
+        """
+        Rebuild the name index by scanning all profiles.
+
+        Returns:
+            Rebuilt name -> profile ID mapping
+        """
+        index = {profile.name: profile.profile_id for profile in self.list_profiles()}
+        self._save_index(index)
+        logger.debug(f"Rebuilt voice profile index ({len(index)} entries)")
+        return index
+
+    def _get_index(self) -> dict[str, str]:
+        """
+        Get the name index, reloading it if another process changed it.
+
+        Returns:
+            Name -> profile ID mapping
+        """
+        try:
+            mtime_ns = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # No index yet (new storage or created before indexing existed)
+            return self.rebuild_index()
+
+        if self._name_to_id is None or mtime_ns != self._index_mtime_ns:
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self._name_to_id = json.load(f)
+                self._index_mtime_ns = mtime_ns
+            except (OSError, ValueError) as e:
+                logger.warning(f"Invalid profile index, rebuilding: {e}")
+                return self.rebuild_index()
+
+        return self._name_to_id
+
+    def _save_index(self, index: dict[str, str]) -> None:
+        """
+        Write the name index atomically.
+
+        Args:
+            index: Name -> profile ID mapping
+        """
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+        self._name_to_id = index
+        self._index_mtime_ns = self.index_path.stat().st_mtime_ns
+
     def _generate_id(self) -> str:
         """
         Generate unique profile ID.
@@ -6,14 +6,20 @@ Uses VRAM-aware loading and automatic cleanup.
 """
 
 import logging
+import threading
 import time
 from pathlib import Path
 
 import torch
 import torchaudio
 
-from ..utils.vram import VRAMManager
-from .interfaces import SynthesisResult, TTSSynthesizerInterface, VoiceProfile
+from ..utils.vram import VRAMManager, exclusive_model
+from .interfaces import (
+    AudioBuffer,
+    SynthesisResult,
+    TTSSynthesizerInterface,
+    VoiceProfile,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +43,8 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
         self.config = config
         self.vram_manager = vram_manager
         self._model = None
+        # Held for each load-run-unload call (see exclusive_model)
+        self._model_lock = threading.RLock()
         self._device = None
 
         # Model settings
@@ -46,6 +54,8 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
 
         logger.info("Coqui TTS synthesizer initialized")
 
+    @exclusive_model
+    @torch.inference_mode()
     def synthesize(
         self, text: str, voice_profile: VoiceProfile, output_path: Path
     ) -> SynthesisResult:
@@ -64,14 +74,7 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
 
         try:
             # Validate inputs
-            if not text or not text.strip():
-                raise ValueError("Text cannot be empty")
-
-            if len(text) > self.max_text_length:
-                raise ValueError(
-                    f"Text too long: {len(text)} characters "
-                    f"(maximum {self.max_text_length})"
-                )
+            self._validate_text(text)
 
             if not voice_profile.embedding_path.exists():
                 raise FileNotFoundError(
@@ -87,27 +90,19 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
             # Load model
             self._load_model()
 
-            # Load speaker embedding
-            embedding = torch.load(voice_profile.embedding_path)
-            if embedding.device.type != "cpu":
-                embedding = embedding.cpu()
+            # Load speaker conditioning
+            conditioning = self._load_conditioning(voice_profile)
 
-            # Generate speech
+            # Generate and save speech
             logger.info(
                 f"Synthesizing speech with profile {voice_profile.profile_id} "
                 f"({len(text)} chars)"
             )
-            audio_waveform = self._generate_speech(
-                text, embedding, voice_profile.language
-            )
-
-            # Save audio
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            self._save_audio(audio_waveform, output_path)
-
-            # Calculate duration
-            duration = len(audio_waveform) / self.default_sample_rate
+            audio_buffer = self._synthesize_to_file(
+                text, conditioning, voice_profile.language, output_path
+            )
+            duration = audio_buffer.duration_seconds
 
             # Unload model and cleanup
             self._unload_model()
@@ -124,6 +119,7 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
                 duration_seconds=duration,
                 error=None,
                 processing_time_seconds=processing_time,
+                audio_buffer=audio_buffer,
             )
 
         except Exception as e:
@@ -141,6 +137,105 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
                 processing_time_seconds=processing_time,
             )
 
+    @exclusive_model
+    @torch.inference_mode()
+    def synthesize_batch(
+        self, items: list[tuple[str, Path]], voice_profile: VoiceProfile
+    ) -> list[SynthesisResult]:
+        """
+        Synthesize several utterances with a single model load.
+
+        Args:
+            items: List of (text, output_path) pairs
+            voice_profile: Voice profile shared by all utterances
+
+        Returns:
+            List of SynthesisResult, one per item in input order
+
+        Note:
+            The model and speaker embedding are loaded once for the whole
+            batch. A failure on one item does not stop the others.
+        """
+        start_time = time.time()
+
+        try:
+            if not voice_profile.embedding_path.exists():
+                raise FileNotFoundError(
+                    f"Embedding not found: {voice_profile.embedding_path}"
+                )
+
+            if not self.vram_manager.can_load(self.vram_requirement_mb):
+                raise RuntimeError(
+                    f"Insufficient VRAM: need {self.vram_requirement_mb}MB for TTS"
+                )
+
+            self._load_model()
+            conditioning = self._load_conditioning(voice_profile)
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+            logger.error(f"Batch synthesis failed: {e}")
+            self._unload_model()
+
+            return [
+                SynthesisResult(
+                    success=False,
+                    audio_path=None,
+                    duration_seconds=0.0,
+                    error=str(e),
+                    processing_time_seconds=processing_time,
+                )
+                for _ in items
+            ]
+
+        logger.info(
+            f"Synthesizing {len(items)} utterance(s) with profile "
+            f"{voice_profile.profile_id}"
+        )
+
+        results = []
+        try:
+            for text, output_path in items:
+                item_start = time.time()
+
+                try:
+                    self._validate_text(text)
+                    output_path = Path(output_path)
+                    duration = self._synthesize_to_file(
+                        text, conditioning, voice_profile.language, output_path
+                    ).duration_seconds
+                    results.append(
+                        SynthesisResult(
+                            success=True,
+                            audio_path=output_path,
+                            duration_seconds=duration,
+                            error=None,
+                            processing_time_seconds=time.time() - item_start,
+                        )
+                    )
+
+                except Exception as e:
+                    logger.error(f"Speech synthesis failed for {output_path}: {e}")
+                    results.append(
+                        SynthesisResult(
+                            success=False,
+                            audio_path=None,
+                            duration_seconds=0.0,
+                            error=str(e),
+                            processing_time_seconds=time.time() - item_start,
+                        )
+                    )
+        finally:
+            self._unload_model()
+
+        succeeded = sum(1 for r in results if r.success)
+        logger.info(
+            f"Batch synthesis complete: {succeeded}/{len(items)} succeeded "
+            f"({time.time() - start_time:.2f}s processing)"
+        )
+
+        return results
+
     def estimate_duration(self, text: str, speed: float = 1.0) -> float:
         """
         Estimate audio duration for given text.
@@ -214,15 +309,92 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
         except Exception as e:
             logger.error(f"Error during model unload: {e}")
 
+    def _validate_text(self, text: str) -> None:
+        """
+        Validate text for synthesis.
+
+        Args:
+            text: Text to synthesize
+
+        Raises:
+            ValueError: If text is empty or too long
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        if len(text) > self.max_text_length:
+            raise ValueError(
+                f"Text too long: {len(text)} characters "
+                f"(maximum {self.max_text_length})"
+            )
+
+    def _load_conditioning(
+        self, voice_profile: VoiceProfile
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Load speaker conditioning for a voice profile.
+
+        Uses the conditioning latents precomputed at cloning time when the
+        profile has them, otherwise falls back to the speaker embedding.
+
+        Args:
+            voice_profile: Voice profile with speaker embedding
+
+        Returns:
+            Tuple of (gpt_cond_latent, speaker_embedding) tensors
+        """
+        conditioning_path = voice_profile.embedding_path.with_name("conditioning.pt")
+
+        if conditioning_path.exists():
+            conditioning = torch.load(conditioning_path, map_location=self._device)
+            logger.debug(f"Loaded cached conditioning latents from {conditioning_path}")
+            return conditioning["gpt_cond_latent"], conditioning["speaker_embedding"]
+
+        embedding = torch.load(voice_profile.embedding_path, map_location=self._device)
+        return embedding, embedding
+
+    def _synthesize_to_file(
+        self,
+        text: str,
+        conditioning: tuple[torch.Tensor, torch.Tensor],
+        language: str,
+        output_path: Path,
+    ) -> AudioBuffer:
+        """
+        Generate speech and save it as WAV.
+
+        Args:
+            text: Text to synthesize
+            conditioning: Tuple of (gpt_cond_latent, speaker_embedding)
+            language: Language code
+            output_path: Output file path (WAV)
+
+        Returns:
+            AudioBuffer with the generated samples
+        """
+        audio_waveform = self._generate_speech(text, conditioning, language)
+
+        # Ensure waveform is 2D (channels, samples)
+        if audio_waveform.dim() == 1:
+            audio_waveform = audio_waveform.unsqueeze(0)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._save_audio(audio_waveform, output_path)
+
+        return AudioBuffer(waveform=audio_waveform, sample_rate=self.default_sample_rate)
+
     def _generate_speech(
-        self, text: str, speaker_embedding: torch.Tensor, language: str
+        self,
+        text: str,
+        conditioning: tuple[torch.Tensor, torch.Tensor],
+        language: str,
     ) -> torch.Tensor:
         """
         Generate speech waveform from text.
 
         Args:
             text: Text to synthesize
-            speaker_embedding: Speaker embedding tensor
+            conditioning: Tuple of (gpt_cond_latent, speaker_embedding)
             language: Language code
 
         Returns:
@@ -232,15 +404,17 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
             raise RuntimeError("Model not loaded")
 
         try:
-            # Move embedding to correct device
-            speaker_embedding = speaker_embedding.to(self._device)
+            # Move conditioning to correct device
+            gpt_cond_latent, speaker_embedding = (
+                t.to(self._device) for t in conditioning
+            )
 
-            # Generate speech using XTTS with speaker embedding
-            # XTTS tts_with_vc method takes text and speaker embedding
+            # Generate speech using XTTS with precomputed conditioning,
+            # so the speaker encoder is not run per call
             outputs = self._model.synthesizer.tts_model.inference(
                 text=text,
                 language=language,
-                gpt_cond_latent=speaker_embedding,
+                gpt_cond_latent=gpt_cond_latent,
                 speaker_embedding=speaker_embedding,
             )
 
@@ -270,9 +444,13 @@ class CoquiTTSSynthesizer(TTSSynthesizerInterface):
             if waveform.dim() == 1:
                 waveform = waveform.unsqueeze(0)
 
-            # Save as WAV
+            # Save as 16-bit PCM WAV (pcm_s16le)
             torchaudio.save(
-                output_path, waveform, self.default_sample_rate, encoding="PCM_S"
+                output_path,
+                waveform,
+                self.default_sample_rate,
+                encoding="PCM_S",
+                bits_per_sample=16,
             )
 
             logger.debug(f"Saved audio to {output_path}")
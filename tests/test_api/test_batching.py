@@ -0,0 +1,90 @@
+"""
+Tests for request micro-batching.
+
+Tests MicroBatcher coalescing with an in-memory batch function.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.batching import MicroBatcher
+
+
+async def submit_all(batcher: MicroBatcher, items: list) -> list:
+    """Submit items concurrently through a started batcher and stop it."""
+    batcher.start()
+    try:
+        return await asyncio.gather(*(batcher.submit(item) for item in items))
+    finally:
+        await batcher.stop()
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher."""
+
+    def test_concurrent_items_share_batch(self):
+        """Test that items arriving together run in one batch, in order."""
+        batches = []
+
+        async def run_batch(items):
+            batches.append(items)
+            return [item * 10 for item in items]
+
+        batcher = MicroBatcher(run_batch, key=lambda item: 0, max_batch=4)
+
+        results = asyncio.run(submit_all(batcher, [1, 2, 3]))
+
+        assert results == [10, 20, 30]
+        assert batches == [[1, 2, 3]]
+
+    def test_max_batch_respected(self):
+        """Test that batches never exceed max_batch."""
+        batches = []
+
+        async def run_batch(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(run_batch, key=lambda item: 0, max_batch=2)
+
+        results = asyncio.run(submit_all(batcher, [1, 2, 3, 4, 5]))
+
+        assert results == [1, 2, 3, 4, 5]
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_incompatible_items_batched_separately(self):
+        """Test that only items with the same key are combined."""
+        batches = []
+
+        async def run_batch(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(run_batch, key=lambda item: item[0], max_batch=4)
+
+        asyncio.run(submit_all(batcher, ["a1", "b1", "a2", "b2"]))
+
+        assert batches == [["a1", "a2"], ["b1", "b2"]]
+
+    def test_batch_error_raised_to_each_caller(self):
+        """Test that a failing batch fails every request in it."""
+
+        async def run_batch(items):
+            raise RuntimeError("out of memory")
+
+        batcher = MicroBatcher(run_batch, key=lambda item: 0, max_batch=4)
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            asyncio.run(submit_all(batcher, [1, 2]))
+
+    def test_wrong_result_count_fails_batch(self):
+        """Test that a batch returning too few results fails its callers."""
+
+        async def run_batch(items):
+            return items[:1]
+
+        batcher = MicroBatcher(run_batch, key=lambda item: 0, max_batch=4)
+
+        with pytest.raises(ValueError, match="1 results for 2 items"):
+            asyncio.run(submit_all(batcher, [1, 2]))
@@ -0,0 +1,321 @@
+"""
+Tests for API file transfers.
+
+Tests upload spooling and output downloads.
+"""
+
+import asyncio
+import io
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+import pytest
+from fastapi import FastAPI, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from src.api.files import missing_paths, output_path, save_upload
+from src.api.routes import avatar, video
+from src.avatar import FaceDetectionResult, FaceRegion, Point
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client for the video routes, run from a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    app = FastAPI()
+    app.include_router(video.router)
+    app.dependency_overrides[video.get_outputs_dir] = lambda: (
+        tmp_path / "storage" / "outputs"
+    )
+    return TestClient(app)
+
+
+class TestSaveUpload:
+    """Tests for save_upload."""
+
+    def test_copies_contents_with_suffix(self):
+        """Test that the upload is written to a temp file with its extension."""
+        upload = UploadFile(io.BytesIO(b"RIFF" + b"\0" * 2048), filename="voice.wav")
+
+        path = asyncio.run(save_upload(upload))
+
+        try:
+            assert path.suffix == ".wav"
+            assert path.read_bytes() == b"RIFF" + b"\0" * 2048
+        finally:
+            path.unlink()
+
+    def test_small_upload_staged_in_memory(self, tmp_path, mocker):
+        """Test that small uploads of known size go to the tmpfs directory."""
+        shm_dir = tmp_path / "shm"
+        shm_dir.mkdir()
+        mocker.patch("src.api.files.SHM_DIR", shm_dir)
+        mocker.patch("src.api.files._shm_available", return_value=True)
+        upload = UploadFile(io.BytesIO(b"RIFF"), filename="voice.wav", size=4)
+
+        path = asyncio.run(save_upload(upload))
+
+        assert path.parent == shm_dir
+        assert path.read_bytes() == b"RIFF"
+
+    def test_large_upload_staged_on_disk(self, tmp_path, mocker):
+        """Test that uploads over the threshold use the default temp directory."""
+        mocker.patch("src.api.files.SHM_DIR", tmp_path / "shm")
+        mocker.patch("src.api.files._shm_available", return_value=True)
+        mocker.patch("src.api.files.MEMORY_STAGING_MAX_BYTES", 2)
+        mocker.patch("tempfile.tempdir", str(tmp_path))
+        upload = UploadFile(io.BytesIO(b"RIFF"), filename="voice.wav", size=4)
+
+        path = asyncio.run(save_upload(upload))
+
+        assert path.parent == tmp_path
+
+    def test_streams_in_chunks(self, mocker):
+        """Test that the upload is never read into memory in one piece."""
+        upload = UploadFile(io.BytesIO(b"x" * 3000), filename="avatar.png")
+        mocker.patch("src.api.files.UPLOAD_CHUNK_BYTES", 1024)
+        read = mocker.spy(upload.file, "read")
+
+        path = asyncio.run(save_upload(upload))
+        path.unlink()
+
+        assert read.call_count >= 3
+        assert all(call.args == (1024,) for call in read.call_args_list)
+
+    def test_partial_copy_removed_on_error(self, tmp_path, mocker):
+        """Test that a failed copy doesn't leak a temp file."""
+        mocker.patch("tempfile.tempdir", str(tmp_path))
+        mocker.patch("shutil.copyfileobj", side_effect=OSError("No space left"))
+        upload = UploadFile(io.BytesIO(b"data"), filename="voice.wav")
+
+        with pytest.raises(OSError):
+            asyncio.run(save_upload(upload))
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestOutputPath:
+    """Tests for output_path."""
+
+    def test_default_name_without_mkdir(self, tmp_path, mocker):
+        """Test that flat names skip the mkdir syscall."""
+        mkdir = mocker.spy(type(tmp_path), "mkdir")
+
+        path = output_path(tmp_path, None, "speech_1.wav")
+
+        assert path == tmp_path / "speech_1.wav"
+        mkdir.assert_not_called()
+
+    def test_nested_name_creates_parent(self, tmp_path):
+        """Test that requested subdirectories are created."""
+        path = output_path(tmp_path, "run1/out.mp4", "unused.mp4")
+
+        assert path == tmp_path / "run1" / "out.mp4"
+        assert path.parent.is_dir()
+
+
+class TestMissingPaths:
+    """Tests for missing_paths."""
+
+    def test_reports_missing_in_order(self, tmp_path):
+        """Test that only nonexistent paths are returned."""
+        present = tmp_path / "present.wav"
+        present.write_bytes(b"")
+
+        missing = asyncio.run(
+            missing_paths(tmp_path / "a.png", present, tmp_path / "b.wav")
+        )
+
+        assert missing == [tmp_path / "a.png", tmp_path / "b.wav"]
+
+
+class TestVideoInfo:
+    """Tests for GET /video/info."""
+
+    def test_probe_returns_metadata_and_size(self, client, tmp_path, mocker):
+        """Test that metadata and file size come from one worker-thread probe."""
+        video_file = tmp_path / "clip.mp4"
+        video_file.write_bytes(b"\0" * 2048)
+        encoder = mocker.MagicMock()
+        encoder.get_video_info.return_value = {
+            "duration": 2.0,
+            "width": 512,
+            "height": 512,
+            "fps": 25.0,
+            "codec": "h264",
+        }
+        client.app.dependency_overrides[video.get_video_encoder] = lambda: encoder
+        probe = mocker.spy(video, "_probe_video")
+
+        response = client.get("/video/info", params={"video_path": str(video_file)})
+
+        assert response.status_code == 200
+        assert response.json()["file_size_mb"] == 2048 / 1024 / 1024
+        assert probe.call_count == 1
+
+    def test_missing_file(self, client, tmp_path, mocker):
+        """Test 404 when the video disappears, without running ffprobe."""
+        encoder = mocker.MagicMock()
+        client.app.dependency_overrides[video.get_video_encoder] = lambda: encoder
+
+        response = client.get(
+            "/video/info", params={"video_path": str(tmp_path / "missing.mp4")}
+        )
+
+        assert response.status_code == 404
+        encoder.get_video_info.assert_not_called()
+
+
+class TestEncodeVideo:
+    """Tests for POST /video/encode."""
+
+    def test_response_fields(self, client, tmp_path, mocker):
+        """Test that the encode result is returned in the declared response shape."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+        encoder = mocker.MagicMock()
+        encoder.encode.return_value = mocker.MagicMock(
+            success=True,
+            output_path=tmp_path / "encoded.mp4",
+            file_size_bytes=2048,
+            duration_seconds=2.0,
+            processing_time_seconds=0.5,
+        )
+        client.app.dependency_overrides[video.get_video_encoder] = lambda: encoder
+
+        response = client.post(
+            "/video/encode", json={"input_video_path": str(input_video)}
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {
+            "success": True,
+            "output_path": str(tmp_path / "encoded.mp4"),
+            "file_size_bytes": 2048,
+            "duration_seconds": 2.0,
+            "processing_time_seconds": 0.5,
+        }
+
+
+class TestDetectFace:
+    """Tests for POST /avatar/detect."""
+
+    @pytest.fixture
+    def detect_client(self, mocker):
+        """Client for the avatar routes with a mocked face detector."""
+        app = FastAPI()
+        app.include_router(avatar.router)
+        detector = mocker.MagicMock()
+        detector.detect_rgb.return_value = FaceDetectionResult(
+            detected=False, face_region=None, landmarks=None, confidence=0.0, error=None
+        )
+        app.dependency_overrides[avatar.get_face_detector] = lambda: detector
+        detect_cache = OrderedDict()
+        app.dependency_overrides[avatar.get_detect_cache] = lambda: detect_cache
+        return TestClient(app), detector
+
+    def test_decodes_upload_in_memory(self, detect_client, mocker):
+        """Test that the image is decoded from bytes without a temp file."""
+        client, detector = detect_client
+        detect = mocker.spy(avatar, "_detect_and_validate")
+        mocker.patch("tempfile.NamedTemporaryFile", side_effect=AssertionError)
+        _, png = cv2.imencode(".png", np.zeros((48, 64, 3), dtype=np.uint8))
+
+        response = client.post(
+            "/avatar/detect", files={"image": ("face.png", png.tobytes())}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["validation_message"] == "No face detected"
+        image = detector.detect_rgb.call_args.args[0]
+        assert image.shape == (48, 64, 3)
+        assert detect.call_count == 1
+
+    def test_detected_face_serialized(self, detect_client):
+        """Test that the region and landmarks are returned as JSON objects."""
+        client, detector = detect_client
+        detector.detect_rgb.return_value = FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(4, 6, 40, 36),
+            landmarks={"nose_tip": Point(24, 20)},
+            confidence=0.9,
+            error=None,
+        )
+        detector.validate_for_lipsync.return_value = (True, "ok")
+        _, png = cv2.imencode(".png", np.zeros((48, 64, 3), dtype=np.uint8))
+
+        response = client.post(
+            "/avatar/detect", files={"image": ("face.png", png.tobytes())}
+        )
+
+        body = response.json()
+        assert body["face_region"] == {"x": 4, "y": 6, "width": 40, "height": 36}
+        assert body["landmarks"] == {"nose_tip": {"x": 24, "y": 20}}
+
+    def test_undecodable_upload(self, detect_client):
+        """Test that bytes that aren't an image report a decode error."""
+        client, detector = detect_client
+
+        response = client.post(
+            "/avatar/detect", files={"image": ("face.png", b"not an image")}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["error"] == "Failed to decode image"
+        detector.detect_rgb.assert_not_called()
+
+    def test_repeat_upload_uses_cache(self, detect_client):
+        """Test that re-uploading the same image skips detection."""
+        client, detector = detect_client
+        _, png = cv2.imencode(".png", np.zeros((48, 64, 3), dtype=np.uint8))
+
+        first = client.post("/avatar/detect", files={"image": ("a.png", png.tobytes())})
+        second = client.post("/avatar/detect", files={"image": ("b.png", png.tobytes())})
+
+        assert first.json() == second.json()
+        assert detector.detect_rgb.call_count == 1
+
+    def test_cache_evicts_oldest(self, detect_client, mocker):
+        """Test that the cache holds at most DETECT_CACHE_SIZE entries."""
+        client, detector = detect_client
+        mocker.patch.object(avatar, "DETECT_CACHE_SIZE", 1)
+        images = [
+            cv2.imencode(".png", np.full((8, 8, 3), value, dtype=np.uint8))[1].tobytes()
+            for value in (0, 255, 0)
+        ]
+
+        for data in images:
+            client.post("/avatar/detect", files={"image": ("face.png", data)})
+
+        assert detector.detect_rgb.call_count == 3
+
+
+class TestDownloadOutput:
+    """Tests for GET /video/outputs/{filename}."""
+
+    def test_serves_file(self, client, tmp_path):
+        """Test that a generated output is returned as an attachment."""
+        outputs_dir = tmp_path / "storage" / "outputs"
+        outputs_dir.mkdir(parents=True)
+        (outputs_dir / "result.mp4").write_bytes(b"video-bytes")
+
+        response = client.get("/video/outputs/result.mp4")
+
+        assert response.status_code == 200
+        assert response.content == b"video-bytes"
+        assert response.headers["content-type"] == "video/mp4"
+        assert "attachment" in response.headers["content-disposition"]
+
+    def test_missing_file(self, client):
+        """Test 404 for an unknown output."""
+        response = client.get("/video/outputs/missing.mp4")
+
+        assert response.status_code == 404
+
+    def test_rejects_parent_directory(self, tmp_path):
+        """Test that path traversal outside the outputs directory is refused."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(video.download_output("..", outputs_dir=tmp_path))
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,282 @@
+"""
+Tests for job management API endpoints.
+
+Tests the long-polling wait endpoint against a real file-based queue.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import jobs
+from src.orchestration import JobQueue, JobStatus, JobType
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Job queue watched by the jobs routes."""
+    job_queue = JobQueue(tmp_path)
+    jobs.watch_queue(job_queue)
+    return job_queue
+
+
+@pytest.fixture
+def client(queue):
+    """Test client for the jobs routes."""
+    app = FastAPI()
+    app.state.components = {"job_queue": queue}
+    app.include_router(jobs.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def job_id(queue: JobQueue):
+    """ID of a pending job."""
+    return queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+
+
+class TestSubmitJob:
+    """Tests for POST /jobs."""
+
+    def test_queue_write_runs_off_event_loop(self, client, queue, mocker):
+        """Test that the job file is written from a worker thread."""
+        submit = queue.submit
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return submit(*args, **kwargs)
+
+        mocker.patch.object(queue, "submit", side_effect=record_thread)
+
+        response = client.post(
+            "/jobs",
+            json={
+                "text": "Hello",
+                "voice_profile_id": "vp-1",
+                "avatar_image_path": "avatar.png",
+            },
+        )
+
+        assert response.status_code == 202
+        assert queue.get(response.json()["job_id"]) is not None
+        assert threads[0].name.startswith("asyncio")
+
+
+class TestCancelJob:
+    """Tests for DELETE /jobs/{job_id}."""
+
+    def test_cancel_pending(self, client, queue, job_id, mocker):
+        """Test that a pending job is cancelled with a single job read."""
+        get = mocker.spy(queue, "get")
+
+        response = client.delete(f"/jobs/{job_id}")
+
+        assert response.status_code == 204
+        assert get.call_count == 1
+        assert queue.get(job_id).status == JobStatus.CANCELLED
+
+    def test_cancel_not_pending(self, client, job_id):
+        """Test 400 when the job has already been cancelled."""
+        client.delete(f"/jobs/{job_id}")
+
+        response = client.delete(f"/jobs/{job_id}")
+
+        assert response.status_code == 400
+        assert "cancelled" in response.json()["detail"]
+
+    def test_cancel_missing(self, client):
+        """Test 404 for an unknown job."""
+        assert client.delete("/jobs/missing").status_code == 404
+
+
+class TestJobResponseCache:
+    """Tests for reuse of job response models."""
+
+    def test_unchanged_job_reuses_response(self, queue, job_id):
+        """Test that an unchanged job revision maps to the same response."""
+        first = jobs._to_response(queue.get(job_id))
+        second = jobs._to_response(queue.get(job_id))
+
+        assert first is second
+
+    def test_saved_change_rebuilds_response(self, queue, job_id):
+        """Test that a saved update produces a fresh response."""
+        before = jobs._to_response(queue.get(job_id))
+        job = queue.get(job_id)
+        job.update_progress(0.5, "Halfway")
+        queue.update(job)
+
+        after = jobs._to_response(queue.get(job_id))
+
+        assert after is not before
+        assert after.progress == 0.5
+        assert after.stage == "Halfway"
+
+    def test_invalid_status_lists_valid_values(self, client):
+        """Test that an unknown status filter names the accepted values."""
+        response = client.get("/jobs", params={"status": "bogus"})
+
+        assert response.status_code == 400
+        assert "pending, running" in response.json()["detail"]
+
+
+class TestGetJobStatus:
+    """Tests for conditional GET /jobs/{job_id}."""
+
+    def test_not_modified_when_etag_matches(self, client, job_id):
+        """Test 304 with no body when the job is unchanged."""
+        first = client.get(f"/jobs/{job_id}")
+        second = client.get(
+            f"/jobs/{job_id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "private, max-age=1"
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_changed_job_returns_body(self, client, queue, job_id):
+        """Test that any change to the job, including stage, yields a new ETag."""
+        etag = client.get(f"/jobs/{job_id}").headers["ETag"]
+
+        job = queue.get(job_id)
+        job.update_progress(0.0, "Loading models")
+        queue.update(job)
+
+        response = client.get(f"/jobs/{job_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["stage"] == "Loading models"
+        assert response.headers["ETag"] != etag
+
+
+class TestWaitForJob:
+    """Tests for GET /jobs/{job_id}/wait."""
+
+    def test_returns_current_state_with_etag(self, client, job_id):
+        """Test that a wait without an ETag returns immediately."""
+        response = client.get(f"/jobs/{job_id}/wait")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "pending"
+        assert response.headers["ETag"] == '"pending-0"'
+
+    def test_not_modified_on_timeout(self, client, job_id):
+        """Test 304 when nothing changes within the timeout."""
+        response = client.get(
+            f"/jobs/{job_id}/wait",
+            params={"timeout": 0.1},
+            headers={"If-None-Match": '"pending-0"'},
+        )
+
+        assert response.status_code == 304
+
+    def test_wakes_on_queue_update(self, client, queue, job_id, mocker):
+        """Test that a queue update releases the waiter before the timeout."""
+        mocker.patch.object(jobs, "WAIT_RECHECK_SECONDS", 30.0)
+
+        def start_job():
+            job = queue.get(job_id)
+            job.start()
+            queue.update(job)
+
+        timer = threading.Timer(0.2, start_job)
+        timer.start()
+        start = time.monotonic()
+
+        response = client.get(
+            f"/jobs/{job_id}/wait",
+            params={"timeout": 10},
+            headers={"If-None-Match": '"pending-0"'},
+        )
+        timer.join()
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "running"
+        assert time.monotonic() - start < 5
+        assert jobs._waiters == {}
+
+    def test_finished_job_returns_immediately(self, client, queue, job_id):
+        """Test that a finished job is returned even if the ETag matches."""
+        job = queue.get(job_id)
+        job.cancel()
+        queue.update(job)
+
+        response = client.get(
+            f"/jobs/{job_id}/wait",
+            params={"timeout": 10},
+            headers={"If-None-Match": '"cancelled-0"'},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "cancelled"
+
+    def test_unknown_job(self, client):
+        """Test 404 for a missing job."""
+        response = client.get("/jobs/job-missing/wait")
+
+        assert response.status_code == 404
+
+
+class TestGetJobStatuses:
+    """Tests for POST /jobs/batch."""
+
+    def test_returns_known_jobs_in_order(self, client, queue):
+        """Test that found jobs are returned in request order."""
+        first = queue.submit(JobType.FULL_PIPELINE, {"text": "one"})
+        second = queue.submit(JobType.FULL_PIPELINE, {"text": "two"})
+
+        response = client.post(
+            "/jobs/batch", json={"job_ids": [second, "job-missing", first]}
+        )
+
+        assert response.status_code == 200
+        assert [job["job_id"] for job in response.json()] == [second, first]
+
+    def test_rejects_empty_list(self, client, queue):
+        """Test validation of an empty ID list."""
+        response = client.post("/jobs/batch", json={"job_ids": []})
+
+        assert response.status_code == 422
+
+
+class TestStreamJobEvents:
+    """Tests for GET /jobs/{job_id}/events."""
+
+    def test_streams_until_finished(self, client, queue, job_id, mocker):
+        """Test that each change is pushed and the stream ends when done."""
+        mocker.patch.object(jobs, "WAIT_RECHECK_SECONDS", 30.0)
+
+        def run_job():
+            job = queue.get(job_id)
+            job.start()
+            queue.update(job)
+            job.complete({"output": "video.mp4"})
+            queue.update(job)
+
+        timer = threading.Timer(0.2, run_job)
+        timer.start()
+
+        with client.stream("GET", f"/jobs/{job_id}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                json.loads(line[len("data: "):])
+                for line in response.iter_lines()
+                if line.startswith("data: ")
+            ]
+        timer.join()
+
+        assert events[0]["status"] == "pending"
+        assert events[-1]["status"] == "completed"
+        assert jobs._waiters == {}
+
+    def test_unknown_job(self, client):
+        """Test 404 before any stream is opened."""
+        response = client.get("/jobs/job-missing/events")
+
+        assert response.status_code == 404
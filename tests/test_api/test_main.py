@@ -0,0 +1,441 @@
+"""
+Tests for the FastAPI application.
+
+Tests system endpoints with a TestClient against temporary storage.
+"""
+
+import asyncio
+import threading
+
+import pytest
+import yaml
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from src.api import main
+from src.api.main import _get_cached, _TTLCache, create_app
+from src.orchestration import JobType
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Test client for an app with status caching enabled."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump({"api": {"status_cache_ttl": {"health_ms": 60000, "status_ms": 60000}}})
+    )
+    with TestClient(create_app(config_path=config_path, storage_path=tmp_path)) as client:
+        yield client
+
+
+def _record_lifespan_shutdowns(mocker) -> list[str]:
+    """
+    Record executors shut down from inside the running event loop.
+
+    The loop also shuts its default executor down when it closes; only
+    calls made while it is still running come from the lifespan handler.
+    """
+    shutdowns = []
+    real_shutdown = main.ThreadPoolExecutor.shutdown
+
+    def shutdown(self, *args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            shutdowns.append(self._thread_name_prefix)
+        except RuntimeError:
+            pass
+        return real_shutdown(self, *args, **kwargs)
+
+    mocker.patch.object(main.ThreadPoolExecutor, "shutdown", shutdown)
+    return shutdowns
+
+class TestStatusCache:
+    """Tests for cached /health and /status responses."""
+
+    def test_health_reuses_snapshot(self, client, mocker):
+        """Test that repeat health checks within the TTL skip VRAM queries."""
+        get_status = mocker.spy(client.app.state.components["vram_manager"], "get_status")
+
+        first = client.get("/health")
+        second = client.get("/health")
+
+        assert first.status_code == 200
+        assert first.json() == second.json()
+        assert get_status.call_count == 1
+
+    def test_status_reuses_snapshot(self, client, mocker):
+        """Test that repeat status calls within the TTL skip the job store."""
+        get_stats = mocker.spy(client.app.state.components["job_queue"], "get_stats")
+
+        client.get("/status")
+        client.get("/status")
+
+        assert get_stats.call_count == 1
+
+    def test_status_not_modified(self, client):
+        """Test 304 from /status when the snapshot is unchanged."""
+        etag = client.get("/status").headers["ETag"]
+
+        response = client.get("/status", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+
+    def test_expired_entry_recomputed(self, mocker):
+        """Test that a stale snapshot is rebuilt."""
+        cache = _TTLCache()
+        compute = mocker.MagicMock(side_effect=["old", "new"])
+
+        asyncio.run(_get_cached(cache, 10.0, compute))
+        cache.fetched_at -= 20.0
+        value = asyncio.run(_get_cached(cache, 10.0, compute))
+
+        assert value == "new"
+        assert compute.call_count == 2
+
+    def test_zero_ttl_disables_cache(self, mocker):
+        """Test that a TTL of 0 always recomputes."""
+        cache = _TTLCache()
+        compute = mocker.MagicMock(return_value="value")
+
+        asyncio.run(_get_cached(cache, 0, compute))
+        asyncio.run(_get_cached(cache, 0, compute))
+
+        assert compute.call_count == 2
+
+    def test_computed_off_event_loop(self):
+        """Test that the value is built in a worker thread."""
+        threads = []
+
+        def compute():
+            threads.append(threading.current_thread())
+            return "value"
+
+        asyncio.run(_get_cached(_TTLCache(), 10.0, compute))
+        asyncio.run(_get_cached(_TTLCache(), 0, compute))
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+
+
+class TestLifespan:
+    """Tests for app startup."""
+
+    def test_components_built_on_startup(self, tmp_path):
+        """Test that components are created when the app starts, not before."""
+        app = create_app(storage_path=tmp_path)
+        assert app.state.components is None
+
+        with TestClient(app):
+            assert app.state.components["job_queue"].storage_path == tmp_path
+
+    def test_status_static_fields_built_once(self, tmp_path, mocker):
+        """Test that /status reuses the GPU/profile/storage fields from startup."""
+        build_static = mocker.spy(main, "_build_status_static")
+
+        with TestClient(create_app(storage_path=tmp_path)) as client:
+            first = client.get("/status").json()
+            second = client.get("/status").json()
+
+        assert build_static.call_count == 1
+        assert first["storage_path"] == second["storage_path"] == str(tmp_path)
+        assert "cuda_available" in first["gpu"]
+
+    def test_not_ready_before_startup(self, tmp_path):
+        """Test 503 from system endpoints before startup has run."""
+        client = TestClient(create_app(storage_path=tmp_path))
+
+        assert client.get("/health").status_code == 503
+        assert client.get("/jobs").status_code == 503
+
+    def test_outputs_dir_created_at_startup(self, client, tmp_path):
+        """Test that the outputs directory lives under the app's storage path."""
+        outputs_dir = client.app.state.components["outputs_dir"]
+
+        assert outputs_dir == tmp_path / "outputs"
+        assert outputs_dir.is_dir()
+
+    def test_gpu_slots_from_config(self, tmp_path):
+        """Test that the GPU semaphore admits max_concurrent_gpu_jobs at once."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({"api": {"max_concurrent_gpu_jobs": 2}}))
+        app = create_app(config_path=config_path, storage_path=tmp_path)
+
+        with TestClient(app):
+            gpu_lock = app.state.components["gpu_lock"]
+
+            async def acquire_slots():
+                await gpu_lock.acquire()
+                await gpu_lock.acquire()
+                return gpu_lock.locked()
+
+            assert asyncio.run(acquire_slots()) is True
+
+    def test_model_routes_not_ready_before_startup(self, tmp_path):
+        """Test that model routes fail fast with 503 before startup has run."""
+        client = TestClient(create_app(storage_path=tmp_path))
+        requests = {
+            "/avatar/generate": {"prompt": "a person"},
+            "/voice/synthesize": {"text": "hello", "voice_profile_id": "v1"},
+            "/video/lipsync": {"avatar_image_path": "a.png", "audio_file_path": "a.wav"},
+        }
+
+        for path, body in requests.items():
+            assert client.post(path, json=body).status_code == 503, path
+
+    def test_routes_use_own_app_components(self, tmp_path):
+        """Test that two apps serve jobs from their own storage."""
+        first = create_app(storage_path=tmp_path / "first")
+        second = create_app(storage_path=tmp_path / "second")
+
+        with TestClient(first) as first_client, TestClient(second) as second_client:
+            job_id = first_client.app.state.components["job_queue"].submit(
+                JobType.FULL_PIPELINE, {"text": "Hello"}
+            )
+
+            assert first_client.get(f"/jobs/{job_id}").status_code == 200
+            assert second_client.get(f"/jobs/{job_id}").status_code == 404
+
+
+    def test_shutdown_stops_batcher_and_executor(self, tmp_path, mocker):
+        """Test that shutdown stops the batcher and the default executor."""
+        shutdowns = _record_lifespan_shutdowns(mocker)
+        app = create_app(storage_path=tmp_path)
+
+        with TestClient(app):
+            stop = mocker.spy(app.state.components["avatar_batcher"], "stop")
+
+        stop.assert_called_once()
+        assert shutdowns == ["avatar-api"]
+
+    def test_failed_startup_shuts_down_executor(self, tmp_path, mocker):
+        """Test that the executor is shut down if component setup fails."""
+        shutdowns = _record_lifespan_shutdowns(mocker)
+        mocker.patch.object(
+            main, "_init_components", side_effect=RuntimeError("bad config")
+        )
+
+        with pytest.raises(RuntimeError, match="bad config"):
+            with TestClient(create_app(storage_path=tmp_path)):
+                pass
+
+        assert shutdowns == ["avatar-api"]
+
+class TestBlockingWork:
+    """Tests for running model work off the event loop."""
+
+    def test_synthesis_runs_in_api_thread_pool(
+        self, client, tmp_path, monkeypatch, mocker
+    ):
+        """Test that model calls run on the app's worker threads."""
+        monkeypatch.chdir(tmp_path)
+        mocker.patch.object(
+            client.app.state.components["voice_profile_manager"], "load_profile"
+        )
+        threads = []
+
+        def synthesize(*args):
+            threads.append(threading.current_thread().name)
+            return mocker.MagicMock(
+                success=True,
+                audio_path=tmp_path / "speech.wav",
+                duration_seconds=1.0,
+                processing_time_seconds=0.5,
+            )
+
+        synthesizer = mocker.patch.object(
+            client.app.state.components["service"], "synthesizer"
+        )
+        synthesizer.synthesize.side_effect = synthesize
+
+        response = client.post(
+            "/voice/synthesize", json={"text": "Hello", "voice_profile_id": "vp-1"}
+        )
+
+        assert response.status_code == 201
+        assert threads[0].startswith("avatar-api")
+
+
+class TestModelWrappers:
+    """Tests for model wrapper reuse across requests."""
+
+    def test_wrappers_built_once_and_share_components(self, client):
+        """Test that the service reuses the app's managers and VRAM manager."""
+        components = client.app.state.components
+        service = components["service"]
+
+        assert service.vram_manager is components["vram_manager"]
+        assert service.generator is service.generator
+        assert service.generator.profile_manager is components["avatar_profile_manager"]
+        assert service.generator.face_detector is components["face_detector"]
+        assert service.cloner.profile_manager is components["voice_profile_manager"]
+
+
+class TestProfileListing:
+    """Tests for the profile list endpoints."""
+
+    def test_avatar_profiles_listed(self, client, tmp_path):
+        """Test that stored avatar profiles serialize without revalidation."""
+        from PIL import Image
+
+        image_path = tmp_path / "face.png"
+        Image.new("RGB", (8, 8)).save(image_path)
+        client.app.state.components["avatar_profile_manager"].create_profile(
+            name="Presenter",
+            image_path=image_path,
+            face_region={"x": 0, "y": 0, "width": 8, "height": 8},
+            aspect_ratio="1:1",
+        )
+
+        body = client.get("/avatar/profiles").json()
+
+        assert body["total"] == 1
+        assert body["profiles"][0]["name"] == "Presenter"
+        assert body["profiles"][0]["face_detected"] is False
+
+    def test_voice_profiles_empty(self, client):
+        """Test an empty voice profile listing."""
+        assert client.get("/voice/profiles").json() == {"profiles": [], "total": 0}
+
+
+class TestCompression:
+    """Tests for response compression."""
+
+    def test_large_response_compressed(self, client):
+        """Test that large payloads are gzip-encoded for clients that accept it."""
+        queue = client.app.state.components["job_queue"]
+        job_ids = [queue.submit(JobType.FULL_PIPELINE, {"text": "x"}) for _ in range(20)]
+
+        response = client.post(
+            "/jobs/batch", json={"job_ids": job_ids}, headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 20
+
+    def test_small_response_uncompressed(self, client):
+        """Test that small payloads are sent as-is."""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_event_stream_uncompressed(self, client):
+        """Test that SSE responses are never buffered by compression."""
+        queue = client.app.state.components["job_queue"]
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "x"})
+        queue.cancel(job_id)
+
+        with client.stream(
+            "GET", f"/jobs/{job_id}/events", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            assert "content-encoding" not in response.headers
+
+    def test_brotli_preferred_when_installed(self, tmp_path, mocker):
+        """Test that brotli-asgi is used, with event streams excluded."""
+        brotli_asgi = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"brotli_asgi": brotli_asgi})
+
+        app = create_app(storage_path=tmp_path)
+
+        middleware = {m.cls: m.kwargs for m in app.user_middleware}
+        assert main._SkipPaths not in middleware
+        excluded = middleware[brotli_asgi.BrotliMiddleware]["excluded_handlers"]
+        assert r"^/jobs/[^/]+/events$" in excluded
+
+    def test_gzip_fallback_skips_excluded_paths(self, tmp_path):
+        """Test that the gzip fallback wraps GZipMiddleware with path exclusions."""
+        app = create_app(storage_path=tmp_path)
+
+        middleware = {m.cls: m.kwargs for m in app.user_middleware}
+        assert middleware[main._SkipPaths]["middleware_cls"] is GZipMiddleware
+        assert middleware[main._SkipPaths]["paths"] == main.UNCOMPRESSED_PATHS
+
+    def test_streamed_encode_uncompressed(self, client, tmp_path, mocker):
+        """Test that a streamed encode is sent as MP4 bytes, not gzip."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+        encoder = client.app.state.components["video_encoder"]
+        mocker.patch.object(
+            encoder, "encode_streaming", return_value=iter([b"a" * 1000, b"b" * 1000])
+        )
+
+        response = client.post(
+            "/video/encode",
+            json={"input_video_path": str(input_video), "stream": True},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "video/mp4"
+        assert "content-encoding" not in response.headers
+        assert 'filename="encoded_input.mp4"' in response.headers["content-disposition"]
+        assert response.content == b"a" * 1000 + b"b" * 1000
+
+
+    def test_streamed_encode_early_failure_is_error(self, client, tmp_path, mocker):
+        """Test that FFmpeg failing before output returns 500, not an empty 200."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+        encoder = client.app.state.components["video_encoder"]
+        mocker.patch.object(
+            encoder,
+            "encode_streaming",
+            side_effect=RuntimeError("FFmpeg streaming encode failed: bad input"),
+        )
+
+        response = client.post(
+            "/video/encode",
+            json={"input_video_path": str(input_video), "stream": True},
+        )
+
+        assert response.status_code == 500
+        assert "bad input" in response.json()["detail"]
+
+class TestCORS:
+    """Tests for CORS configuration."""
+
+    def test_preflight_cacheable(self, client):
+        """Test that preflights advertise explicit methods and a max age."""
+        response = client.options(
+            "/jobs",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "if-none-match",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "86400"
+        assert "*" not in response.headers["access-control-allow-methods"]
+
+    def test_origins_from_config(self, tmp_path):
+        """Test that api.cors.allow_origins restricts cross-origin requests."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            yaml.dump({"api": {"cors": {"allow_origins": ["http://app.example"]}}})
+        )
+        client = TestClient(create_app(config_path=config_path, storage_path=tmp_path))
+
+        allowed = client.get("/", headers={"Origin": "http://app.example"})
+        other = client.get("/", headers={"Origin": "http://other.example"})
+
+        assert allowed.headers["access-control-allow-origin"] == "http://app.example"
+        assert "access-control-allow-origin" not in other.headers
+
+
+class TestDefaultApp:
+    """Tests for the lazily built module-level app."""
+
+    def test_built_on_first_access(self, tmp_path, mocker):
+        """Test that the default app is created once from the environment."""
+        mocker.patch.object(main, "_default_app", None)
+        mocker.patch.dict("os.environ", {"AVATAR_STORAGE": str(tmp_path)})
+        mock_create = mocker.patch.object(main, "create_app")
+
+        first = main.app
+        second = main.app
+
+        assert first is second
+        mock_create.assert_called_once_with(config_path=None, storage_path=tmp_path)
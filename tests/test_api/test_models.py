@@ -8,6 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.api.models import (
+    MAX_JOB_LIST_ITEMS,
     AvatarGenerateRequest,
     AvatarListResponse,
     AvatarProfileResponse,
@@ -443,3 +444,38 @@ class TestModelSerialization:
 
         assert request.name == "Test Voice"
         assert request.language == "en"
+
+
+class TestResponseModelConfig:
+    """Tests for shared response model configuration."""
+
+    def _job_response(self) -> JobResponse:
+        return JobResponse(
+            job_id="job-123",
+            status="pending",
+            job_type="voice_synthesis",
+            progress=0.0,
+            stage="Queued",
+            created_at="2024-01-15T10:30:00Z",
+        )
+
+    def test_responses_are_frozen(self):
+        """Test that a built response cannot be modified."""
+        response = self._job_response()
+
+        with pytest.raises(ValidationError):
+            response.status = "running"
+
+    def test_unknown_fields_rejected(self):
+        """Test that typos in response fields are caught."""
+        with pytest.raises(ValidationError):
+            JobStatsResponse(
+                total=0, pending=0, running=0, completed=0, failed=0, cancelled=0, queued=0
+            )
+
+    def test_job_list_bounded(self):
+        """Test that job listings are capped at the route limit."""
+        jobs = [self._job_response()] * (MAX_JOB_LIST_ITEMS + 1)
+
+        with pytest.raises(ValidationError):
+            JobListResponse(jobs=jobs, total=len(jobs))
@@ -0,0 +1 @@
+"""Avatar module tests."""
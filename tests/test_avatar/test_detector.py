@@ -0,0 +1,192 @@
+"""
+Tests for MediaPipe face detector.
+
+Tests landmark extraction with MediaPipe mocked out.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.avatar.detector import MediaPipeFaceDetector, mesh_landmarks_as_dicts
+from src.avatar.interfaces import FaceDetectionResult, FaceRegion, Point
+
+
+def point(x, y, z=0.0):
+    """Relative landmark as returned by MediaPipe."""
+    return SimpleNamespace(x=x, y=y, z=z)
+
+
+class TestDetectRgb:
+    """Tests for MediaPipeFaceDetector.detect_rgb."""
+
+    def test_keypoints_scaled_to_pixels(self, mock_mediapipe_face_detection):
+        """Test that keypoints are named and scaled to image coordinates."""
+        detection = mock_mediapipe_face_detection.process.return_value.detections[0]
+        detection.location_data.relative_keypoints = [
+            point(0.3, 0.4),
+            point(0.7, 0.4),
+            point(0.5, 0.55),
+            point(0.5, 0.75),
+            point(0.1, 0.45),
+            point(0.9, 0.45),
+            point(0.5, 0.5),  # Extra keypoints are ignored
+        ]
+        detector = MediaPipeFaceDetector()
+        detector._face_detection = mock_mediapipe_face_detection
+
+        result = detector.detect_rgb(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert result.detected
+        assert list(result.landmarks) == [
+            "right_eye",
+            "left_eye",
+            "nose_tip",
+            "mouth_center",
+            "right_ear",
+            "left_ear",
+        ]
+        assert result.landmarks["right_eye"] == Point(192, 192)
+        assert result.face_region == FaceRegion(128, 48, 384, 384)
+
+    def test_large_image_downscaled(self, mock_mediapipe_face_detection):
+        """Test that MediaPipe sees a shrunk image but boxes use full size."""
+        detector = MediaPipeFaceDetector(max_detect_side=640)
+        detector._face_detection = mock_mediapipe_face_detection
+
+        result = detector.detect_rgb(np.zeros((2160, 3840, 3), dtype=np.uint8))
+
+        processed = mock_mediapipe_face_detection.process.call_args.args[0]
+        assert processed.shape == (360, 640, 3)
+        assert result.face_region == FaceRegion(768, 216, 2304, 1728)
+
+    def test_small_image_not_resized(self, mock_mediapipe_face_detection):
+        """Test that images within the limit are passed through unchanged."""
+        detector = MediaPipeFaceDetector(max_detect_side=640)
+        detector._face_detection = mock_mediapipe_face_detection
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        detector.detect_rgb(image)
+
+        assert mock_mediapipe_face_detection.process.call_args.args[0] is image
+
+
+class TestDetectBatch:
+    """Tests for MediaPipeFaceDetector.detect_batch."""
+
+    def test_results_in_input_order(self, tmp_path, mocker):
+        """Test that every image is detected in order, failures included."""
+        import cv2
+
+        paths = [tmp_path / "a.png", tmp_path / "missing.png", tmp_path / "b.png"]
+        cv2.imwrite(str(paths[0]), np.zeros((10, 20, 3), dtype=np.uint8))
+        cv2.imwrite(str(paths[2]), np.zeros((30, 40, 3), dtype=np.uint8))
+        detector = MediaPipeFaceDetector()
+        detect_rgb = mocker.patch.object(
+            detector, "detect_rgb", side_effect=lambda image: image.shape
+        )
+
+        results = detector.detect_batch(paths)
+
+        assert results[0] == (10, 20, 3)
+        assert not results[1].detected
+        assert "Image not found" in results[1].error
+        assert results[2] == (30, 40, 3)
+        assert detect_rgb.call_count == 2
+
+    def test_empty(self):
+        """Test that no paths give no results."""
+        assert MediaPipeFaceDetector().detect_batch([]) == []
+
+
+class TestGetFaceMesh:
+    """Tests for MediaPipeFaceDetector.get_face_mesh."""
+
+    def test_landmarks_scaled_to_pixels(self, tmp_path, mocker):
+        """Test that mesh landmarks are scaled into coordinate and depth arrays."""
+        import cv2
+
+        image_path = tmp_path / "face.png"
+        cv2.imwrite(str(image_path), np.zeros((100, 200, 3), dtype=np.uint8))
+        raw = [point(0.255, 0.333, -0.01), point(0.999, 0.001, 0.02)]
+        face_mesh = mocker.MagicMock()
+        face_mesh.process.return_value.multi_face_landmarks = [
+            SimpleNamespace(landmark=raw)
+        ]
+        detector = MediaPipeFaceDetector()
+        detector._face_mesh = face_mesh
+
+        mesh = detector.get_face_mesh(image_path)
+
+        assert mesh["num_landmarks"] == 2
+        assert mesh["xy"].dtype == np.int32
+        assert mesh["xy"].tolist() == [[int(lm.x * 200), int(lm.y * 100)] for lm in raw]
+        assert mesh["z"].dtype == np.float32
+        assert mesh["z"].tolist() == pytest.approx([lm.z for lm in raw])
+
+    def test_legacy_dict_format(self):
+        """Test conversion of mesh arrays to the list-of-dicts format."""
+        mesh = {
+            "xy": np.array([[51, 33], [199, 0]], dtype=np.int32),
+            "z": np.array([-0.5, 0.25], dtype=np.float32),
+        }
+
+        assert mesh_landmarks_as_dicts(mesh) == [
+            {"x": 51, "y": 33, "z": -0.5},
+            {"x": 199, "y": 0, "z": 0.25},
+        ]
+
+
+class TestValidateForLipsync:
+    """Tests for MediaPipeFaceDetector.validate_for_lipsync."""
+
+    def make_detection(
+        self, width=200, height=240, right_eye=(60, 80), left_eye=(140, 80)
+    ):
+        """Detection with the given face size and eye positions."""
+        return FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(0, 0, width, height),
+            landmarks={
+                "right_eye": Point(*right_eye),
+                "left_eye": Point(*left_eye),
+                "mouth_center": Point(100, 180),
+            },
+            confidence=0.9,
+            error=None,
+        )
+
+    def test_valid_face(self):
+        """Test that a level, well-proportioned face passes."""
+        is_valid, _ = MediaPipeFaceDetector().validate_for_lipsync(
+            self.make_detection()
+        )
+
+        assert is_valid
+
+    @pytest.mark.parametrize(
+        "dy, valid", [(21, True), (22, False)]  # tan(15°) * 80 ≈ 21.4
+    )
+    def test_tilt_limit(self, dy, valid):
+        """Test the 15 degree eye-line tilt limit."""
+        detection = self.make_detection(left_eye=(140, 80 + dy))
+
+        is_valid, message = MediaPipeFaceDetector().validate_for_lipsync(detection)
+
+        assert is_valid is valid
+        if not valid:
+            assert message == "Face is tilted: 15.4° (maximum: 15°)"
+
+    @pytest.mark.parametrize(
+        "width, height, valid",
+        [(150, 300, True), (149, 300, False), (300, 200, True), (301, 200, False)],
+    )
+    def test_aspect_ratio_limits(self, width, height, valid):
+        """Test that face aspect ratios outside 0.5-1.5 are rejected."""
+        detection = self.make_detection(width=width, height=height)
+
+        is_valid, message = MediaPipeFaceDetector().validate_for_lipsync(detection)
+
+        assert is_valid is valid
+        assert ("aspect ratio" in message) is not valid
@@ -0,0 +1,555 @@
+"""
+Tests for SDXL avatar generator.
+
+Tests pipeline loading options and generation with diffusers mocked out.
+"""
+
+import sys
+
+import pytest
+import torch
+
+from src.avatar.generator import SDXLAvatarGenerator
+from src.avatar.interfaces import FaceDetectionResult, FaceRegion, Point
+
+
+@pytest.fixture
+def mock_diffusers(mocker, mock_sdxl_pipeline):
+    """Install a fake diffusers module returning the mock pipeline."""
+    fake = mocker.MagicMock()
+    fake.StableDiffusionXLPipeline.from_pretrained.return_value.to.return_value = (
+        mock_sdxl_pipeline
+    )
+    mocker.patch.dict(sys.modules, {"diffusers": fake})
+    return fake
+
+
+@pytest.fixture
+def cuda_available(mocker):
+    """Report CUDA as available."""
+    mocker.patch("torch.cuda.is_available", return_value=True)
+
+
+def make_generator(sample_config, mock_vram_manager, mocker, **overrides):
+    """Build a generator with avatar.sdxl overrides."""
+    config = {**sample_config["avatar"]["sdxl"], **overrides}
+    return SDXLAvatarGenerator(
+        config=config,
+        vram_manager=mock_vram_manager,
+        profile_manager=mocker.MagicMock(),
+    )
+
+
+class TestLoadModel:
+    """Tests for SDXLAvatarGenerator._load_model."""
+
+    def test_compile_disabled_by_default(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker
+    ):
+        """Test that the UNet is not compiled unless requested."""
+        mock_compile = mocker.patch("torch.compile")
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        mock_compile.assert_not_called()
+
+    def test_compile_unet(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker
+    ):
+        """Test that compile_unet wraps the UNet and VAE decoder with torch.compile."""
+        mock_compile = mocker.patch("torch.compile")
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker, compile_unet=True
+        )
+
+        generator._load_model()
+
+        assert mock_compile.call_count == 2
+        assert generator._pipeline.unet is mock_compile.return_value
+        assert generator._pipeline.vae.decode is mock_compile.return_value
+        assert mock_compile.call_args.kwargs["mode"] == "max-autotune"
+
+    def test_compile_mode_configurable(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker
+    ):
+        """Test that compile_mode is passed through to torch.compile."""
+        mock_compile = mocker.patch("torch.compile")
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            compile_unet=True, compile_mode="reduce-overhead",
+        )
+
+        generator._load_model()
+
+        modes = {call.kwargs["mode"] for call in mock_compile.call_args_list}
+        assert modes == {"reduce-overhead"}
+
+    def test_channels_last_on_cuda(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker
+    ):
+        """Test that the UNet and VAE are converted to channels_last."""
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        for module in (generator._pipeline.unet, generator._pipeline.vae):
+            module.to.assert_called_with(memory_format=torch.channels_last)
+
+    @pytest.mark.parametrize("slicing", [False, True])
+    def test_attention_slicing_only_when_configured(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker,
+        slicing
+    ):
+        """Test that fused SDPA attention is kept unless slicing is requested."""
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker, enable_attention_slicing=slicing
+        )
+
+        generator._load_model()
+
+        assert generator._pipeline.enable_attention_slicing.called is slicing
+
+    def test_fp16_vae_and_vae_slicing(
+        self, sample_config, mock_vram_manager, mock_diffusers, cuda_available, mocker
+    ):
+        """Test that the configured VAE is loaded and VAE slicing enabled."""
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            vae_model_id="madebyollin/sdxl-vae-fp16-fix", enable_vae_slicing=True,
+        )
+
+        generator._load_model()
+
+        vae_load = mock_diffusers.AutoencoderKL.from_pretrained
+        assert vae_load.call_args.args[0] == "madebyollin/sdxl-vae-fp16-fix"
+        from_pretrained = mock_diffusers.StableDiffusionXLPipeline.from_pretrained
+        assert from_pretrained.call_args.kwargs["vae"] is vae_load.return_value
+        generator._pipeline.vae.enable_slicing.assert_called_once()
+        generator._pipeline.vae.enable_tiling.assert_not_called()
+
+    def test_dpm_solver_scheduler(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker
+    ):
+        """Test that the default scheduler is swapped for DPM-Solver++ Karras."""
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        from_config = mock_diffusers.DPMSolverMultistepScheduler.from_config
+        assert from_config.call_args.kwargs == {
+            "use_karras_sigmas": True,
+            "algorithm_type": "sde-dpmsolver++",
+        }
+        assert generator._pipeline.scheduler is from_config.return_value
+
+    def test_progress_bar_disabled(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker
+    ):
+        """Test that the diffusers progress bar is turned off."""
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        generator._pipeline.set_progress_bar_config.assert_called_once_with(
+            disable=True
+        )
+
+    def test_default_scheduler_kept(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker
+    ):
+        """Test that scheduler: default leaves the pipeline's scheduler alone."""
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker, scheduler="default"
+        )
+
+        generator._load_model()
+
+        mock_diffusers.DPMSolverMultistepScheduler.from_config.assert_not_called()
+
+    def test_loads_from_local_cache_first(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker
+    ):
+        """Test that a cached model is loaded without contacting the Hub."""
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        from_pretrained = mock_diffusers.StableDiffusionXLPipeline.from_pretrained
+        from_pretrained.assert_called_once()
+        assert from_pretrained.call_args.kwargs["local_files_only"] is True
+        assert from_pretrained.call_args.kwargs["low_cpu_mem_usage"] is True
+
+    def test_downloads_when_not_cached(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline, mocker
+    ):
+        """Test fallback to a network load when the cache misses."""
+        from_pretrained = mock_diffusers.StableDiffusionXLPipeline.from_pretrained
+        cached = from_pretrained.return_value
+        from_pretrained.side_effect = [OSError("not cached"), cached]
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        generator._load_model()
+
+        assert from_pretrained.call_count == 2
+        assert "local_files_only" not in from_pretrained.call_args.kwargs
+        assert generator._pipeline is mock_sdxl_pipeline
+
+
+class TestGenerate:
+    """Tests for SDXLAvatarGenerator.generate."""
+
+    def test_returns_face_detection(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker, tmp_path
+    ):
+        """Test that the detection on the generated image is returned."""
+        detection = FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(10, 10, 200, 240),
+            landmarks={},
+            confidence=0.93,
+            error=None,
+        )
+        mock_detector = mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        mock_detector.return_value.detect.return_value = detection
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        result = generator.generate("a person", output_path=tmp_path / "avatar.png")
+
+        assert result.success
+        assert result.face_detection is detection
+        assert result.profile is generator.profile_manager.create_profile.return_value
+
+    def test_generate_batch_single_pass(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path
+    ):
+        """Test that a batch runs one pipeline call with per-image seeds."""
+        from PIL import Image
+
+        mock_sdxl_pipeline.return_value.images = [
+            Image.new("RGB", (64, 64)) for _ in range(2)
+        ]
+        mock_detector = mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        mock_detector.return_value.detect.return_value = FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(10, 10, 20, 24),
+            landmarks={},
+            confidence=0.9,
+            error=None,
+        )
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        results = generator.generate_batch(
+            ["a person", "another person"],
+            aspect_ratio="1:1",
+            seeds=[1, None],
+            output_paths=[tmp_path / "a.png", tmp_path / "b.png"],
+        )
+
+        mock_sdxl_pipeline.assert_called_once()
+        kwargs = mock_sdxl_pipeline.call_args.kwargs
+        assert len(kwargs["prompt"]) == 2
+        assert len(kwargs["generator"]) == 2
+        assert all(result.success for result in results)
+        assert (tmp_path / "a.png").exists() and (tmp_path / "b.png").exists()
+
+    def test_save_failure_only_fails_its_item(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path
+    ):
+        """Test that one image failing to save leaves the rest of the batch."""
+        from PIL import Image
+
+        mock_sdxl_pipeline.return_value.images = [
+            Image.new("RGB", (64, 64)) for _ in range(2)
+        ]
+        mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+        saved = mocker.MagicMock()
+        mocker.patch.object(
+            generator,
+            "_save_avatar",
+            side_effect=[saved, ValueError("Profile with name 'Man' already exists")],
+        )
+
+        results = generator.generate_batch(
+            ["a young man smiling", "a young man frowning"],
+            output_paths=[tmp_path / "a.png", tmp_path / "b.png"],
+        )
+
+        assert results[0] is saved
+        assert not results[1].success
+        assert "already exists" in results[1].error
+
+    def test_seeded_generation_cached(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path
+    ):
+        """Test that repeating a seeded generation skips the pipeline."""
+        from PIL import Image
+
+        mock_sdxl_pipeline.return_value.images = [Image.new("RGB", (64, 64))]
+        detection = FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(10, 10, 20, 24),
+            landmarks={"nose_tip": Point(20, 22)},
+            confidence=0.9,
+            error=None,
+        )
+        mock_detector = mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        mock_detector.return_value.detect.return_value = detection
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            generation_cache_dir=str(tmp_path / "cache"),
+        )
+        generator.profile_manager.create_profile.return_value.profile_id = "ap-1234"
+
+        first = generator.generate("a person", seed=7, output_path=tmp_path / "a.png")
+        second = generator.generate("a person", seed=7, output_path=tmp_path / "b.png")
+
+        mock_sdxl_pipeline.assert_called_once()
+        generator.profile_manager.load_profile.assert_called_once_with("ap-1234")
+        assert second.success
+        assert second.face_detection == first.face_detection == detection
+        assert (tmp_path / "b.png").read_bytes() == (tmp_path / "a.png").read_bytes()
+        assert generator.profile_manager.create_profile.call_count == 1
+        assert second.profile is generator.profile_manager.load_profile.return_value
+
+    def test_cache_hit_reuses_profile(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path
+    ):
+        """Test that a repeated generation returns the profile already created."""
+        from PIL import Image
+
+        from src.avatar.profiles import AvatarProfileManager
+
+        mock_sdxl_pipeline.return_value.images = [Image.new("RGB", (64, 64))]
+        mock_detector = mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        mock_detector.return_value.detect.return_value = FaceDetectionResult(
+            detected=False, face_region=None, landmarks=None, confidence=0.0, error=None
+        )
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            generation_cache_dir=str(tmp_path / "cache"),
+        )
+        manager = AvatarProfileManager(tmp_path / "profiles")
+        generator.profile_manager = manager
+
+        first = generator.generate("a person", seed=7, output_path=tmp_path / "a.png")
+        second = generator.generate("a person", seed=7, output_path=tmp_path / "b.png")
+
+        assert first.success and second.success, second.error
+        assert second.profile.profile_id == first.profile.profile_id
+        assert len(manager.list_profiles()) == 1
+
+        manager.delete_profile(first.profile.profile_id)
+        third = generator.generate("a person", seed=7, output_path=tmp_path / "c.png")
+        fourth = generator.generate("a person", seed=7, output_path=tmp_path / "d.png")
+
+        mock_sdxl_pipeline.assert_called_once()
+        assert third.success and fourth.success, fourth.error
+        assert third.profile.profile_id != first.profile.profile_id
+        assert fourth.profile.profile_id == third.profile.profile_id
+
+    def test_unseeded_generation_not_cached(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path
+    ):
+        """Test that random-seed generations always run the pipeline."""
+        mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            generation_cache_dir=str(tmp_path / "cache"),
+        )
+        mocker.patch.object(generator, "_save_avatar")
+
+        generator.generate("a person", output_path=tmp_path / "a.png")
+        generator.generate("a person", output_path=tmp_path / "a.png")
+
+        assert mock_sdxl_pipeline.call_count == 2
+
+    @pytest.mark.parametrize(
+        "negative_prompt, guidance_scale", [("", 1.0), ("blurry", 7.5)]
+    )
+    def test_skip_cfg_without_negative(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        mocker, tmp_path, negative_prompt, guidance_scale
+    ):
+        """Test that guidance is only skipped for requests with no negative prompt."""
+        mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker,
+            guidance_scale=7.5, skip_cfg_without_negative=True,
+        )
+        mocker.patch.object(generator, "_save_avatar")
+
+        generator.generate(
+            "a person",
+            negative_prompt=negative_prompt,
+            output_path=tmp_path / "avatar.png",
+        )
+
+        kwargs = mock_sdxl_pipeline.call_args.kwargs
+        assert kwargs["guidance_scale"] == guidance_scale
+        assert (kwargs["negative_prompt"] is None) == (negative_prompt == "")
+
+    def test_pipeline_kept_loaded_between_calls(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker, tmp_path
+    ):
+        """Test that the pipeline is loaded once and registered for eviction."""
+        mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+        mocker.patch.object(generator, "_save_avatar")
+
+        generator.generate("a person", output_path=tmp_path / "a.png")
+        generator.generate("a person", output_path=tmp_path / "b.png")
+
+        from_pretrained = mock_diffusers.StableDiffusionXLPipeline.from_pretrained
+        assert from_pretrained.call_count == 1
+        assert generator._pipeline is not None
+        mock_vram_manager.keep_resident.assert_called_with(
+            "sdxl", generator._evict
+        )
+
+    def test_evict_skipped_while_generating(
+        self, sample_config, mock_vram_manager, mocker
+    ):
+        """Test that the pipeline is not evicted while another call uses it."""
+        import threading
+
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+        pipeline = mocker.MagicMock()
+        generator._pipeline = pipeline
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with generator._model_lock:
+                held.set()
+                release.wait()
+
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        held.wait()
+        try:
+            assert generator._evict() is False
+            assert generator._pipeline is pipeline
+        finally:
+            release.set()
+            worker.join()
+
+        assert generator._evict() is True
+        assert generator._pipeline is None
+
+    def test_face_detector_reused(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker, tmp_path
+    ):
+        """Test that one face detector is built and reused across generations."""
+        mock_detector = mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+        save_avatar = mocker.patch.object(generator, "_save_avatar")
+
+        generator.generate("a person", output_path=tmp_path / "a.png")
+        generator.generate("a person", output_path=tmp_path / "b.png")
+
+        mock_detector.assert_called_once()
+        detectors = {call.args[2] for call in save_avatar.call_args_list}
+        assert detectors == {mock_detector.return_value}
+
+    def test_pipeline_unloaded_without_cache_models(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker, tmp_path
+    ):
+        """Test that cache_models=False unloads after each generation."""
+        mocker.patch("src.avatar.detector.MediaPipeFaceDetector")
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker, cache_models=False
+        )
+        mocker.patch.object(generator, "_save_avatar")
+
+        generator.generate("a person", output_path=tmp_path / "a.png")
+
+        assert generator._pipeline is None
+        mock_vram_manager.keep_resident.assert_not_called()
+
+
+class TestEnhancePrompt:
+    """Tests for SDXLAvatarGenerator._enhance_prompt."""
+
+    @pytest.mark.parametrize(
+        "prompt, enhanced",
+        [
+            ("a person", True),
+            ("A Professional headshot", False),
+            ("HIGHLY DETAILED face", False),
+            ("portraits of a woman", False),
+        ],
+    )
+    def test_quality_keywords(
+        self, sample_config, mock_vram_manager, mocker, prompt, enhanced
+    ):
+        """Test that modifiers are only added when no quality keyword is present."""
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        result = generator._enhance_prompt(prompt)
+
+        assert (result != prompt) is enhanced
+        assert prompt in result
+
+
+class TestWarmup:
+    """Tests for SDXLAvatarGenerator.warmup."""
+
+    def test_warmup_runs_single_step(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        cuda_available, mocker
+    ):
+        """Test that warmup denoises two steps and unloads the model."""
+        generator = make_generator(
+            sample_config, mock_vram_manager, mocker, cache_models=False
+        )
+
+        assert generator.warmup()
+
+        kwargs = mock_sdxl_pipeline.call_args.kwargs
+        assert kwargs["num_inference_steps"] == 2
+        assert (kwargs["width"], kwargs["height"]) == (1024, 1024)
+        assert generator._pipeline is None
+
+    def test_warmup_from_config(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        cuda_available, mocker
+    ):
+        """Test that warmup runs at init when enabled in config."""
+        make_generator(sample_config, mock_vram_manager, mocker, warmup=True)
+
+        mock_sdxl_pipeline.assert_called_once()
+
+    def test_warmup_each_configured_resolution(
+        self, sample_config, mock_vram_manager, mock_diffusers, mock_sdxl_pipeline,
+        cuda_available, mocker
+    ):
+        """Test that a warmup list warms every resolution in one model load."""
+        make_generator(
+            sample_config, mock_vram_manager, mocker, warmup=["16:9", "9:16", "16:9"]
+        )
+
+        sizes = {
+            (call.kwargs["width"], call.kwargs["height"])
+            for call in mock_sdxl_pipeline.call_args_list
+        }
+        assert mock_sdxl_pipeline.call_count == 2
+        assert sizes == {(1344, 768), (768, 1344)}
+        from_pretrained = mock_diffusers.StableDiffusionXLPipeline.from_pretrained
+        assert from_pretrained.call_count == 1
+
+    def test_warmup_skipped_without_cuda(
+        self, sample_config, mock_vram_manager, mock_diffusers, mocker
+    ):
+        """Test that warmup is a no-op on CPU."""
+        mocker.patch("torch.cuda.is_available", return_value=False)
+        generator = make_generator(sample_config, mock_vram_manager, mocker)
+
+        assert not generator.warmup()
+        mock_diffusers.StableDiffusionXLPipeline.from_pretrained.assert_not_called()
@@ -0,0 +1,320 @@
+"""
+Tests for avatar profile management.
+
+Tests profile creation, listing, deletion, and the name index.
+"""
+
+import errno
+import json
+import os
+import re
+import shutil
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.avatar import profiles
+from src.avatar.profiles import AvatarProfileManager, _fast_copy
+
+FACE_REGION = {"x": 100, "y": 50, "width": 300, "height": 400}
+
+
+def create(manager, name, image_path):
+    """Create a profile with default region and aspect ratio."""
+    return manager.create_profile(
+        name=name,
+        image_path=image_path,
+        face_region=FACE_REGION,
+        aspect_ratio="1:1",
+    )
+
+
+class TestAvatarProfileManager:
+    """Tests for AvatarProfileManager class."""
+
+    def test_create_profile(self, tmp_path, sample_image_file):
+        """Test creating a new avatar profile."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+
+        profile = create(manager, "Presenter", sample_image_file)
+
+        assert profile.profile_id.startswith("ap-")
+        assert profile.base_image_path.read_bytes() == sample_image_file.read_bytes()
+        metadata_path = manager.storage_dir / profile.profile_id / "metadata.json"
+        metadata = json.loads(metadata_path.read_text())
+        assert metadata["name"] == "Presenter"
+        assert metadata["face_region"] == FACE_REGION
+        created = datetime.fromisoformat(profile.created_at.removesuffix("Z"))
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(now - created) < timedelta(minutes=1)
+
+    def test_metadata_written_atomically(self, tmp_path, sample_image_file, mocker):
+        """Test that metadata is renamed into place from a temp file."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        replace = mocker.spy(os, "replace")
+
+        profile = create(manager, "Presenter", sample_image_file)
+
+        profile_dir = manager.storage_dir / profile.profile_id
+        replace.assert_called_once_with(
+            profile_dir / "metadata.json.tmp", profile_dir / "metadata.json"
+        )
+        assert sorted(p.name for p in profile_dir.iterdir()) == [
+            "avatar.png",
+            "metadata.json",
+        ]
+
+    def test_metadata_published_after_image_copy(
+        self, tmp_path, sample_image_file, mocker
+    ):
+        """Test that metadata.json only appears once the avatar is copied."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        seen = []
+
+        def copy(src, dst):
+            seen.append((dst.parent / "metadata.json").exists())
+            shutil.copyfile(src, dst)
+
+        mocker.patch.object(profiles, "_fast_copy", side_effect=copy)
+
+        profile = create(manager, "Presenter", sample_image_file)
+
+        assert seen == [False]
+        assert profile.base_image_path.read_bytes() == sample_image_file.read_bytes()
+
+    def test_failed_copy_cleans_up(self, tmp_path, sample_image_file, mocker):
+        """Test that a failed image copy removes the partial profile."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        mocker.patch.object(profiles, "_fast_copy", side_effect=OSError("disk full"))
+
+        with pytest.raises(IOError, match="disk full"):
+            create(manager, "Presenter", sample_image_file)
+
+        assert list(manager.storage_dir.iterdir()) == []
+
+    def test_create_profile_duplicate_name(self, tmp_path, sample_image_file):
+        """Test that duplicate names are rejected."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        create(manager, "Presenter", sample_image_file)
+
+        with pytest.raises(ValueError, match="already exists"):
+            create(manager, "Presenter", sample_image_file)
+
+    def test_duplicate_check_skips_profile_loading(
+        self, tmp_path, sample_image_file, mocker
+    ):
+        """Test that creating profiles doesn't load existing ones."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        create(manager, "First", sample_image_file)
+        load_profile = mocker.spy(manager, "load_profile")
+        scan = mocker.spy(os, "scandir")
+
+        create(manager, "Second", sample_image_file)
+
+        load_profile.assert_not_called()
+        scan.assert_not_called()
+
+    def test_name_freed_by_delete(self, tmp_path, sample_image_file):
+        """Test that a deleted profile's name can be reused."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        profile = create(manager, "Presenter", sample_image_file)
+
+        assert manager.delete_profile(profile.profile_id)
+
+        assert create(manager, "Presenter", sample_image_file).name == "Presenter"
+
+    def test_index_sees_other_managers(self, tmp_path, sample_image_file):
+        """Test that profiles created by another manager are detected."""
+        first = AvatarProfileManager(tmp_path / "storage")
+        second = AvatarProfileManager(tmp_path / "storage")
+        create(first, "Unrelated", sample_image_file)
+        create(second, "Unrelated too", sample_image_file)
+
+        create(first, "Presenter", sample_image_file)
+
+        with pytest.raises(ValueError, match="already exists"):
+            create(second, "Presenter", sample_image_file)
+
+    def test_generate_id_format(self, tmp_path):
+        """Test that IDs are 'ap-' plus 8 lowercase hex characters."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+
+        ids = {manager._generate_id() for _ in range(100)}
+
+        assert len(ids) == 100
+        assert all(re.fullmatch(r"ap-[0-9a-f]{8}", pid) for pid in ids)
+
+    @pytest.mark.parametrize(
+        "name", ["Presenter", 'Quote " and \\ slash', "Présentatrice 発表者"]
+    )
+    def test_read_name(self, tmp_path, sample_image_file, name):
+        """Test that names are extracted from metadata, escapes included."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        profile = create(manager, name, sample_image_file)
+
+        assert manager._read_name(manager.storage_dir / profile.profile_id) == name
+
+    def test_read_name_falls_back_to_json(self, tmp_path):
+        """Test unusual formatting that the pattern doesn't match."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        profile_dir = manager.storage_dir / "ap-12345678"
+        profile_dir.mkdir()
+        # Escaped key: valid JSON for "name", but not matched byte for byte
+        (profile_dir / "metadata.json").write_text('{"\\u006eame": "Presenter"}')
+
+        assert manager._read_name(profile_dir) == "Presenter"
+
+    def test_list_profiles(self, tmp_path, sample_image_file):
+        """Test listing all stored profiles."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        create(manager, "First", sample_image_file)
+        create(manager, "Second", sample_image_file)
+
+        names = sorted(p.name for p in manager.list_profiles())
+
+        assert names == ["First", "Second"]
+
+    def test_list_profiles_parallel(self, tmp_path, sample_image_file, mocker):
+        """Test that larger listings read profiles on a thread pool."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        for i in range(profiles.PARALLEL_LIST_MIN):
+            create(manager, f"Avatar {i}", sample_image_file)
+        executor = mocker.spy(profiles, "ThreadPoolExecutor")
+
+        listed = manager.list_profiles()
+
+        executor.assert_called_once()
+        assert sorted(p.name for p in listed) == [
+            f"Avatar {i}" for i in range(profiles.PARALLEL_LIST_MIN)
+        ]
+
+    def test_iter_profiles_is_lazy(self, tmp_path, sample_image_file, mocker):
+        """Test that profiles are only read as the iterator advances."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        for name in ("First", "Second", "Third"):
+            create(manager, name, sample_image_file)
+        read_metadata = mocker.spy(manager, "_read_metadata")
+
+        profiles_iter = manager.iter_profiles()
+        first = next(profiles_iter)
+
+        assert first.name in ("First", "Second", "Third")
+        assert read_metadata.call_count == 1
+        assert len([first, *profiles_iter]) == 3
+
+    def test_list_profiles_ignores_files_and_symlinks(
+        self, tmp_path, sample_image_file, mocker
+    ):
+        """Test that only real directories are scanned, without a stat each."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        profile = create(manager, "Presenter", sample_image_file)
+        (manager.storage_dir / "notes.txt").write_text("not a profile")
+        (manager.storage_dir / "link").symlink_to(tmp_path)
+        is_dir = mocker.spy(type(manager.storage_dir), "is_dir")
+
+        listed = manager.list_profiles()
+
+        assert [p.profile_id for p in listed] == [profile.profile_id]
+        is_dir.assert_not_called()
+
+    def test_list_profiles_skips_invalid(self, tmp_path, sample_image_file):
+        """Test that unreadable profiles and stray files are skipped."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        create(manager, "Valid", sample_image_file)
+        (manager.storage_dir / "ap-broken").mkdir()
+        (manager.storage_dir / "ap-broken" / "metadata.json").write_text("{")
+        (manager.storage_dir / "notes.txt").write_text("not a profile")
+
+        listed = manager.list_profiles()
+
+        assert [p.name for p in listed] == ["Valid"]
+
+    def test_name_exists(self, tmp_path, sample_image_file):
+        """Test name lookups before and after creating a profile."""
+        manager = AvatarProfileManager(tmp_path / "storage")
+        assert not manager._name_exists("Presenter")
+
+        create(manager, "Presenter", sample_image_file)
+
+        assert manager._name_exists("Presenter")
+        assert not manager._name_exists("presenter")
+
+
+class TestMetadataJson:
+    """Tests for metadata serialization helpers."""
+
+    def test_stdlib_round_trip(self, mocker):
+        """Test indented JSON output and parsing without orjson."""
+        mocker.patch.object(profiles, "orjson", None)
+        metadata = {"name": "Présentateur", "face_region": FACE_REGION}
+
+        data = profiles._dumps(metadata)
+
+        assert data.startswith(b'{\n  "name"')
+        assert profiles._loads(data) == metadata
+
+    def test_uses_orjson_when_installed(self, mocker):
+        """Test that orjson does the work when it is available."""
+        fake_orjson = mocker.MagicMock()
+        mocker.patch.object(profiles, "orjson", fake_orjson)
+
+        data = profiles._dumps({"name": "Presenter"})
+        profiles._loads(data)
+
+        fake_orjson.dumps.assert_called_once_with(
+            {"name": "Presenter"}, option=fake_orjson.OPT_INDENT_2
+        )
+        fake_orjson.loads.assert_called_once_with(data)
+
+
+class TestFastCopy:
+    """Tests for _fast_copy."""
+
+    def test_copies_contents(self, tmp_path):
+        """Test that the copy matches the source byte for byte."""
+        src = tmp_path / "src.png"
+        src.write_bytes(os.urandom(300_000))
+
+        _fast_copy(src, tmp_path / "dst.png")
+
+        assert (tmp_path / "dst.png").read_bytes() == src.read_bytes()
+
+    def test_reflink_used_when_supported(self, tmp_path, mocker):
+        """Test that a successful reflink skips the byte copy."""
+        src = tmp_path / "src.png"
+        src.write_bytes(b"x")
+        ioctl = mocker.patch.object(profiles.fcntl, "ioctl")
+        copy = mocker.Mock()
+        mocker.patch.object(profiles, "_KERNEL_COPIES", [copy])
+
+        _fast_copy(src, tmp_path / "dst.png")
+
+        assert ioctl.call_args.args[1] == profiles.FICLONE
+        copy.assert_not_called()
+
+    def test_falls_back_when_kernel_copy_unsupported(self, tmp_path, mocker):
+        """Test that unsupported kernel copies fall back to the next method."""
+        src = tmp_path / "src.png"
+        src.write_bytes(b"x" * 5000)
+        unsupported = mocker.Mock(side_effect=OSError(errno.EXDEV, "cross-device"))
+        unsupported.__name__ = "unsupported"
+        mocker.patch.object(profiles, "_KERNEL_COPIES", [unsupported])
+
+        copyfileobj = mocker.spy(shutil, "copyfileobj")
+
+        _fast_copy(src, tmp_path / "dst.png")
+
+        assert (tmp_path / "dst.png").read_bytes() == b"x" * 5000
+        assert copyfileobj.call_args.args[2] == profiles.COPY_BUFFER_BYTES
+
+    def test_other_errors_raised(self, tmp_path, mocker):
+        """Test that real I/O errors are not swallowed."""
+        src = tmp_path / "src.png"
+        src.write_bytes(b"x")
+        failing = mocker.Mock(side_effect=OSError(errno.ENOSPC, "No space left"))
+        failing.__name__ = "failing"
+        mocker.patch.object(profiles, "_KERNEL_COPIES", [failing])
+
+        with pytest.raises(OSError):
+            _fast_copy(src, tmp_path / "dst.png")
+
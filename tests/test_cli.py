@@ -4,6 +4,8 @@ Tests for CLI commands.
 Tests Click commands for status, voice, avatar, video, and pipeline operations.
 """
 
+import os
+
 import pytest
 from click.testing import CliRunner
 
@@ -213,18 +215,22 @@ class TestAvatarCommands:
     def test_avatar_detect_command(self, mocker, tmp_path, sample_image_file):
         """Test avatar detect command."""
         # Mock detector
-        from src.avatar.interfaces import FaceDetectionResult
+        from src.avatar.interfaces import FaceDetectionResult, FaceRegion, Point
 
         mock_result = FaceDetectionResult(
             detected=True,
-            face_region={"x": 100, "y": 50, "width": 300, "height": 400},
-            landmarks={"nose": [150, 200], "left_eye": [130, 160], "right_eye": [170, 160]},
+            face_region=FaceRegion(100, 50, 300, 400),
+            landmarks={
+                "nose": Point(150, 200),
+                "left_eye": Point(130, 160),
+                "right_eye": Point(170, 160),
+            },
             confidence=0.95,
             error=None,
         )
 
         mock_detector = mocker.MagicMock()
-        mock_detector.detect.return_value = mock_result
+        mock_detector.detect_batch.return_value = [mock_result]
         mock_detector.validate_for_lipsync.return_value = (True, "Face is valid")
         mocker.patch("src.cli.MediaPipeFaceDetector", return_value=mock_detector)
 
@@ -235,6 +241,37 @@ class TestAvatarCommands:
         assert "Detected: Yes" in result.output
         assert "0.95" in result.output
 
+    def test_avatar_detect_several_images(self, mocker, tmp_path, sample_image_file):
+        """Test that several images are detected in one batch."""
+        from src.avatar.interfaces import FaceDetectionResult, FaceRegion
+
+        found = FaceDetectionResult(
+            detected=True,
+            face_region=FaceRegion(100, 50, 300, 400),
+            landmarks={},
+            confidence=0.95,
+            error=None,
+        )
+        missing = FaceDetectionResult(
+            detected=False, face_region=None, landmarks=None, confidence=0.0, error=None
+        )
+        mock_detector = mocker.MagicMock()
+        mock_detector.detect_batch.return_value = [found, missing]
+        mock_detector.validate_for_lipsync.return_value = (True, "Face is valid")
+        mocker.patch("src.cli.MediaPipeFaceDetector", return_value=mock_detector)
+        second = tmp_path / "second.png"
+        second.write_bytes(sample_image_file.read_bytes())
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["avatar", "detect", str(sample_image_file), str(second)]
+        )
+
+        mock_detector.detect_batch.assert_called_once_with([sample_image_file, second])
+        assert result.exit_code == 1
+        assert "Detected: Yes" in result.output
+        assert "No face detected" in result.output
+
 
 class TestVideoCommands:
     """Tests for video subcommands."""
@@ -400,6 +437,50 @@ class TestServerCommands:
         assert result.exit_code == 1
         assert "Missing dependencies" in result.output or "import" in result.output.lower()
 
+    def test_server_start_workers(self, mocker, tmp_path):
+        """Test that workers load the app by import string with CLI options."""
+        mock_uvicorn = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"uvicorn": mock_uvicorn})
+        mocker.patch.dict("os.environ")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["server", "start", "--workers", "4", "--storage", str(tmp_path)]
+        )
+
+        assert result.exit_code == 0
+        args, kwargs = mock_uvicorn.run.call_args
+        assert args[0] == "src.api.main:app"
+        assert kwargs["workers"] == 4
+        assert kwargs["limit_concurrency"] is None
+        assert os.environ["AVATAR_STORAGE"] == str(tmp_path)
+
+    def test_server_start_workers_from_config(self, mocker, tmp_path):
+        """Test that api.workers from the config is used without --workers."""
+        mock_uvicorn = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"uvicorn": mock_uvicorn})
+        mocker.patch.dict("os.environ")
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("api:\n  workers: 2\n")
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["server", "start", "--config", str(config_path)])
+
+        assert result.exit_code == 0
+        assert mock_uvicorn.run.call_args.kwargs["workers"] == 2
+
+    def test_server_start_limit_concurrency(self, mocker):
+        """Test that the connection limit is passed to uvicorn."""
+        mock_uvicorn = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"uvicorn": mock_uvicorn})
+        mocker.patch.dict("os.environ")
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["server", "start", "--limit-concurrency", "32"])
+
+        assert result.exit_code == 0
+        assert mock_uvicorn.run.call_args.kwargs["limit_concurrency"] == 32
+
 
 class TestCommandHelp:
     """Tests for command help text."""
@@ -23,7 +23,7 @@ class TestLoadConfig:
         # Should return rtx3080 defaults
         assert config["hardware_profile"] == "rtx3080"
         assert config["voice"]["xtts"]["batch_size"] == 2
-        assert config["avatar"]["sdxl"]["num_inference_steps"] == 40
+        assert config["avatar"]["sdxl"]["num_inference_steps"] == 25
         assert config["video"]["musetalk"]["fps"] == 25
 
     def test_load_config_with_valid_file(self, tmp_path, mocker):
@@ -92,19 +92,19 @@ class TestLoadConfig:
         mocker.patch("src.config.settings.get_hardware_profile", return_value="rtx4090")
         config_4090 = load_config()
         assert config_4090["voice"]["xtts"]["batch_size"] == 4
-        assert config_4090["avatar"]["sdxl"]["num_inference_steps"] == 50
+        assert config_4090["avatar"]["sdxl"]["num_inference_steps"] == 30
 
         # Test rtx3080 profile
         mocker.patch("src.config.settings.get_hardware_profile", return_value="rtx3080")
         config_3080 = load_config()
         assert config_3080["voice"]["xtts"]["batch_size"] == 2
-        assert config_3080["avatar"]["sdxl"]["num_inference_steps"] == 40
+        assert config_3080["avatar"]["sdxl"]["num_inference_steps"] == 25
 
         # Test low_vram profile
         mocker.patch("src.config.settings.get_hardware_profile", return_value="low_vram")
         config_low = load_config()
         assert config_low["voice"]["xtts"]["batch_size"] == 1
-        assert config_low["avatar"]["sdxl"]["num_inference_steps"] == 25
+        assert config_low["avatar"]["sdxl"]["num_inference_steps"] == 20
 
     def test_load_config_preserves_nested_defaults(self, tmp_path, mocker):
         """Test that config merging preserves nested default values."""
@@ -133,6 +133,57 @@ class TestLoadConfig:
         assert "voice" in config  # Other top-level keys preserved
 
 
+class TestLoadConfigCache:
+    """Tests for load_config caching."""
+
+    def test_cached_file_read_once(self, tmp_path, mocker):
+        """Test that repeated loads do not re-read the config file."""
+        mocker.patch("src.config.settings.get_hardware_profile", return_value="rtx3080")
+
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump({"voice": {"xtts": {"batch_size": 4}}}, f)
+
+        spy = mocker.spy(yaml, "safe_load")
+
+        first = load_config(config_path=config_path)
+        second = load_config(config_path=config_path)
+
+        assert first == second
+        assert spy.call_count == 1
+
+    def test_returned_configs_are_independent(self, mocker):
+        """Test that mutating a returned config does not affect later loads."""
+        mocker.patch("src.config.settings.get_hardware_profile", return_value="rtx3080")
+
+        first = load_config()
+        first["voice"]["xtts"]["batch_size"] = 99
+
+        second = load_config()
+
+        assert second["voice"]["xtts"]["batch_size"] == 2
+        assert DEFAULT_CONFIGS["rtx3080"]["voice"]["xtts"]["batch_size"] == 2
+
+    def test_reload_picks_up_changes(self, tmp_path, mocker):
+        """Test that reload=True re-reads a modified config file."""
+        mocker.patch("src.config.settings.get_hardware_profile", return_value="rtx3080")
+
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump({"voice": {"xtts": {"batch_size": 4}}}, f)
+
+        assert load_config(config_path=config_path)["voice"]["xtts"]["batch_size"] == 4
+
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump({"voice": {"xtts": {"batch_size": 8}}}, f)
+
+        assert load_config(config_path=config_path)["voice"]["xtts"]["batch_size"] == 4
+        assert (
+            load_config(config_path=config_path, reload=True)["voice"]["xtts"]["batch_size"]
+            == 8
+        )
+
+
 class TestDeepMerge:
     """Tests for _deep_merge helper function."""
 
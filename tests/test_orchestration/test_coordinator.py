@@ -0,0 +1,158 @@
+"""
+Tests for pipeline coordinator.
+
+Tests stage sequencing and error handling with all models mocked.
+"""
+
+import threading
+
+import pytest
+
+from src.avatar.interfaces import FaceDetectionResult, FaceRegion
+from src.orchestration.coordinator import PipelineConfig, PipelineCoordinator
+from src.video.interfaces import EncodingResult, LipSyncResult
+from src.voice.interfaces import SynthesisResult
+
+
+@pytest.fixture
+def coordinator(temp_storage, sample_config, mock_vram_manager, mock_voice_profile, mocker):
+    """Pipeline coordinator with mocked models and face detector."""
+    coord = PipelineCoordinator(
+        config=sample_config,
+        vram_manager=mock_vram_manager,
+        storage_path=temp_storage,
+    )
+    coord.voice_profile_manager = mocker.MagicMock()
+    coord.voice_profile_manager.load_profile.return_value = mock_voice_profile
+
+    coord.face_detector = mocker.MagicMock()
+    coord.face_detector.detect.return_value = FaceDetectionResult(
+        detected=True,
+        face_region=FaceRegion(100, 100, 200, 200),
+        landmarks={},
+        confidence=0.9,
+        error=None,
+    )
+    coord.face_detector.validate_for_lipsync.return_value = (True, "Face OK")
+
+    return coord
+
+
+@pytest.fixture
+def mock_stages(mocker, tmp_path):
+    """Mock synthesizer, lip-sync engine, and encoder."""
+    audio_path = tmp_path / "speech.wav"
+    video_path = tmp_path / "lipsync.mp4"
+
+    synthesizer = mocker.patch("src.orchestration.coordinator.CoquiTTSSynthesizer")
+    synthesizer.return_value.synthesize.return_value = SynthesisResult(
+        success=True,
+        audio_path=audio_path,
+        duration_seconds=2.0,
+        error=None,
+        processing_time_seconds=0.1,
+    )
+
+    lipsync = mocker.patch("src.orchestration.coordinator.MuseTalkLipSync")
+    lipsync.return_value.generate.return_value = LipSyncResult(
+        success=True,
+        video_path=video_path,
+        duration_seconds=2.0,
+        frame_count=50,
+        fps=25,
+        resolution=(512, 512),
+        error=None,
+        processing_time_seconds=0.1,
+    )
+
+    encoder = mocker.patch("src.orchestration.coordinator.FFmpegEncoder")
+    encoder.return_value.encode.return_value = EncodingResult(
+        success=True,
+        output_path=tmp_path / "final.mp4",
+        file_size_bytes=1024,
+        duration_seconds=2.0,
+        error=None,
+        processing_time_seconds=0.1,
+    )
+
+    return {"synthesizer": synthesizer, "lipsync": lipsync, "encoder": encoder}
+
+
+class TestPipelineCoordinator:
+    """Tests for PipelineCoordinator.execute."""
+
+    @pytest.mark.parametrize("overlap", [True, False])
+    def test_execute_success(self, coordinator, mock_stages, sample_image_file, tmp_path, overlap):
+        """Test that all stages complete in order."""
+        result = coordinator.execute(
+            text="Hello",
+            voice_profile_id="vp-test1234",
+            avatar_image=sample_image_file,
+            output_path=tmp_path / "final.mp4",
+            config=PipelineConfig(overlap_stages=overlap),
+        )
+
+        assert result.success
+        assert result.stages_completed == [
+            "load_profile",
+            "synthesize_speech",
+            "validate_avatar",
+            "generate_lipsync",
+            "encode_video",
+        ]
+        assert result.file_size_bytes == 1024
+
+    def test_validation_runs_during_synthesis(
+        self, coordinator, mock_stages, sample_image_file, tmp_path
+    ):
+        """Test that face validation overlaps speech synthesis."""
+        validation_started = threading.Event()
+
+        def detect(image_path):
+            validation_started.set()
+            return coordinator.face_detector.detect.return_value
+
+        def synthesize(*args, **kwargs):
+            # Only completes if validation is running concurrently
+            assert validation_started.wait(timeout=5)
+            return mock_stages["synthesizer"].return_value.synthesize.return_value
+
+        coordinator.face_detector.detect.side_effect = detect
+        mock_stages["synthesizer"].return_value.synthesize.side_effect = synthesize
+
+        result = coordinator.execute(
+            text="Hello",
+            voice_profile_id="vp-test1234",
+            avatar_image=sample_image_file,
+            output_path=tmp_path / "final.mp4",
+        )
+
+        assert result.success
+
+    def test_validation_failure(self, coordinator, mock_stages, sample_image_file, tmp_path):
+        """Test that a face validation failure stops the pipeline."""
+        coordinator.face_detector.validate_for_lipsync.return_value = (False, "Face too small")
+
+        result = coordinator.execute(
+            text="Hello",
+            voice_profile_id="vp-test1234",
+            avatar_image=sample_image_file,
+            output_path=tmp_path / "final.mp4",
+        )
+
+        assert not result.success
+        assert "Face too small" in result.error
+        assert result.stages_completed == ["load_profile", "synthesize_speech"]
+        mock_stages["lipsync"].return_value.generate.assert_not_called()
+
+    def test_missing_avatar_image(self, coordinator, mock_stages, tmp_path):
+        """Test that a missing avatar image fails the pipeline."""
+        result = coordinator.execute(
+            text="Hello",
+            voice_profile_id="vp-test1234",
+            avatar_image=tmp_path / "missing.png",
+            output_path=tmp_path / "final.mp4",
+        )
+
+        assert not result.success
+        assert "not found" in result.error
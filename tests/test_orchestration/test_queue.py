@@ -0,0 +1,218 @@
+"""
+Tests for the file-based job queue.
+
+Tests job persistence and the parsed-file cache.
+"""
+
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.orchestration import JobQueue, JobStatus, JobType
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Job queue backed by temporary storage."""
+    return JobQueue(tmp_path)
+
+
+def cached_ids(queue: JobQueue) -> set[str]:
+    """IDs of all jobs in the queue's cache shards."""
+    return {job_id for _, shard in queue._cache_shards for job_id in shard}
+
+
+class TestJobCache:
+    """Tests for reuse of parsed job files."""
+
+    def test_repeat_get_skips_file_read(self, queue, mocker):
+        """Test that an unchanged job file is not re-parsed."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        json_load = mocker.spy(json, "load")
+
+        queue.get(job_id)
+        queue.list_jobs()
+
+        assert json_load.call_count == 0
+
+    def test_external_write_detected(self, queue):
+        """Test that a job file rewritten by another process is re-read."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        job_file = queue.jobs_dir / f"{job_id}.json"
+
+        data = json.loads(job_file.read_text())
+        data["status"] = "running"
+        data["stage"] = "Synthesizing speech"
+        tmp_file = job_file.with_name("external.tmp")
+        tmp_file.write_text(json.dumps(data))
+        tmp_file.replace(job_file)
+
+        job = queue.get(job_id)
+
+        assert job.status == JobStatus.RUNNING
+        assert job.stage == "Synthesizing speech"
+
+    def test_returned_jobs_are_copies(self, queue):
+        """Test that mutating a returned job does not leak into later reads."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+
+        queue.get(job_id).params["text"] = "Changed"
+
+        assert queue.get(job_id).params["text"] == "Hello"
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        """Test that the cache stays within its size limit."""
+        queue = JobQueue(tmp_path, cache_size=2, cache_shards=1)
+        first = queue.submit(JobType.FULL_PIPELINE, {"text": "one"})
+        queue.submit(JobType.FULL_PIPELINE, {"text": "two"})
+        queue.submit(JobType.FULL_PIPELINE, {"text": "three"})
+
+        assert len(cached_ids(queue)) == 2
+        assert first not in cached_ids(queue)
+        assert queue.get(first).params["text"] == "one"
+
+    def test_delete_drops_entry(self, queue):
+        """Test that deleted jobs are no longer returned."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+
+        assert queue.delete(job_id)
+        assert queue.get(job_id) is None
+        assert job_id not in cached_ids(queue)
+
+    def test_save_increments_revision(self, queue):
+        """Test that each save bumps the stored job revision."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        job = queue.get(job_id)
+        job.start()
+        queue.update(job)
+
+        assert queue.get(job_id).revision == 2
+
+    def test_failed_save_keeps_revision(self, queue, mocker):
+        """Test that a save that fails leaves no temp file or revision bump."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        job = queue.get(job_id)
+        mocker.patch("os.replace", side_effect=OSError("disk full"))
+
+        assert not queue.update(job)
+
+        assert job.revision == 1
+        assert sorted(p.name for p in queue.jobs_dir.iterdir()) == [f"{job_id}.json"]
+
+    def test_concurrent_saves_of_one_job(self, queue):
+        """Test that racing saves of one job all land as whole files."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        jobs = [queue.get(job_id) for _ in range(20)]
+        for i, job in enumerate(jobs):
+            job.stage = f"Stage {i}"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            saved = list(pool.map(queue.update, jobs))
+
+        assert all(saved)
+        assert queue.get(job_id).stage in {job.stage for job in jobs}
+        assert [p.name for p in queue.jobs_dir.iterdir()] == [f"{job_id}.json"]
+
+    def test_cache_keyed_on_saved_file(self, queue, mocker):
+        """Test that a save caches its data under its own file's stat."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        job = queue.get(job_id)
+        job.stage = "Mine"
+        job_file = queue.jobs_dir / f"{job_id}.json"
+        replace = os.replace
+
+        def replace_then_race(src, dst):
+            replace(src, dst)
+            # Another thread's save lands before this one updates the cache
+            data = json.loads(job_file.read_text())
+            data["stage"] = "Theirs"
+            other = job_file.with_name("other.tmp")
+            other.write_text(json.dumps(data))
+            replace(other, dst)
+
+        mocker.patch("os.replace", side_effect=replace_then_race)
+        queue.update(job)
+        mocker.stopall()
+
+        assert queue.get(job_id).stage == "Theirs"
+
+    def test_shards_bound_total_size(self, tmp_path):
+        """Test that sharding keeps the cache near its overall size limit."""
+        queue = JobQueue(tmp_path, cache_size=8, cache_shards=3)
+
+        for i in range(50):
+            queue.submit(JobType.FULL_PIPELINE, {"text": str(i)})
+
+        assert len(queue._cache_shards) == 4
+        assert all(len(shard) <= 2 for _, shard in queue._cache_shards)
+
+    def test_concurrent_reads(self, queue):
+        """Test that jobs read from many threads at once are all returned."""
+        job_ids = [
+            queue.submit(JobType.FULL_PIPELINE, {"text": str(i)}) for i in range(20)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            jobs = list(pool.map(queue.get, job_ids * 5))
+
+        assert [job.job_id for job in jobs] == job_ids * 5
+
+
+
+class TestTryCancel:
+    """Tests for JobQueue.try_cancel."""
+
+    def test_cancels_pending(self, queue):
+        """Test that a pending job is cancelled."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+
+        assert queue.try_cancel(job_id) == (JobStatus.PENDING, True)
+        assert queue.get(job_id).status == JobStatus.CANCELLED
+
+    def test_started_since_read_not_overwritten(self, queue, mocker):
+        """Test that a job saved after the cancel read it is left alone."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        stale = queue.get(job_id)
+        running = queue.get(job_id)
+        running.start()
+        queue.update(running)
+        mocker.patch.object(queue, "get", side_effect=[stale, running])
+
+        result = queue.try_cancel(job_id)
+        mocker.stopall()
+
+        assert result == (JobStatus.RUNNING, False)
+        assert queue.get(job_id).status == JobStatus.RUNNING
+
+    def test_saves_wait_for_cancel(self, queue):
+        """Test that other saves of the job block while its lock is held."""
+        job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        job = queue.get(job_id)
+        job.start()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with queue._save_lock(job_id):
+                update = pool.submit(queue.update, job)
+                assert queue.try_cancel(job_id) == (JobStatus.PENDING, True)
+                assert not update.done()
+
+            assert update.result()
+
+
+class TestJobFiles:
+    """Tests for the job files written to storage."""
+
+    def test_job_file_mode_follows_umask(self, tmp_path):
+        """Test that job files get the umask mode, not mkstemp's 0600."""
+        old_umask = os.umask(0o022)
+        try:
+            queue = JobQueue(storage_path=tmp_path)
+            job_id = queue.submit(JobType.FULL_PIPELINE, {"text": "Hello"})
+        finally:
+            os.umask(old_umask)
+
+        job_file = queue.jobs_dir / f"{job_id}.json"
+        assert stat.S_IMODE(job_file.stat().st_mode) == 0o644
@@ -0,0 +1,29 @@
+"""
+Tests for top-level package imports.
+"""
+
+import subprocess
+import sys
+
+import src
+
+
+class TestLazyImports:
+    """Tests for on-demand subpackage loading."""
+
+    def test_import_does_not_load_subpackages(self):
+        """Test that `import src` leaves the API and model stacks unloaded."""
+        code = (
+            "import sys, src; "
+            "print(any(m in sys.modules for m in ('src.api', 'src.voice', 'fastapi')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_subpackage_loaded_on_access(self):
+        """Test that attribute access imports the subpackage."""
+        assert src.orchestration.JobQueue.__name__ == "JobQueue"
+        assert "orchestration" in dir(src)
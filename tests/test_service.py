@@ -0,0 +1,67 @@
+"""
+Tests for the shared avatar service.
+
+Tests lazy component construction and process-wide singleton behavior.
+"""
+
+import pytest
+
+import src.service as service_module
+from src.service import AvatarService, get_service
+from src.voice import CoquiTTSSynthesizer, VoiceProfileManager
+
+
+@pytest.fixture
+def fresh_service(mocker):
+    """Reset the module-level service singleton."""
+    mocker.patch.object(service_module, "_service", None)
+
+
+class TestAvatarService:
+    """Tests for AvatarService class."""
+
+    def test_components_are_cached(self, tmp_path, sample_config):
+        """Test that component accessors return the same instance."""
+        service = AvatarService(sample_config, storage_path=tmp_path)
+
+        assert service.synthesizer is service.synthesizer
+        assert service.voice_profile_manager is service.voice_profile_manager
+
+    def test_components_share_vram_manager(self, tmp_path, sample_config):
+        """Test that model wrappers share the service VRAM manager."""
+        service = AvatarService(sample_config, storage_path=tmp_path)
+
+        assert isinstance(service.synthesizer, CoquiTTSSynthesizer)
+        assert service.synthesizer.vram_manager is service.vram_manager
+        assert service.cloner.vram_manager is service.vram_manager
+        assert service.cloner.profile_manager is service.voice_profile_manager
+
+    def test_components_use_config_sections(self, tmp_path, sample_config):
+        """Test that wrappers receive their config sections."""
+        service = AvatarService(sample_config, storage_path=tmp_path)
+
+        assert service.synthesizer.config == sample_config["voice"]["tts"]
+        assert service.generator.config == sample_config["avatar"]["sdxl"]
+
+    def test_storage_path(self, tmp_path, sample_config):
+        """Test that profile managers use the service storage path."""
+        service = AvatarService(sample_config, storage_path=tmp_path)
+
+        assert isinstance(service.voice_profile_manager, VoiceProfileManager)
+        assert service.voice_profile_manager.storage_dir == tmp_path / "voices"
+
+
+class TestGetService:
+    """Tests for get_service function."""
+
+    def test_returns_singleton(self, tmp_path, sample_config, fresh_service, mocker):
+        """Test that repeated calls return the same service."""
+        mock_load = mocker.patch(
+            "src.service.load_config", return_value=sample_config
+        )
+
+        first = get_service(storage_path=tmp_path)
+        second = get_service(storage_path=tmp_path)
+
+        assert first is second
+        mock_load.assert_called_once()
@@ -0,0 +1,17 @@
+"""
+Tests for formatting helpers.
+"""
+
+from src.utils.formatting import human_size
+
+
+class TestHumanSize:
+    """Tests for human_size function."""
+
+    def test_megabytes(self):
+        """Test formatting in megabytes."""
+        assert human_size(5 * 1024 * 1024) == "5.00 MB"
+
+    def test_zero(self):
+        """Test empty file."""
+        assert human_size(0) == "0.00 MB"
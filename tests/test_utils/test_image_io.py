@@ -0,0 +1,117 @@
+"""
+Tests for fast image reading and writing.
+
+Tests format dispatch with and without TurboJPEG installed.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils import image_io
+from src.utils.image_io import decode_rgb, fast_save, load_rgb
+
+
+@pytest.fixture
+def rgb_array():
+    """Small RGB test image."""
+    return np.full((32, 48, 3), 128, dtype=np.uint8)
+
+
+@pytest.fixture
+def no_turbojpeg(mocker):
+    """Force the PIL fallback for JPEG."""
+    mocker.patch.object(image_io, "_get_turbojpeg", return_value=None)
+
+
+class TestFastSave:
+    """Tests for fast_save function."""
+
+    def test_png_round_trip(self, rgb_array, tmp_path):
+        """Test that PNG output is lossless."""
+        path = tmp_path / "avatar.png"
+
+        fast_save(rgb_array, path)
+
+        assert np.array_equal(np.asarray(Image.open(path)), rgb_array)
+
+    def test_png_uses_fast_compression(self, rgb_array, tmp_path, mocker):
+        """Test that PNG is written with low zlib compression."""
+        image = Image.fromarray(rgb_array)
+        mock_save = mocker.patch.object(image, "save")
+
+        fast_save(image, tmp_path / "avatar.png")
+
+        assert mock_save.call_args.kwargs["compress_level"] == 1
+
+    def test_webp_output(self, rgb_array, tmp_path):
+        """Test that .webp paths are written as lossy WebP."""
+        path = tmp_path / "avatar.webp"
+
+        fast_save(rgb_array, path, quality=92)
+
+        with Image.open(path) as saved:
+            assert saved.format == "WEBP"
+            assert saved.size == (48, 32)
+
+    def test_jpeg_pil_fallback(self, rgb_array, tmp_path, no_turbojpeg):
+        """Test JPEG output without TurboJPEG installed."""
+        path = tmp_path / "avatar.JPG"
+
+        fast_save(Image.fromarray(rgb_array), path)
+
+        with Image.open(path) as saved:
+            assert saved.format == "JPEG"
+            assert saved.size == (48, 32)
+
+    def test_jpeg_uses_turbojpeg(self, rgb_array, tmp_path, mocker):
+        """Test that TurboJPEG encodes JPEG output when available."""
+        encoder = mocker.MagicMock()
+        encoder.encode.return_value = b"\xff\xd8jpeg"
+        mocker.patch.object(image_io, "_get_turbojpeg", return_value=encoder)
+        mocker.patch.dict("sys.modules", {"turbojpeg": mocker.MagicMock()})
+        path = tmp_path / "avatar.jpg"
+
+        fast_save(rgb_array, path, quality=90)
+
+        assert path.read_bytes() == b"\xff\xd8jpeg"
+        assert encoder.encode.call_args.kwargs["quality"] == 90
+
+
+class TestDecodeRgb:
+    """Tests for decode_rgb and load_rgb."""
+
+    def test_png_decoded_as_rgb(self, tmp_path):
+        """Test that channels come back in RGB order."""
+        rgb = np.zeros((8, 8, 3), dtype=np.uint8)
+        rgb[..., 0] = 255  # Red
+        path = tmp_path / "red.png"
+        Image.fromarray(rgb).save(path)
+
+        image = load_rgb(path)
+
+        assert np.array_equal(image, rgb)
+
+    def test_jpeg_opencv_fallback(self, tmp_path, no_turbojpeg):
+        """Test JPEG decoding through OpenCV without TurboJPEG."""
+        path = tmp_path / "red.jpg"
+        Image.new("RGB", (16, 16), (255, 0, 0)).save(path, quality=95)
+
+        image = decode_rgb(path.read_bytes())
+
+        assert image.shape == (16, 16, 3)
+        assert image[8, 8, 0] > 200 and image[8, 8, 2] < 50
+
+    def test_jpeg_uses_turbojpeg(self, mocker):
+        """Test that JPEG bytes are decoded by TurboJPEG when available."""
+        decoder = mocker.MagicMock()
+        mocker.patch.object(image_io, "_get_turbojpeg", return_value=decoder)
+        mocker.patch.dict("sys.modules", {"turbojpeg": mocker.MagicMock()})
+
+        image = decode_rgb(b"\xff\xd8\xff\xe0data")
+
+        assert image is decoder.decode.return_value
+
+    def test_invalid_data(self, no_turbojpeg):
+        """Test that unreadable bytes return None."""
+        assert decode_rgb(b"not an image") is None
@@ -0,0 +1,84 @@
+"""
+Tests for FP8 quantization utilities.
+
+Tests linear layer replacement and numerical closeness on CPU.
+"""
+
+import pytest
+import torch
+from torch import nn
+
+from src.utils.quantization import FP8Linear, fp8_available, quantize_linear_layers
+
+pytestmark = pytest.mark.skipif(not fp8_available(), reason="FP8 not supported")
+
+
+class TestFP8Linear:
+    """Tests for FP8Linear module."""
+
+    def test_weight_stored_as_fp8(self):
+        """Test that weights are stored in FP8 with a scale."""
+        layer = FP8Linear(nn.Linear(16, 8))
+
+        assert layer.weight.dtype == torch.float8_e4m3fn
+        assert layer.weight.shape == (8, 16)
+        assert layer.scale.numel() == 1
+
+    def test_output_close_to_original(self):
+        """Test that quantized output approximates the original layer."""
+        torch.manual_seed(0)
+        linear = nn.Linear(64, 32)
+        x = torch.randn(4, 64)
+
+        expected = linear(x)
+        actual = FP8Linear(linear)(x)
+
+        assert actual.shape == expected.shape
+        assert torch.allclose(actual, expected, atol=0.1, rtol=0.1)
+
+    def test_no_bias(self):
+        """Test layer without bias."""
+        layer = FP8Linear(nn.Linear(16, 8, bias=False))
+
+        assert layer.bias is None
+        assert layer(torch.randn(2, 16)).shape == (2, 8)
+
+
+class TestQuantizeLinearLayers:
+    """Tests for quantize_linear_layers function."""
+
+    def test_replaces_nested_linears(self):
+        """Test that nested linear layers are replaced in place."""
+        model = nn.Sequential(
+            nn.Linear(8, 8),
+            nn.ReLU(),
+            nn.Sequential(nn.Linear(8, 4)),
+        )
+
+        replaced = quantize_linear_layers(model)
+
+        assert replaced == 2
+        assert isinstance(model[0], FP8Linear)
+        assert isinstance(model[2][0], FP8Linear)
+        assert isinstance(model[1], nn.ReLU)
+        assert model(torch.randn(1, 8)).shape == (1, 4)
+
+    def test_skip_patterns(self):
+        """Test that layers matching a skip pattern keep full precision."""
+        model = nn.Module()
+        model.transformer = nn.Sequential(nn.Linear(8, 8))
+        model.vae_decoder = nn.Sequential(nn.Linear(8, 8))
+
+        replaced = quantize_linear_layers(model, skip=("vae",))
+
+        assert replaced == 1
+        assert isinstance(model.transformer[0], FP8Linear)
+        assert isinstance(model.vae_decoder[0], nn.Linear)
+
+    def test_unsupported_torch(self, mocker):
+        """Test that quantization is skipped without FP8 support."""
+        mocker.patch("src.utils.quantization.fp8_available", return_value=False)
+        model = nn.Sequential(nn.Linear(8, 8))
+
+        assert quantize_linear_layers(model) == 0
+        assert isinstance(model[0], nn.Linear)
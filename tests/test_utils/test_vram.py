@@ -6,7 +6,7 @@ Tests VRAM monitoring, allocation checking, and cleanup operations.
 
 import pytest
 
-from src.utils.vram import VRAMManager, VRAMStatus
+from src.utils.vram import VRAMManager, VRAMStatus, exclusive_model
 
 
 class TestVRAMStatus:
@@ -85,6 +85,29 @@ class TestVRAMManager:
         assert manager.device_id == 0
         assert manager._cuda_available is False
 
+    def test_init_enables_tf32_with_cuda(self, mocker):
+        """Test that TF32 is enabled when CUDA is available."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+
+        VRAMManager(device_id=0)
+
+        assert mock_torch.backends.cuda.matmul.allow_tf32 is True
+        assert mock_torch.backends.cudnn.allow_tf32 is True
+        mock_torch.set_float32_matmul_precision.assert_called_once_with("high")
+        assert mock_torch.backends.cudnn.benchmark is True
+
+    def test_init_skips_tf32_without_cuda(self, mocker):
+        """Test that TF32 settings are untouched without CUDA."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = False
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+
+        VRAMManager(device_id=0)
+
+        mock_torch.set_float32_matmul_precision.assert_not_called()
+
     def test_init_no_torch(self, mocker):
         """Test VRAMManager initialization when PyTorch not installed."""
         mocker.patch.dict("sys.modules", {"torch": None})
@@ -142,6 +165,35 @@ class TestVRAMManager:
         assert status.total_mb == 0
         assert status.cuda_available is False
 
+    def test_get_status_reuses_recent_snapshot(self, mocker):
+        """Test that max_age_ms skips the CUDA query for a fresh snapshot."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        mock_torch.cuda.mem_get_info.return_value = (8 * 1024**3, 10 * 1024**3)
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+
+        manager = VRAMManager(device_id=0)
+        first = manager.get_status()
+        second = manager.get_status(max_age_ms=500)
+
+        assert second is first
+        assert mock_torch.cuda.mem_get_info.call_count == 1
+
+    def test_get_status_requeries_stale_snapshot(self, mocker):
+        """Test that an expired snapshot and the default both query CUDA."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        mock_torch.cuda.mem_get_info.return_value = (8 * 1024**3, 10 * 1024**3)
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+
+        manager = VRAMManager(device_id=0)
+        manager.get_status()
+        manager._last_status_at -= 1.0
+        manager.get_status(max_age_ms=500)
+        manager.get_status()
+
+        assert mock_torch.cuda.mem_get_info.call_count == 3
+
     def test_can_load_with_sufficient_vram(self, mocker):
         """Test can_load returns True when sufficient VRAM available."""
         mock_torch = mocker.MagicMock()
@@ -196,6 +248,63 @@ class TestVRAMManager:
         can_load = manager.can_load(required_mb=4096, safety_margin_mb=2048)
         assert can_load is False
 
+    def test_can_load_evicts_resident_models(self, mocker):
+        """Test that can_load unloads resident models, oldest first, to fit."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        gb = 1024 * 1024 * 1024
+        mock_torch.cuda.mem_get_info.side_effect = [
+            (2 * gb, 10 * gb),  # Before eviction
+            (9 * gb, 10 * gb),  # After unloading the oldest model
+        ]
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+        manager = VRAMManager(device_id=0)
+        unloaded = []
+        manager.keep_resident("sdxl", lambda: unloaded.append("sdxl"))
+        manager.keep_resident("xtts", lambda: unloaded.append("xtts"))
+
+        can_load = manager.can_load(required_mb=4096)
+
+        assert can_load is True
+        assert unloaded == ["sdxl"]
+
+    def test_can_load_skips_busy_resident_models(self, mocker):
+        """Test that a model whose unload callback reports busy is kept."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        gb = 1024 * 1024 * 1024
+        mock_torch.cuda.mem_get_info.side_effect = [
+            (2 * gb, 10 * gb),  # Before eviction
+            (9 * gb, 10 * gb),  # After unloading the idle model
+        ]
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+        manager = VRAMManager(device_id=0)
+        unloaded = []
+        manager.keep_resident("sdxl", lambda: False)
+        manager.keep_resident("xtts", lambda: unloaded.append("xtts"))
+
+        assert manager.can_load(required_mb=4096) is True
+        assert unloaded == ["xtts"]
+        # The busy model stays registered for a later eviction
+        assert manager._evict_resident() is False
+
+    def test_can_load_false_when_nothing_to_evict(self, mocker):
+        """Test that released models are not evicted."""
+        mock_torch = mocker.MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+        mock_torch.cuda.mem_get_info.return_value = (
+            2 * 1024 * 1024 * 1024,  # 2GB free
+            10 * 1024 * 1024 * 1024  # 10GB total
+        )
+        mocker.patch.dict("sys.modules", {"torch": mock_torch})
+        manager = VRAMManager(device_id=0)
+        unload = mocker.MagicMock()
+        manager.keep_resident("sdxl", unload)
+        manager.release_resident("sdxl")
+
+        assert manager.can_load(required_mb=4096) is False
+        unload.assert_not_called()
+
     def test_can_load_without_cuda_always_true(self, mocker):
         """Test can_load always returns True in CPU mode."""
         mock_torch = mocker.MagicMock()
@@ -300,3 +409,52 @@ class TestVRAMManager:
         # Cleanup should use correct device ID
         manager1.force_cleanup()
         mock_torch.cuda.synchronize.assert_called_with(1)
+
+
+class TestExclusiveModel:
+    """Tests for the exclusive_model decorator."""
+
+    def test_calls_on_one_wrapper_run_one_at_a_time(self):
+        """Test that overlapping calls on one wrapper are serialized."""
+        import threading
+        import time
+
+        class Wrapper:
+            def __init__(self):
+                self._model_lock = threading.RLock()
+                self.active = 0
+                self.max_active = 0
+
+            @exclusive_model
+            def run(self):
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                time.sleep(0.01)
+                self.active -= 1
+
+        wrapper = Wrapper()
+        threads = [threading.Thread(target=wrapper.run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert wrapper.max_active == 1
+
+    def test_reentrant_within_a_call(self):
+        """Test that a locked method can call another locked method."""
+        import threading
+
+        class Wrapper:
+            def __init__(self):
+                self._model_lock = threading.RLock()
+
+            @exclusive_model
+            def outer(self):
+                return self.inner()
+
+            @exclusive_model
+            def inner(self):
+                return "done"
+
+        assert Wrapper().outer() == "done"
@@ -0,0 +1 @@
+"""Video module tests."""
@@ -0,0 +1,206 @@
+"""
+Tests for FFmpeg video encoder.
+
+Tests frame streaming with FFmpeg subprocesses mocked out.
+"""
+
+import numpy as np
+import pytest
+import torch
+
+from src.video.encoder import FFmpegEncoder
+
+
+@pytest.fixture
+def encoder(mocker):
+    """Encoder that believes FFmpeg is installed."""
+    mocker.patch.object(FFmpegEncoder, "_check_ffmpeg", return_value=True)
+    mocker.patch.object(FFmpegEncoder, "_get_video_duration", return_value=1.0)
+    return FFmpegEncoder()
+
+
+@pytest.fixture
+def mock_popen(mocker, tmp_path):
+    """Mock FFmpeg process that records stdin writes."""
+    written = []
+    proc = mocker.MagicMock()
+    proc.stdin.write.side_effect = lambda data: written.append(bytes(data))
+    proc.wait.return_value = 0
+    proc.written = written
+
+    def popen(cmd, **kwargs):
+        # Simulate FFmpeg creating the output file
+        with open(cmd[-1], "wb") as f:
+            f.write(b"video")
+        return proc
+
+    mocker.patch("src.video.encoder.subprocess.Popen", side_effect=popen)
+    return proc
+
+
+class TestEncodeFrames:
+    """Tests for FFmpegEncoder.encode_frames."""
+
+    def test_streams_frames_to_stdin(self, encoder, mock_popen, sample_audio_file, tmp_path):
+        """Test that each frame is written as raw RGB24 bytes."""
+        frames = [np.full((4, 6, 3), i, dtype=np.uint8) for i in range(3)]
+        output_path = tmp_path / "out.mp4"
+
+        result = encoder.encode_frames(frames, sample_audio_file, output_path, fps=25)
+
+        assert result.success
+        assert result.output_path == output_path
+        assert len(mock_popen.written) == 3
+        assert all(len(chunk) == 4 * 6 * 3 for chunk in mock_popen.written)
+        assert mock_popen.written[2] == frames[2].tobytes()
+        mock_popen.stdin.close.assert_called_once()
+
+    def test_accepts_iterable_of_tensors(
+        self, encoder, mock_popen, sample_audio_file, tmp_path
+    ):
+        """Test that any iterable of tensor frames is accepted."""
+        frames = (torch.zeros(4, 6, 3, dtype=torch.uint8) for _ in range(5))
+
+        result = encoder.encode_frames(
+            frames, sample_audio_file, tmp_path / "out.mp4", fps=25
+        )
+
+        assert result.success
+        assert len(mock_popen.written) == 5
+
+    def test_ffmpeg_failure(self, encoder, mock_popen, sample_audio_file, tmp_path):
+        """Test that a non-zero FFmpeg exit is reported."""
+        mock_popen.wait.return_value = 1
+        frames = [np.zeros((4, 6, 3), dtype=np.uint8)]
+
+        result = encoder.encode_frames(
+            frames, sample_audio_file, tmp_path / "out.mp4", fps=25
+        )
+
+        assert not result.success
+        assert "FFmpeg frame encoding failed" in result.error
+
+    def test_frame_size_mismatch(
+        self, encoder, mock_popen, sample_audio_file, tmp_path
+    ):
+        """Test that a differently sized frame aborts the encode."""
+        frames = [np.zeros((4, 6, 3), dtype=np.uint8), np.zeros((4, 8, 3), np.uint8)]
+        output_path = tmp_path / "out.mp4"
+
+        result = encoder.encode_frames(frames, sample_audio_file, output_path, fps=25)
+
+        assert not result.success
+        assert "Frame 1 has shape (4, 8, 3), expected (4, 6, 3)" in result.error
+        assert len(mock_popen.written) == 1
+        mock_popen.kill.assert_called_once()
+        assert not output_path.exists()
+
+    def test_no_frames(self, encoder, mock_popen, sample_audio_file, tmp_path):
+        """Test that an empty frame sequence fails without starting FFmpeg."""
+        result = encoder.encode_frames([], sample_audio_file, tmp_path / "out.mp4", fps=25)
+
+        assert not result.success
+        assert "No frames" in result.error
+
+
+class TestEncodeStreaming:
+    """Tests for FFmpegEncoder.encode_streaming."""
+
+    @pytest.fixture
+    def stream_popen(self, mocker):
+        """Mock FFmpeg process writing fragmented MP4 to stdout."""
+        proc = mocker.MagicMock()
+        proc.stdout.read.side_effect = [b"moof1", b"moof2", b""]
+        proc.wait.return_value = 0
+        proc.poll.return_value = 0
+        popen = mocker.patch("src.video.encoder.subprocess.Popen", return_value=proc)
+        return popen
+
+    def test_yields_stdout_chunks(self, encoder, stream_popen, tmp_path):
+        """Test that encoded bytes come from FFmpeg's stdout pipe."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+
+        chunks = list(encoder.encode_streaming(input_video))
+
+        assert chunks == [b"moof1", b"moof2"]
+        cmd = stream_popen.call_args.args[0]
+        assert cmd[-1] == "pipe:1"
+        assert "frag_keyframe+empty_moov" in cmd
+
+    def test_closing_early_kills_ffmpeg(self, encoder, stream_popen, tmp_path):
+        """Test that an abandoned stream stops the FFmpeg process."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+        proc = stream_popen.return_value
+        proc.poll.return_value = None
+
+        chunks = encoder.encode_streaming(input_video)
+        next(chunks)
+        chunks.close()
+
+        proc.kill.assert_called_once()
+
+    def test_early_failure_raises_before_streaming(
+        self, encoder, stream_popen, tmp_path
+    ):
+        """Test that FFmpeg failing before any output raises instead of streaming."""
+        input_video = tmp_path / "input.mp4"
+        input_video.write_bytes(b"video")
+        proc = stream_popen.return_value
+        proc.stdout.read.side_effect = [b""]
+        proc.wait.return_value = 1
+
+        with pytest.raises(RuntimeError, match="FFmpeg streaming encode failed"):
+            encoder.encode_streaming(input_video)
+
+        proc.stdout.close.assert_called_once()
+
+    def test_missing_input_raises_before_streaming(
+        self, encoder, stream_popen, tmp_path
+    ):
+        """Test that setup errors surface before any output is produced."""
+        with pytest.raises(FileNotFoundError):
+            encoder.encode_streaming(tmp_path / "missing.mp4")
+
+        stream_popen.assert_not_called()
+
+
+class TestGetVideoInfo:
+    """Tests for FFmpegEncoder.get_video_info caching."""
+
+    @pytest.fixture
+    def mock_ffprobe(self, mocker):
+        """Mock ffprobe run returning a 640x480 H.264 stream."""
+        result = mocker.MagicMock(returncode=0, stdout="640,480,25/1,h264,2.0\n")
+        return mocker.patch("src.video.encoder.subprocess.run", return_value=result)
+
+    def test_unchanged_file_probed_once(self, encoder, mock_ffprobe, tmp_path):
+        """Test that repeat queries for an unchanged file reuse the result."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"video")
+
+        first = encoder.get_video_info(video)
+        second = encoder.get_video_info(video)
+
+        assert first == second
+        assert first["resolution"] == (640, 480)
+        assert mock_ffprobe.call_count == 1
+
+    def test_modified_file_probed_again(self, encoder, mock_ffprobe, tmp_path):
+        """Test that rewriting the file invalidates its cached info."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"video")
+        encoder.get_video_info(video)
+
+        video.write_bytes(b"longer video")
+        encoder.get_video_info(video)
+
+        assert mock_ffprobe.call_count == 2
+
+    def test_missing_file(self, encoder, mock_ffprobe, tmp_path):
+        """Test that a missing file raises without running ffprobe."""
+        with pytest.raises(FileNotFoundError):
+            encoder.get_video_info(tmp_path / "missing.mp4")
+
+        mock_ffprobe.assert_not_called()
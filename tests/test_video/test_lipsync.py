@@ -0,0 +1,60 @@
+"""
+Tests for MuseTalk lip-sync engine.
+
+Tests preprocessing with audio loading mocked out.
+"""
+
+import pytest
+import torch
+
+from src.video.lipsync import MuseTalkLipSync
+from src.voice.interfaces import AudioBuffer
+
+
+@pytest.fixture
+def lipsync(mock_vram_manager):
+    """Lip-sync engine in fallback mode (MuseTalk not installed)."""
+    return MuseTalkLipSync(config={}, vram_manager=mock_vram_manager)
+
+
+class TestExtractAudioFeatures:
+    """Tests for MuseTalkLipSync._extract_audio_features."""
+
+    def test_transforms_reused(self, lipsync, mocker, tmp_path):
+        """Test that resampler and mel transforms are built once."""
+        mocker.patch(
+            "src.video.lipsync.torchaudio.load",
+            return_value=(torch.zeros(1, 22050), 22050),
+        )
+
+        first = lipsync._extract_audio_features(tmp_path / "a.wav")
+        mel_transform = lipsync._mel_transform
+        resampler = lipsync._resamplers[22050]
+        second = lipsync._extract_audio_features(tmp_path / "b.wav")
+
+        assert first.shape == second.shape
+        assert first.shape[-2] == 80
+        assert lipsync._mel_transform is mel_transform
+        assert lipsync._resamplers == {22050: resampler}
+
+    def test_no_resample_at_16k(self, lipsync, mocker, tmp_path):
+        """Test that 16kHz input skips resampling."""
+        mocker.patch(
+            "src.video.lipsync.torchaudio.load",
+            return_value=(torch.zeros(2, 16000), 16000),
+        )
+
+        features = lipsync._extract_audio_features(tmp_path / "a.wav")
+
+        assert features.shape[0] == 1  # Downmixed to mono
+        assert lipsync._resamplers == {}
+
+    def test_uses_audio_buffer(self, lipsync, mocker, tmp_path):
+        """Test that an in-memory buffer skips reading the file."""
+        mock_load = mocker.patch("src.video.lipsync.torchaudio.load")
+        buffer = AudioBuffer(waveform=torch.zeros(1, 16000), sample_rate=16000)
+
+        features = lipsync._extract_audio_features(tmp_path / "a.wav", buffer)
+
+        mock_load.assert_not_called()
+        assert features.shape[-2] == 80
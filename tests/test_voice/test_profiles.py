@@ -66,6 +66,31 @@ class TestVoiceProfileManager:
         assert metadata["name"] == name
         assert metadata["language"] == language
 
+    def test_create_profile_with_conditioning(self, tmp_path, sample_audio_file):
+        """Test that conditioning latents are stored alongside the embedding."""
+        manager = VoiceProfileManager(tmp_path)
+        conditioning = {
+            "gpt_cond_latent": torch.randn(1, 32, 1024),
+            "speaker_embedding": torch.randn(1, 512, 1),
+        }
+
+        profile = manager.create_profile(
+            name="Test Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+            conditioning=conditioning,
+        )
+
+        conditioning_path = profile.embedding_path.with_name("conditioning.pt")
+        assert conditioning_path.exists()
+
+        loaded = torch.load(conditioning_path)
+        assert torch.allclose(loaded["gpt_cond_latent"], conditioning["gpt_cond_latent"])
+        assert torch.allclose(
+            loaded["speaker_embedding"], conditioning["speaker_embedding"]
+        )
+
     def test_create_profile_duplicate_name(self, tmp_path, sample_audio_file):
         """Test that creating profile with duplicate name fails."""
         manager = VoiceProfileManager(tmp_path)
@@ -282,6 +307,105 @@ class TestVoiceProfileManager:
         with pytest.raises(IOError, match="Profile deletion failed"):
             manager.delete_profile(profile.profile_id)
 
+    def test_find_by_name(self, tmp_path, sample_audio_file):
+        """Test finding a profile by name through the index."""
+        manager = VoiceProfileManager(tmp_path)
+        created = manager.create_profile(
+            name="Indexed Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+
+        found = manager.find_by_name("Indexed Voice")
+
+        assert found is not None
+        assert found.profile_id == created.profile_id
+        assert manager.find_by_name("Unknown") is None
+
+        with open(manager.index_path) as f:
+            assert json.load(f) == {"Indexed Voice": created.profile_id}
+
+    def test_find_by_name_uses_index(self, tmp_path, sample_audio_file, mocker):
+        """Test that name lookup does not scan every profile."""
+        manager = VoiceProfileManager(tmp_path)
+        manager.create_profile(
+            name="Indexed Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+        spy = mocker.spy(manager, "list_profiles")
+
+        assert manager.find_by_name("Indexed Voice") is not None
+        spy.assert_not_called()
+
+    def test_find_by_name_shared_across_managers(self, tmp_path, sample_audio_file):
+        """Test that profiles created by another manager are found."""
+        first = VoiceProfileManager(tmp_path)
+        second = VoiceProfileManager(tmp_path)
+        assert second.find_by_name("Shared") is None
+
+        first.create_profile(
+            name="Shared",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+
+        assert second.find_by_name("Shared") is not None
+
+    def test_index_updated_on_delete(self, tmp_path, sample_audio_file):
+        """Test that deleting a profile removes it from the index."""
+        manager = VoiceProfileManager(tmp_path)
+        profile = manager.create_profile(
+            name="Temp Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+
+        manager.delete_profile(profile.profile_id)
+
+        assert manager.find_by_name("Temp Voice") is None
+        with open(manager.index_path) as f:
+            assert json.load(f) == {}
+
+    def test_index_rebuilt_when_stale(self, tmp_path, sample_audio_file):
+        """Test that an index entry for a removed directory is repaired."""
+        import shutil
+
+        manager = VoiceProfileManager(tmp_path)
+        profile = manager.create_profile(
+            name="Gone Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+        shutil.rmtree(manager.storage_dir / profile.profile_id)
+
+        assert manager.find_by_name("Gone Voice") is None
+        with open(manager.index_path) as f:
+            assert json.load(f) == {}
+
+    def test_index_built_for_existing_profiles(self, tmp_path, sample_audio_file):
+        """Test that storage without an index is indexed on first lookup."""
+        manager = VoiceProfileManager(tmp_path)
+        profile = manager.create_profile(
+            name="Legacy Voice",
+            language="en",
+            embedding=torch.randn(512),
+            reference_audio=sample_audio_file,
+        )
+        manager.index_path.unlink()
+
+        fresh = VoiceProfileManager(tmp_path)
+        found = fresh.find_by_name("Legacy Voice")
+
+        assert found is not None
+        assert found.profile_id == profile.profile_id
+        assert fresh.index_path.exists()
+
     def test_generate_id_format(self, tmp_path):
         """Test that generated IDs have correct format."""
         manager = VoiceProfileManager(tmp_path)
@@ -0,0 +1,135 @@
+"""
+Tests for TTS synthesizer.
+
+Tests single and batch synthesis with the TTS model mocked out.
+"""
+
+import pytest
+import torch
+
+from src.voice.synthesizer import CoquiTTSSynthesizer
+
+
+@pytest.fixture
+def synthesizer(sample_config, mock_vram_manager, mocker):
+    """Synthesizer with model loading and generation mocked."""
+    synth = CoquiTTSSynthesizer(
+        config=sample_config["voice"]["tts"],
+        vram_manager=mock_vram_manager,
+    )
+    mocker.patch.object(synth, "_load_model")
+    mocker.patch.object(synth, "_unload_model")
+    mocker.patch.object(synth, "_save_audio")
+    mocker.patch.object(
+        synth, "_generate_speech", return_value=torch.zeros(synth.default_sample_rate)
+    )
+    return synth
+
+
+class TestSynthesize:
+    """Tests for CoquiTTSSynthesizer.synthesize."""
+
+    def test_synthesize_success(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test successful single synthesis."""
+        output_path = tmp_path / "out.wav"
+
+        result = synthesizer.synthesize("Hello", mock_voice_profile, output_path)
+
+        assert result.success
+        assert result.audio_path == output_path
+        synthesizer._save_audio.assert_called_once()
+        assert result.duration_seconds == pytest.approx(1.0)
+
+    def test_returns_audio_buffer(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that the written samples are also returned in memory."""
+        result = synthesizer.synthesize("Hello", mock_voice_profile, tmp_path / "out.wav")
+
+        assert result.audio_buffer is not None
+        assert result.audio_buffer.waveform.dim() == 2
+        assert result.audio_buffer.sample_rate == synthesizer.default_sample_rate
+        assert result.audio_buffer.duration_seconds == pytest.approx(1.0)
+
+    def test_runs_in_inference_mode(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that generation runs without autograd tracking."""
+        modes = []
+        synthesizer._generate_speech.side_effect = lambda *args: (
+            modes.append(torch.is_inference_mode_enabled()) or torch.zeros(22050)
+        )
+
+        synthesizer.synthesize("Hello", mock_voice_profile, tmp_path / "out.wav")
+
+        assert modes == [True]
+
+    def test_synthesize_empty_text(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that empty text fails without loading the model."""
+        result = synthesizer.synthesize("  ", mock_voice_profile, tmp_path / "out.wav")
+
+        assert not result.success
+        assert "empty" in result.error
+        synthesizer._load_model.assert_not_called()
+
+    def test_uses_cached_conditioning(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that stored conditioning latents are passed to generation."""
+        gpt_cond_latent = torch.randn(1, 32, 1024)
+        speaker_embedding = torch.randn(1, 512, 1)
+        torch.save(
+            {"gpt_cond_latent": gpt_cond_latent, "speaker_embedding": speaker_embedding},
+            mock_voice_profile.embedding_path.with_name("conditioning.pt"),
+        )
+
+        result = synthesizer.synthesize("Hello", mock_voice_profile, tmp_path / "out.wav")
+
+        assert result.success
+        conditioning = synthesizer._generate_speech.call_args.args[1]
+        assert torch.equal(conditioning[0], gpt_cond_latent)
+        assert torch.equal(conditioning[1], speaker_embedding)
+
+    def test_falls_back_to_embedding(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that profiles without conditioning use the speaker embedding."""
+        result = synthesizer.synthesize("Hello", mock_voice_profile, tmp_path / "out.wav")
+
+        assert result.success
+        embedding = torch.load(mock_voice_profile.embedding_path)
+        conditioning = synthesizer._generate_speech.call_args.args[1]
+        assert torch.equal(conditioning[0], embedding)
+        assert torch.equal(conditioning[1], embedding)
+
+
+class TestSynthesizeBatch:
+    """Tests for CoquiTTSSynthesizer.synthesize_batch."""
+
+    def test_batch_loads_model_once(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that a batch loads and unloads the model once."""
+        items = [(f"Line {i}", tmp_path / f"line_{i}.wav") for i in range(3)]
+
+        results = synthesizer.synthesize_batch(items, mock_voice_profile)
+
+        assert [r.success for r in results] == [True, True, True]
+        assert [r.audio_path for r in results] == [path for _, path in items]
+        synthesizer._load_model.assert_called_once()
+        synthesizer._unload_model.assert_called_once()
+        assert synthesizer._generate_speech.call_count == 3
+
+    def test_batch_item_failure_isolated(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that one invalid item does not fail the rest."""
+        items = [
+            ("First", tmp_path / "a.wav"),
+            ("", tmp_path / "b.wav"),
+            ("Third", tmp_path / "c.wav"),
+        ]
+
+        results = synthesizer.synthesize_batch(items, mock_voice_profile)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "empty" in results[1].error
+
+    def test_batch_missing_embedding(self, synthesizer, mock_voice_profile, tmp_path):
+        """Test that a missing embedding fails every item."""
+        mock_voice_profile.embedding_path.unlink()
+        items = [("One", tmp_path / "a.wav"), ("Two", tmp_path / "b.wav")]
+
+        results = synthesizer.synthesize_batch(items, mock_voice_profile)
+
+        assert len(results) == 2
+        assert not any(r.success for r in results)
+        synthesizer._load_model.assert_not_called()